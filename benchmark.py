@@ -0,0 +1,322 @@
+import argparse
+import json
+import locale
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import threading
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+# Page-level benchmark: drives ui.py headlessly with AppTest against local_backend.py and records, for every menu
+# path, the wall time, backend calls and bytes of each rerun and the peak RSS of the UI process.
+#   python benchmark.py                      run every path and check it against benchmark_baseline.json
+#   python benchmark.py --update-baseline    run every path and store the results as the new baseline
+#   python benchmark.py --paths "Update/.*"  run only the paths matching a pattern
+# ui.py formats money with the process locale, so every run is pinned to --locale (en_US.UTF-8 by default).
+# The benchmark stops when that locale is not installed, as the C locale fails the currency charts
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# The backend runs in its own process so its tables do not count towards the UI's memory
+def serve_backend(scale, seed, port, ready, calls, nbytes):
+    from flask import request
+    from werkzeug.serving import make_server
+    import local_backend
+
+    app = local_backend.create_app(local_backend.generate(seed=seed, **scale))
+
+    @app.after_request
+    def count_traffic(response):
+        with calls.get_lock():
+            calls.value += 1
+        with nbytes.get_lock():
+            nbytes.value += (request.content_length or 0) + (response.calculate_content_length() or 0)
+        return response
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    port.value = server.server_port
+    ready.set()
+    server.serve_forever()
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # No /proc: fall back to the process-wide high-water mark (kilobytes on Linux)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+# Polls the resident set size while a path runs and keeps the highest value seen
+class RssSampler:
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self):
+        while not self.stopped.is_set():
+            self.peak = max(self.peak, current_rss())
+            self.stopped.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = current_rss()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def by_label(elements, label):
+    return next(element for element in elements if element.label == label)
+
+def logged_in(at, username, eid, position):
+    for key, value in dict(user=username, password=username, eid=eid, position=position, login=False, logout=False, first_time=False).items():
+        at.session_state[key] = value
+
+# Each step changes widgets before one rerun; a path is a login state plus its steps
+def choose(label, value):
+    def step(at):
+        by_label(at.selectbox, label).set_value(value)
+    return step
+
+def choose_first_id(at):
+    # The first ID picker below the entity selector
+    picker = next(select for select in at.selectbox if select.key and select.key.startswith("Enter"))
+    picker.set_value(picker.options[0].split(" — ")[0])
+
+def type_in_first_field(at):
+    fields = [field for field in at.text_input if field.key is None or not field.key.endswith(" search")]
+    if fields:
+        fields[0].input("1")
+        # The browser holds input to a form until it is submitted, so typing there costs no rerun
+        return bool(fields[0].proto.form_id)
+
+def search_first_picker(at):
+    search = next((field for field in at.text_input if field.key and field.key.endswith(" search")), None)
+    if search:
+        search.input("1")
+
+def idle(at):
+    pass
+
+# Fails the step unless the rerun before it rendered the page with the given subheader
+def on_page(subheader, step):
+    def checked(at):
+        if subheader not in [element.value for element in at.subheader]:
+            raise ValueError("expected the page with the subheader " + repr(subheader))
+        return step(at)
+    return checked
+
+def login(at):
+    by_label(at.text_input, "User Name").input("admin")
+    by_label(at.text_input, "Password").input("admin")
+    by_label(at.button, "Login").click()
+
+def compare_hotels(at):
+    at.toggle[0].set_value(True)
+
+def pick_hotels(at):
+    by_label(at.multiselect, "Hotel IDs").set_value(["1", "2", "3"])
+
+entities = ["Login", "Employee", "Chain", "Hotel", "Room Description", "Client", "Reserve", "Room", "Room Unavailable"]
+global_statistics = [
+    "Top 3 chains with the highest total revenue.",
+    "Total reservation percentage by payment method.",
+    "Top 3 hotel chains with the least rooms.",
+    "Top 5 hotels with the most client capacity.",
+    "Top 10% of the hotels that had the most reservations.",
+    "Top 3 month with the most reservation by chain.",
+]
+local_statistics = [
+    "Top 5 handicap rooms that were reserved the most.",
+    "Top 3 rooms that were the least time unavailable.",
+    "Top 5 clients under 30 years old that made the most reservation with a credit card.",
+    "Top 3 highest paid regular employees.",
+    "Top 5 clients that received the most discounts.",
+    "Total reservation percentage by room type.",
+    "Top 3 rooms that were reserved that had the least guest-to-capacity ratio.",
+]
+
+def benchmark_paths():
+    admin = ("admin", 1, "Administrator")
+    # A guest past the first run. The Menu selectbox changes its index after the first run, which gives it a new
+    # widget ID and drops a choice made on the first run, so a path that picks a page from it starts past it
+    returning_guest = dict(user=None, password=None, eid=None, login=False, logout=False, first_time=False, position=None)
+    paths = {
+        "Home": (None, {}, [("load", idle), ("idle", idle)]),
+        "Login": (None, {}, [("load", idle), ("menu", choose("Menu", "Login")), ("login", login)]),
+        "Create Employee Account": (None, returning_guest, [
+            ("load", idle), ("menu", choose("Menu", "Create Employee Account")), ("keystroke", on_page("Create Account Section", type_in_first_field))]),
+    }
+    for entity in entities:
+        paths["Create/" + entity] = (admin, {"crud_menu": "Create"}, [
+            ("load", idle), ("menu", choose("Menu", "Manage Entities")), ("entity", choose("Select Entity to Create", entity)), ("keystroke", type_in_first_field), ("search", search_first_picker), ("idle", idle)])
+        for action in ["Update", "Delete"]:
+            paths[action + "/" + entity] = (admin, {"crud_menu": action}, [
+                ("load", idle), ("menu", choose("Menu", "Manage Entities")), ("entity", choose("Select Entity to " + action, entity)), ("record", choose_first_id), ("keystroke", type_in_first_field), ("idle", idle)])
+    for statistic in global_statistics:
+        paths["Global Statistics/" + statistic] = (admin, {"statistics_menu": "Global Statistics"}, [
+            ("load", idle), ("statistic", choose("Global Statistics", statistic)), ("idle", idle)])
+    for statistic in local_statistics:
+        paths["Local Statistics/" + statistic] = (admin, {"statistics_menu": "Local Statistics"}, [
+            ("load", idle), ("statistic", choose("Local Statistics", statistic)), ("hotel", choose("Hotel IDs", "1")), ("idle", idle)])
+    paths["Local Statistics/Compare hotels"] = (admin, {"statistics_menu": "Local Statistics"}, [
+        ("load", idle), ("statistic", choose("Local Statistics", local_statistics[0])), ("compare", compare_hotels), ("hotels", pick_hotels), ("idle", idle)])
+    paths["Global Dashboard"] = (admin, {"statistics_menu": "Global Dashboard"}, [("load", idle), ("idle", idle)])
+    return paths
+
+def run_path(account, state, steps, calls, nbytes, timeout):
+    import streamlit as st
+
+    # Every path starts cold: no cached tables, statistics or charts from the paths before it
+    st.cache_resource.clear()
+    at = AppTest.from_file(os.path.join(here, "ui.py"), default_timeout=timeout)
+    if account:
+        logged_in(at, *account)
+    for key, value in state.items():
+        at.session_state[key] = value
+    reruns = []
+    with RssSampler() as sampler:
+        for name, step in steps:
+            error = None
+            deferred = False
+            try:
+                deferred = step(at)
+            except (StopIteration, IndexError, KeyError, ValueError) as exc:
+                error = "could not drive step: " + repr(exc)
+            if deferred:
+                reruns.append({"step": name, "wall_s": 0.0, "calls": 0, "bytes": 0, "error": error})
+                continue
+            start_calls, start_bytes = calls.value, nbytes.value
+            start = time.perf_counter()
+            at.run()
+            wall = time.perf_counter() - start
+            if at.exception:
+                error = at.exception[0].message
+            reruns.append({"step": name, "wall_s": round(wall, 4), "calls": calls.value - start_calls, "bytes": nbytes.value - start_bytes, "error": error})
+    return {
+        "reruns": reruns,
+        "wall_s": round(sum(rerun["wall_s"] for rerun in reruns), 4),
+        "calls": sum(rerun["calls"] for rerun in reruns),
+        "bytes": sum(rerun["bytes"] for rerun in reruns),
+        "peak_rss_mb": round(sampler.peak / 2 ** 20, 1),
+        "errors": [rerun["step"] + ": " + rerun["error"] for rerun in reruns if rerun["error"]],
+    }
+
+# Call budgets are exact, bytes, time and memory may grow by their tolerance before a path counts as regressed
+def compare(results, baseline, tolerances):
+    regressions = []
+    if results["scale"] != baseline["scale"] or results["seed"] != baseline["seed"]:
+        return ["baseline was recorded at a different scale or seed, rerun with the same options or update it"]
+    for path, result in results["paths"].items():
+        before = baseline["paths"].get(path)
+        if before is None:
+            continue
+        for rerun, previous in zip(result["reruns"], before["reruns"]):
+            if rerun["calls"] > previous["calls"]:
+                regressions.append("%s [%s]: %d backend calls, budget is %d" % (path, rerun["step"], rerun["calls"], previous["calls"]))
+            if rerun["error"] and not previous["error"]:
+                regressions.append("%s [%s]: %s" % (path, rerun["step"], rerun["error"]))
+        if result["bytes"] > before["bytes"] * (1 + tolerances["bytes"]):
+            regressions.append("%s: %d bytes transferred, baseline %d" % (path, result["bytes"], before["bytes"]))
+        if result["wall_s"] > before["wall_s"] * (1 + tolerances["time"]) + tolerances["time_slack"]:
+            regressions.append("%s: %.2fs, baseline %.2fs" % (path, result["wall_s"], before["wall_s"]))
+        if result["peak_rss_mb"] > before["peak_rss_mb"] * (1 + tolerances["memory"]):
+            regressions.append("%s: peak RSS %.1f MB, baseline %.1f MB" % (path, result["peak_rss_mb"], before["peak_rss_mb"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-level benchmark of the Hotel Analytical System UI")
+    parser.add_argument("--paths", default=".*", help="regular expression selecting the paths to run")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=os.path.join(here, "benchmark_baseline.json"))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chains", type=int, default=10)
+    parser.add_argument("--hotels", type=int, default=50)
+    parser.add_argument("--rooms", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--reservations", type=int, default=20000)
+    parser.add_argument("--time-tolerance", type=float, default=1.0)
+    parser.add_argument("--time-slack", type=float, default=0.5, help="seconds added to every path's time budget")
+    parser.add_argument("--bytes-tolerance", type=float, default=0.1)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--locale", default="en_US.UTF-8", help="locale with currency data the UI runs under")
+    args = parser.parse_args()
+
+    try:
+        locale.setlocale(locale.LC_ALL, args.locale)
+    except locale.Error:
+        sys.exit("The locale %s is not installed, install it or choose another with --locale" % args.locale)
+    if not locale.localeconv()["currency_symbol"]:
+        sys.exit("The locale %s has no currency data, choose another with --locale" % args.locale)
+    # ui.py calls setlocale(LC_ALL, "") and so takes the locale from the environment
+    os.environ["LC_ALL"] = os.environ["LANG"] = args.locale
+
+    scale = {"chains": args.chains, "hotels": args.hotels, "rooms": args.rooms, "clients": args.clients, "reservations": args.reservations}
+    context = multiprocessing.get_context("spawn")
+    port, ready = context.Value("i", 0), context.Event()
+    calls, nbytes = context.Value("q", 0), context.Value("q", 0)
+    backend = context.Process(target=serve_backend, args=(scale, args.seed, port, ready, calls, nbytes), daemon=True)
+    backend.start()
+    if not ready.wait(300):
+        sys.exit("The local backend did not start")
+    os.environ["DATAOPS_URL"] = "http://127.0.0.1:%d" % port.value
+    os.chdir(here)
+
+    results = {"scale": scale, "seed": args.seed, "paths": {}}
+    for path, (account, state, steps) in benchmark_paths().items():
+        if not re.search(args.paths, path):
+            continue
+        result = run_path(account, state, steps, calls, nbytes, args.timeout)
+        results["paths"][path] = result
+        print("%-100s %7.2fs %4d calls %10d bytes %7.1f MB%s" % (path[:100], result["wall_s"], result["calls"], result["bytes"], result["peak_rss_mb"], "  ERROR" if result["errors"] else ""))
+    results["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    backend.terminate()
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    errors = [path + " " + error for path, result in results["paths"].items() for error in result["errors"]]
+    for error in errors:
+        print("error: " + error)
+
+    if args.update_baseline:
+        baseline = {"scale": scale, "seed": args.seed, "paths": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as stored:
+                baseline = json.load(stored)
+            if baseline["scale"] != scale or baseline["seed"] != args.seed:
+                baseline = {"scale": scale, "seed": args.seed, "paths": {}}
+        baseline["paths"].update(results["paths"])
+        with open(args.baseline, "w") as stored:
+            json.dump(baseline, stored, indent=2)
+        print("Baseline updated: " + args.baseline)
+        return
+
+    if not os.path.exists(args.baseline):
+        print("No baseline at " + args.baseline + ", run with --update-baseline to store one")
+        return
+    with open(args.baseline) as stored:
+        baseline = json.load(stored)
+    tolerances = {"bytes": args.bytes_tolerance, "time": args.time_tolerance, "time_slack": args.time_slack, "memory": args.memory_tolerance}
+    regressions = compare(results, baseline, tolerances)
+    for regression in regressions:
+        print("regression: " + regression)
+    if regressions:
+        sys.exit(1)
+    print("No regressions against " + args.baseline)
+
+
+if __name__ == "__main__":
+    main()
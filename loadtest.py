@@ -0,0 +1,310 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+
+# Capacity test: starts `streamlit run ui.py` the way the Procfile does, points it at local_backend.py and drives
+# N concurrent sessions over Streamlit's websocket protocol, like N staff members in their browsers. Every session
+# logs in, then keeps opening statistics and creating reservations. For every N it reports rerun latency
+# percentiles, throughput and the memory the Streamlit process needs per session.
+#   python loadtest.py --sessions 1,5,10,20 --duration 60
+
+here = os.path.dirname(os.path.abspath(__file__))
+finished = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_WITH_COMPILE_ERROR, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def process_rss(pid):
+    with open("/proc/%d/statm" % pid) as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+async def wait_until_up(address, timeout=120):
+    client = AsyncHTTPClient()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await client.fetch(address, request_timeout=2)
+            return
+        except Exception:
+            await asyncio.sleep(0.5)
+    raise RuntimeError(address + " did not come up")
+
+
+# One browser tab: keeps the widgets of the last script run and sends the same widget states a browser would
+class Session:
+    def __init__(self, server, rng):
+        self.server = server
+        self.rng = rng
+        self.widgets = {}
+        self.states = {}
+        self.fragments = {}
+        self.touched = set()
+        self.latencies = []
+        self.errors = []
+        self.step = None
+
+    async def connect(self):
+        self.socket = await websocket_connect("ws://%s/_stcore/stream" % self.server, subprotocols=["streamlit"], max_message_size=256 * 2 ** 20)
+
+    def close(self):
+        self.socket.close()
+
+    async def receive(self):
+        raw = await self.socket.read_message()
+        if raw is None:
+            raise ConnectionError("The server closed the session")
+        message = ForwardMsg.FromString(raw)
+        if message.WhichOneof("type") == "ref_hash":
+            # Messages the server already sent once are only referenced, fetch them like the browser does
+            response = await AsyncHTTPClient().fetch("http://%s/_stcore/message?hash=%s" % (self.server, message.ref_hash))
+            message = ForwardMsg.FromString(response.body)
+        return message
+
+    def collect(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        element = getattr(delta.new_element, kind or "empty", None)
+        if kind == "exception":
+            self.errors.append(self.step + ": " + element.type + ": " + element.message)
+        if element is None or not getattr(element, "id", ""):
+            return
+        if kind == "component_instance":
+            # Option menus are found by their key, the last part of the widget id
+            self.widgets["menu:" + element.id.rsplit("-", 1)[-1]] = element
+        else:
+            self.widgets[element.label] = element
+        self.fragments[element.id] = delta.fragment_id
+
+    async def rerun(self, step, triggers=()):
+        self.step = step
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.widget_states.widgets.extend(list(self.states.values()) + list(triggers))
+        # Like the browser, only rerun the fragment when every widget touched since the last run belongs to it
+        if len(self.touched) == 1:
+            message.rerun_script.fragment_id = self.touched.pop()
+        self.touched = set()
+        start = time.perf_counter()
+        await self.socket.write_message(message.SerializeToString(), binary=True)
+        while True:
+            reply = await self.receive()
+            kind = reply.WhichOneof("type")
+            if kind == "new_session" and not reply.new_session.fragment_ids_this_run:
+                self.widgets = {}
+            elif kind == "delta":
+                self.collect(reply.delta)
+            elif kind == "session_event" and reply.session_event.WhichOneof("type") == "script_compilation_exception":
+                self.errors.append(step + ": script compilation error")
+            elif kind == "script_finished" and reply.script_finished in finished:
+                break
+        self.latencies.append((step, time.perf_counter() - start))
+        # Widgets that are gone no longer report a value
+        live = {widget.id for widget in self.widgets.values()}
+        self.states = {widget_id: state for widget_id, state in self.states.items() if widget_id in live}
+
+    def widget(self, label):
+        if label not in self.widgets:
+            raise LookupError("no widget " + repr(label) + " on the page")
+        widget = self.widgets[label]
+        self.touched.add(self.fragments.get(widget.id, ""))
+        return widget
+
+    def select(self, label, option=None):
+        widget = self.widget(label)
+        state = WidgetState(id=widget.id)
+        state.int_value = list(widget.options).index(option) if option is not None else int(self.rng.integers(len(widget.options)))
+        self.states[widget.id] = state
+
+    def type(self, label, text):
+        widget = self.widget(label)
+        self.states[widget.id] = WidgetState(id=widget.id, string_value=text)
+
+    def menu(self, key, option):
+        widget = self.widget("menu:" + key)
+        self.states[widget.id] = WidgetState(id=widget.id, json_value=json.dumps(option))
+
+    def click(self, label):
+        return [WidgetState(id=self.widget(label).id, trigger_value=True)]
+
+    async def think(self, seconds):
+        await asyncio.sleep(self.rng.uniform(0, 2 * seconds))
+
+
+# The scripts every simulated staff member runs
+async def log_in(session, think):
+    await session.rerun("open app")
+    session.select("Menu", "Login")
+    await session.rerun("login page")
+    await session.think(think)
+    session.type("User Name", "admin")
+    session.type("Password", "admin")
+    await session.rerun("log in", session.click("Login"))
+
+async def open_statistics(session, think):
+    session.select("Menu", "Statistics")
+    await session.rerun("statistics page")
+    session.menu("statistics_menu", "Global Statistics")
+    await session.rerun("global statistics page")
+    await session.think(think)
+    session.select("Global Statistics")
+    await session.rerun("global statistic")
+    await session.think(think)
+    session.menu("statistics_menu", "Local Statistics")
+    await session.rerun("local statistics page")
+    session.select("Local Statistics")
+    await session.rerun("local statistic")
+    await session.think(think)
+    session.select("Hotel IDs")
+    await session.rerun("local statistic for a hotel")
+
+async def create_reservation(session, think):
+    session.select("Menu", "Manage Entities")
+    await session.rerun("manage entities page")
+    session.menu("crud_menu", "Create")
+    session.select("Select Entity to Create", "Reserve")
+    await session.rerun("create reserve page")
+    await session.think(think)
+    session.select("Enter Unavailable Room ID")
+    await session.rerun("pick room")
+    session.select("Enter Client ID")
+    await session.rerun("pick client")
+    # Payment and guests are in a form, the browser only sends them with Create
+    session.select("Enter Payment Method")
+    session.type("Enter Reservation Guests", "1")
+    await session.think(think)
+    await session.rerun("create reservation", session.click("Create"))
+
+async def staff_member(server, seed, deadline, think):
+    session = Session(server, np.random.default_rng(seed))
+    try:
+        await session.connect()
+        await log_in(session, think)
+        while time.monotonic() < deadline:
+            await open_statistics(session, think)
+            await create_reservation(session, think)
+    except (LookupError, ConnectionError) as error:
+        session.errors.append(repr(error))
+    finally:
+        if hasattr(session, "socket"):
+            session.close()
+    return session
+
+
+async def run_level(sessions, args, backend_url):
+    port = free_port()
+    server = "127.0.0.1:%d" % port
+    environment = dict(os.environ, DATAOPS_URL=backend_url)
+    streamlit = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "ui.py", "--server.port", str(port), "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=here, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await wait_until_up("http://%s/_stcore/health" % server)
+        # The first run imports the app's libraries, which is not a per-session cost
+        warm_up = Session(server, np.random.default_rng(args.seed))
+        await warm_up.connect()
+        await warm_up.rerun("warm up")
+        warm_up.close()
+        await asyncio.sleep(1)
+        idle_rss = process_rss(streamlit.pid)
+        peak_rss = idle_rss
+
+        async def sample_rss():
+            nonlocal peak_rss
+            while True:
+                peak_rss = max(peak_rss, process_rss(streamlit.pid))
+                await asyncio.sleep(0.1)
+
+        sampler = asyncio.ensure_future(sample_rss())
+        start = time.monotonic()
+        deadline = start + args.duration
+        # Staff members arrive over the ramp-up period rather than all in the same instant
+        async def arrive(i):
+            await asyncio.sleep(args.ramp_up * i / sessions)
+            return await staff_member(server, args.seed * 1000 + i, deadline, args.think_time)
+        done = await asyncio.gather(*(arrive(i) for i in range(sessions)))
+        elapsed = time.monotonic() - start
+        loaded_rss = process_rss(streamlit.pid)
+        sampler.cancel()
+    finally:
+        streamlit.terminate()
+        streamlit.wait()
+
+    latencies = np.array([latency for session in done for _, latency in session.latencies])
+    by_step = {}
+    for session in done:
+        for step, latency in session.latencies:
+            by_step.setdefault(step, []).append(latency)
+    percentiles = np.percentile(latencies, [50, 90, 95, 99]) if len(latencies) else [float("nan")] * 4
+    return {
+        "sessions": sessions,
+        "reruns": int(len(latencies)),
+        "throughput_per_s": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentiles[0] * 1000, 1),
+        "p90_ms": round(percentiles[1] * 1000, 1),
+        "p95_ms": round(percentiles[2] * 1000, 1),
+        "p99_ms": round(percentiles[3] * 1000, 1),
+        "max_ms": round(float(latencies.max()) * 1000, 1) if len(latencies) else None,
+        "idle_rss_mb": round(idle_rss / 2 ** 20, 1),
+        "peak_rss_mb": round(peak_rss / 2 ** 20, 1),
+        "rss_per_session_mb": round((loaded_rss - idle_rss) / 2 ** 20 / sessions, 2),
+        "steps": {step: {"reruns": len(times), "p50_ms": round(np.percentile(times, 50) * 1000, 1), "p95_ms": round(np.percentile(times, 95) * 1000, 1)}
+                  for step, times in by_step.items()},
+        "errors": [error for session in done for error in session.errors],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test of the Hotel Analytical System UI")
+    parser.add_argument("--sessions", default="1,2,5,10", help="comma separated numbers of concurrent sessions to try")
+    parser.add_argument("--duration", type=float, default=60, help="seconds every level runs for")
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds over which the sessions of a level connect")
+    parser.add_argument("--think-time", type=float, default=1.0, help="mean pause between a session's actions in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hotels", type=int, default=100)
+    parser.add_argument("--reservations", type=int, default=100000)
+    parser.add_argument("--output", default="loadtest_results.json")
+    args = parser.parse_args()
+
+    backend_port = free_port()
+    backend = subprocess.Popen(
+        [sys.executable, "local_backend.py", "--port", str(backend_port), "--seed", str(args.seed), "--hotels", str(args.hotels), "--reservations", str(args.reservations)],
+        cwd=here, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    backend_url = "http://127.0.0.1:%d" % backend_port
+    results = []
+    try:
+        await wait_until_up(backend_url + "/dataops/chains")
+        print("%8s %8s %10s %9s %9s %9s %9s %10s %10s %12s %7s" % ("sessions", "reruns", "reruns/s", "p50 ms", "p90 ms", "p95 ms", "p99 ms", "idle MB", "peak MB", "MB/session", "errors"))
+        for sessions in [int(level) for level in args.sessions.split(",")]:
+            level = await run_level(sessions, args, backend_url)
+            results.append(level)
+            print("%8d %8d %10.2f %9.1f %9.1f %9.1f %9.1f %10.1f %10.1f %12.2f %7d" % (
+                sessions, level["reruns"], level["throughput_per_s"], level["p50_ms"], level["p90_ms"], level["p95_ms"], level["p99_ms"],
+                level["idle_rss_mb"], level["peak_rss_mb"], level["rss_per_session_mb"], len(level["errors"])))
+    finally:
+        backend.terminate()
+        backend.wait()
+    with open(args.output, "w") as output:
+        json.dump({"hotels": args.hotels, "reservations": args.reservations, "duration_s": args.duration, "think_time_s": args.think_time, "levels": results}, output, indent=2)
+    for level in results:
+        for error in sorted(set(level["errors"])):
+            print("error with %d sessions: %s" % (level["sessions"], error))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,478 @@
+import argparse
+import json
+import threading
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from flask import Flask, request
+
+from pricing import reservation_cost, season_markup
+
+
+# Local stand-in for the DataOps backend: every /dataops route the UI calls, served from in-memory tables
+# filled by a seeded generator. Run it with
+#   python local_backend.py --hotels 200 --reservations 1000000
+# and point the UI at it with DATAOPS_URL=http://127.0.0.1:5000
+
+date_format = "%a, %d %b %Y %H:%M:%S GMT"
+
+# Whole tables are also served as Arrow IPC streams to clients that ask for them
+arrow_stream_type = "application/vnd.apache.arrow.stream"
+arrow_batch_rows = 65536
+
+# Key column and column types of every table, in the order the backend returns them
+schema = {
+    "chains": ("chid", {"cname": str, "springmkup": float, "summermkup": float, "fallmkup": float, "wintermkup": float}),
+    "hotel": ("hid", {"chid": int, "hname": str, "hcity": str}),
+    "employee": ("eid", {"hid": int, "fname": str, "lname": str, "age": int, "position": str, "salary": float}),
+    "login": ("lid", {"eid": int, "username": str, "password": str}),
+    "roomdescription": ("rdid", {"rname": str, "rtype": str, "capacity": int, "ishandicap": bool}),
+    "room": ("rid", {"hid": int, "rdid": int, "rprice": float}),
+    "roomunavailable": ("ruid", {"rid": int, "startdate": "date", "enddate": "date"}),
+    "client": ("clid", {"fname": str, "lname": str, "age": int, "memberyear": int}),
+    "reserve": ("reid", {"ruid": int, "clid": int, "total_cost": float, "payment": str, "guests": int}),
+}
+
+# The same room names, types and capacities the UI offers when creating a room description
+room_constraints = {
+    "Standard": {"capacity": [1], "types": ["Basic", "Premium"]},
+    "Standard Queen": {"capacity": [1, 2], "types": ["Basic", "Premium", "Deluxe"]},
+    "Standard King": {"capacity": [2], "types": ["Basic", "Premium", "Deluxe"]},
+    "Double Queen": {"capacity": [4], "types": ["Basic", "Premium", "Deluxe"]},
+    "Double King": {"capacity": [4, 6], "types": ["Basic", "Premium", "Deluxe", "Suite"]},
+    "Triple King": {"capacity": [6], "types": ["Deluxe", "Suite"]},
+    "Executive Family": {"capacity": [4, 6, 8], "types": ["Deluxe", "Suite"]},
+    "Presidential": {"capacity": [4, 6, 8], "types": ["Suite"]},
+}
+
+payment_methods = ["cash", "check", "credit card", "debit card", "pear pay"]
+positions = ["Regular", "Supervisor", "Administrator"]
+cities = ["San Juan", "Ponce", "Mayaguez", "Arecibo", "Caguas", "Bayamon", "Miami", "Orlando", "New York", "Boston", "Chicago", "Madrid"]
+first_names = ["Ana", "Luis", "Maria", "Jose", "Carmen", "Jorge", "Sofia", "Diego", "Laura", "Pedro", "Elena", "Carlos", "Isabel", "Miguel", "Lucia", "Juan"]
+last_names = ["Rivera", "Santiago", "Torres", "Lopez", "Cruz", "Ortiz", "Vega", "Colon", "Reyes", "Morales", "Perez", "Diaz", "Nieves", "Castillo"]
+
+
+# Synthetic tables at any scale. The first three employees are an Administrator, a Supervisor and a Regular
+# employee of hotel 1 with the logins admin/admin, supervisor/supervisor and regular/regular.
+def generate(chains=10, hotels=100, rooms=5000, clients=20000, reservations=100000, employees=None, seed=0):
+    rng = np.random.default_rng(seed)
+    employees = employees or hotels * 5
+    tables = {}
+
+    markups = np.round(rng.uniform(1.0, 1.5, size=(chains, 4)), 2)
+    tables["chains"] = pd.DataFrame({
+        "chid": np.arange(1, chains + 1),
+        "cname": ["Chain " + str(i) for i in range(1, chains + 1)],
+        "springmkup": markups[:, 0], "summermkup": markups[:, 1], "fallmkup": markups[:, 2], "wintermkup": markups[:, 3],
+    })
+
+    tables["hotel"] = pd.DataFrame({
+        "hid": np.arange(1, hotels + 1),
+        "chid": rng.integers(1, chains + 1, hotels),
+        "hname": ["Hotel " + str(i) for i in range(1, hotels + 1)],
+        "hcity": rng.choice(cities, hotels),
+    })
+
+    position = rng.choice(positions, employees, p=[0.8, 0.1, 0.1])
+    position[:3] = positions[::-1]
+    employee_hid = rng.integers(1, hotels + 1, employees)
+    employee_hid[:3] = 1
+    tables["employee"] = pd.DataFrame({
+        "eid": np.arange(1, employees + 1),
+        "hid": employee_hid,
+        "fname": rng.choice(first_names, employees),
+        "lname": rng.choice(last_names, employees),
+        "age": rng.integers(18, 70, employees),
+        "position": position,
+        "salary": np.round(np.select([position == "Administrator", position == "Supervisor"], [90000.0, 60000.0], 30000.0) * rng.uniform(0.8, 1.6, employees), 2),
+    })
+
+    usernames = np.array(["user" + str(i) for i in range(1, employees + 1)], dtype=object)
+    usernames[:3] = ["admin", "supervisor", "regular"]
+    tables["login"] = pd.DataFrame({
+        "lid": np.arange(1, employees + 1),
+        "eid": np.arange(1, employees + 1),
+        "username": usernames,
+        "password": usernames,
+    })
+
+    descriptions = [(rname, rtype, capacity, ishandicap)
+                    for rname, constraints in room_constraints.items()
+                    for rtype in constraints["types"]
+                    for capacity in constraints["capacity"]
+                    for ishandicap in (False, True)]
+    tables["roomdescription"] = pd.DataFrame(descriptions, columns=["rname", "rtype", "capacity", "ishandicap"])
+    tables["roomdescription"].insert(0, "rdid", np.arange(1, len(descriptions) + 1))
+
+    room_rdid = rng.integers(1, len(descriptions) + 1, rooms)
+    capacity = tables["roomdescription"]["capacity"].to_numpy()[room_rdid - 1]
+    tables["room"] = pd.DataFrame({
+        "rid": np.arange(1, rooms + 1),
+        "hid": rng.integers(1, hotels + 1, rooms),
+        "rdid": room_rdid,
+        "rprice": np.round(rng.uniform(40, 120, rooms) * np.sqrt(capacity), 2),
+    })
+
+    tables["client"] = pd.DataFrame({
+        "clid": np.arange(1, clients + 1),
+        "fname": rng.choice(first_names, clients),
+        "lname": rng.choice(last_names, clients),
+        "age": rng.integers(18, 90, clients),
+        "memberyear": rng.integers(0, 21, clients),
+    })
+
+    # Every reservation books its own unavailability period of a room
+    rid = rng.integers(1, rooms + 1, reservations)
+    startdate = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 5 * 365, reservations), unit="D")
+    nights = rng.integers(1, 15, reservations)
+    tables["roomunavailable"] = pd.DataFrame({
+        "ruid": np.arange(1, reservations + 1),
+        "rid": rid,
+        "startdate": startdate,
+        "enddate": startdate + pd.to_timedelta(nights, unit="D"),
+    })
+
+    clid = rng.integers(1, clients + 1, reservations)
+    hotel_chain = tables["hotel"]["chid"].to_numpy()[tables["room"]["hid"].to_numpy()[rid - 1] - 1]
+    markup = season_markup(startdate.month, *markups[hotel_chain - 1][:, [3, 0, 1, 2]].T)
+    tables["reserve"] = pd.DataFrame({
+        "reid": np.arange(1, reservations + 1),
+        "ruid": np.arange(1, reservations + 1),
+        "clid": clid,
+        "total_cost": reservation_cost(tables["room"]["rprice"].to_numpy()[rid - 1], nights, markup, tables["client"]["memberyear"].to_numpy()[clid - 1]),
+        "payment": rng.choice(payment_methods, reservations),
+        "guests": rng.integers(1, capacity[rid - 1] + 1),
+    })
+
+    return {name: tables[name].set_index(key) for name, (key, _) in schema.items()}
+
+
+def coerce(table, payload):
+    row = {}
+    for column, kind in schema[table][1].items():
+        value = payload[column]
+        if kind == "date":
+            row[column] = pd.Timestamp(value)
+        elif kind is bool:
+            row[column] = value if isinstance(value, bool) else str(value).lower() == "true"
+        else:
+            row[column] = kind(value)
+    return row
+
+def frame_json(frame):
+    frame = frame.reset_index()
+    for column in frame.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[column]):
+            # Format each distinct date once, there are far fewer of them than rows
+            codes, dates = pd.factorize(frame[column])
+            frame[column] = np.asarray(dates.strftime(date_format), dtype=object)[codes]
+    return frame.to_json(orient="records")
+
+# The same rows as frame_json with dates as date32, in record batches of arrow_batch_rows
+def frame_arrow(frame):
+    table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False).replace_schema_metadata()
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=arrow_batch_rows)
+    return sink.getvalue()
+
+def record_json(frame, key):
+    return frame_json(frame.loc[[key]])[1:-1]
+
+
+# Reservations joined with their stay, room, description, hotel, chain and client, as the statistics need them
+def reservation_facts(tables):
+    facts = tables["reserve"].join(tables["roomunavailable"], on="ruid")
+    facts = facts.join(tables["room"], on="rid").join(tables["roomdescription"], on="rdid")
+    facts = facts.join(tables["hotel"][["chid"]], on="hid").join(tables["chains"], on="chid")
+    facts = facts.join(tables["client"][["fname", "lname", "age", "memberyear"]].rename(columns={"age": "client_age"}), on="clid")
+    facts["nights"] = (facts["enddate"] - facts["startdate"]).dt.days
+    markup = season_markup(facts["startdate"].dt.month, facts["wintermkup"], facts["springmkup"], facts["summermkup"], facts["fallmkup"])
+    facts["full_cost"] = reservation_cost(facts["rprice"], facts["nights"], markup, 0)
+    return facts
+
+def answer(frame, columns):
+    return frame.reset_index()[list(columns)].rename(columns=columns)
+
+# Global statistics
+def most_revenue(tables, facts):
+    revenue = facts.groupby("chid")["total_cost"].sum().round(2).nlargest(3).rename("Revenue").to_frame()
+    return answer(revenue.join(tables["chains"]["cname"]), {"cname": "Chain", "Revenue": "Revenue"})
+
+def payment_method(tables, facts):
+    share = (facts["payment"].value_counts(normalize=True) * 100).round(2)
+    return pd.DataFrame({"Payment Method": share.index, "Reservation Percentage": share.to_numpy()})
+
+def least_rooms(tables, facts):
+    rooms = tables["room"].join(tables["hotel"]["chid"], on="hid").groupby("chid").size()
+    rooms = rooms.reindex(tables["chains"].index, fill_value=0).nsmallest(3).rename("Rooms").to_frame()
+    return answer(rooms.join(tables["chains"]["cname"]), {"cname": "Chain", "Rooms": "Rooms Available"})
+
+def most_capacity(tables, facts):
+    capacity = tables["room"].join(tables["roomdescription"]["capacity"], on="rdid").groupby("hid")["capacity"].sum().nlargest(5).to_frame()
+    return answer(capacity.join(tables["hotel"]["hname"]), {"hname": "Hotel", "capacity": "Capacity"})
+
+def most_reservation(tables, facts):
+    top = max(1, int(np.ceil(len(tables["hotel"]) * 0.1)))
+    reservations = facts.groupby("hid").size().nlargest(top).rename("Reservations").to_frame()
+    return answer(reservations.join(tables["hotel"]["hname"]), {"hname": "Hotel", "Reservations": "Reservations"})
+
+def profit_month(tables, facts):
+    months = facts.groupby(["chid", facts["startdate"].dt.month_name().rename("Month")]).size().rename("Reservations").reset_index()
+    months = months.sort_values(["chid", "Reservations"], ascending=[True, False]).groupby("chid").head(3)
+    return months.rename(columns={"chid": "Chain"})[["Chain", "Month", "Reservations"]]
+
+# Local statistics, over the reservations of one hotel
+def handicap_room(tables, facts, hid):
+    reservations = facts[facts["ishandicap"]].groupby("rid").size().nlargest(5).rename("Reservations").to_frame()
+    return answer(reservations, {"rid": "Room ID", "Reservations": "Reservations"})
+
+def least_reserve(tables, facts, hid):
+    rooms = tables["room"].index[tables["room"]["hid"] == hid]
+    stays = tables["roomunavailable"][tables["roomunavailable"]["rid"].isin(rooms)]
+    days = (stays["enddate"] - stays["startdate"]).dt.days.groupby(stays["rid"]).sum()
+    days = days.reindex(rooms, fill_value=0).nsmallest(3).rename("Days").to_frame()
+    return answer(days.rename_axis("rid"), {"rid": "Room ID", "Days": "Days Unavailable"})
+
+def most_credit_card(tables, facts, hid):
+    paid = facts[(facts["payment"] == "credit card") & (facts["client_age"] < 30)]
+    counts = paid.groupby("clid").size().nlargest(5).rename("Reservations").to_frame().join(tables["client"][["fname", "lname"]])
+    counts["Full Name"] = counts["fname"] + " " + counts["lname"]
+    return answer(counts, {"Full Name": "Full Name", "Reservations": "Credit Card Reservations"})
+
+def highest_paid(tables, facts, hid):
+    employees = tables["employee"]
+    regular = employees[(employees["hid"] == hid) & (employees["position"] == "Regular")].nlargest(3, "salary").copy()
+    regular["Employee Name"] = regular["fname"] + " " + regular["lname"]
+    return answer(regular, {"Employee Name": "Employee Name", "salary": "Salary"})
+
+def most_discount(tables, facts, hid):
+    discounts = (facts["full_cost"] - facts["total_cost"]).groupby(facts["clid"]).sum().round(2).nlargest(5).rename("Discounts").to_frame()
+    return answer(discounts, {"clid": "Client ID", "Discounts": "Discounts"})
+
+def room_type(tables, facts, hid):
+    counts = facts.groupby("rtype").size()
+    return pd.DataFrame({"Room Type": counts.index, "Total Reservations": counts.to_numpy()})
+
+def least_guests(tables, facts, hid):
+    ratio = (facts["guests"] / facts["capacity"]).groupby(facts["rid"]).mean().round(2).nsmallest(3).rename("Ratio").to_frame()
+    return answer(ratio, {"rid": "Room ID", "Ratio": "Guest to Capacity Ratio"})
+
+global_statistics = {
+    "most/revenue": most_revenue,
+    "paymentmethod": payment_method,
+    "least/rooms": least_rooms,
+    "most/capacity": most_capacity,
+    "most/reservation": most_reservation,
+    "most/profitmonth": profit_month,
+}
+
+# Local statistics get the hotel's reservations and the hotel itself
+local_statistics = {
+    "handicaproom": handicap_room,
+    "leastreserve": least_reserve,
+    "mostcreditcard": most_credit_card,
+    "highestpaid": highest_paid,
+    "mostdiscount": most_discount,
+    "roomtype": room_type,
+    "leastguests": least_guests,
+}
+
+# The same refusals the backend gives when an employee may not see a statistic
+def statistic_refusal(tables, eid, hid=None):
+    if eid not in tables["employee"].index:
+        return "Employee Not Found"
+    employee = tables["employee"].loc[eid]
+    if hid is None:
+        return None if employee["position"] == "Administrator" else "Employee is not an Administrator"
+    if employee["position"] == "Supervisor" and tables["hotel"].at[employee["hid"], "chid"] != tables["hotel"].at[hid, "chid"]:
+        return "The hotel's chain is not accessible to this employee"
+    if employee["position"] == "Regular" and employee["hid"] != hid:
+        return "User is not a regular employee of this hotel"
+    return None
+
+
+def create_app(tables=None, arrow=True):
+    tables = tables if tables is not None else generate()
+    lock = threading.RLock()
+    # Joined reservations are rebuilt only after a write
+    facts_cache = {"version": 0, "built": -1, "facts": None}
+    app = Flask(__name__)
+
+    def reply(body, status=200):
+        return app.response_class(body, status=status, mimetype="application/json")
+
+    def not_found():
+        return reply(json.dumps("Not Found"), 404)
+
+    def facts():
+        if facts_cache["built"] != facts_cache["version"]:
+            facts_cache["facts"] = reservation_facts(tables)
+            facts_cache["built"] = facts_cache["version"]
+        return facts_cache["facts"]
+
+    def changed():
+        facts_cache["version"] += 1
+
+    def related(table, column, value):
+        with lock:
+            rows = tables[table][tables[table][column] == value]
+            return reply(frame_json(rows)) if len(rows) else not_found()
+
+    @app.route("/dataops/<table>", methods=["GET"])
+    def list_records(table):
+        if table not in schema:
+            return not_found()
+        with lock:
+            if arrow and request.accept_mimetypes.best_match(["application/json", arrow_stream_type]) == arrow_stream_type:
+                return app.response_class(frame_arrow(tables[table]).to_pybytes(), mimetype=arrow_stream_type)
+            return reply(frame_json(tables[table]))
+
+    @app.route("/dataops/<table>", methods=["POST"])
+    def create_record(table):
+        if table not in schema:
+            return not_found()
+        with lock:
+            frame = tables[table]
+            key = int(frame.index.max()) + 1 if len(frame) else 1
+            row = pd.DataFrame([coerce(table, request.get_json())], index=pd.Index([key], name=frame.index.name))
+            tables[table] = pd.concat([frame, row])
+            changed()
+            return reply(record_json(tables[table], key), 201)
+
+    @app.route("/dataops/<table>/<int:key>", methods=["GET"])
+    def read_record(table, key):
+        with lock:
+            if table not in schema or key not in tables[table].index:
+                return not_found()
+            return reply(record_json(tables[table], key))
+
+    @app.route("/dataops/<table>/<int:key>", methods=["PUT"])
+    def update_record(table, key):
+        with lock:
+            if table not in schema or key not in tables[table].index:
+                return not_found()
+            for column, value in coerce(table, request.get_json()).items():
+                tables[table].at[key, column] = value
+            changed()
+            return reply(record_json(tables[table], key))
+
+    @app.route("/dataops/<table>/<int:key>", methods=["DELETE"])
+    def delete_record(table, key):
+        with lock:
+            if table not in schema or key not in tables[table].index:
+                return not_found()
+            tables[table] = tables[table].drop(key)
+            changed()
+            return reply(json.dumps("Deleted"))
+
+    @app.route("/dataops/login/byemployeeid/<int:eid>")
+    def login_by_employee(eid):
+        with lock:
+            rows = tables["login"][tables["login"]["eid"] == eid]
+            return reply(frame_json(rows.iloc[:1])[1:-1]) if len(rows) else not_found()
+
+    @app.route("/dataops/login/byusername")
+    def login_by_username():
+        with lock:
+            rows = tables["login"][tables["login"]["username"] == request.args.get("username")]
+            return reply(frame_json(rows.iloc[:1])[1:-1]) if len(rows) else not_found()
+
+    @app.route("/dataops/login/byusernamepassword")
+    def login_by_username_password():
+        with lock:
+            logins = tables["login"]
+            rows = logins[(logins["username"] == request.args.get("username")) & (logins["password"] == request.args.get("password"))]
+            rows = rows.iloc[:1].join(tables["employee"]["position"], on="eid")
+            return reply(frame_json(rows)[1:-1]) if len(rows) else not_found()
+
+    @app.route("/dataops/hotel/bychid/<int:chid>")
+    def hotels_by_chain(chid):
+        return related("hotel", "chid", chid)
+
+    @app.route("/dataops/employee/byhid/<int:hid>")
+    def employees_by_hotel(hid):
+        return related("employee", "hid", hid)
+
+    @app.route("/dataops/room/byhid/<int:hid>")
+    def rooms_by_hotel(hid):
+        return related("room", "hid", hid)
+
+    @app.route("/dataops/room/byrdid/<int:rdid>")
+    def rooms_by_description(rdid):
+        return related("room", "rdid", rdid)
+
+    @app.route("/dataops/roomunavailable/byrid/<int:rid>")
+    def unavailable_by_room(rid):
+        return related("roomunavailable", "rid", rid)
+
+    @app.route("/dataops/reserve/byclid/<int:clid>")
+    def reserves_by_client(clid):
+        return related("reserve", "clid", clid)
+
+    @app.route("/dataops/reserve/byruid/<int:ruid>")
+    def reserves_by_unavailable(ruid):
+        return related("reserve", "ruid", ruid)
+
+    # Price of booking an unavailability period for a client, or [] when that client already booked it
+    @app.route("/dataops/reserve/totalcost/<int:ruid>/<int:clid>")
+    @app.route("/dataops/reserve/totalcost/<int:ruid>/<int:clid>/<int:reid>")
+    def total_cost(ruid, clid, reid=None):
+        with lock:
+            if ruid not in tables["roomunavailable"].index or clid not in tables["client"].index:
+                return not_found()
+            reserve = tables["reserve"]
+            if ((reserve["ruid"] == ruid) & (reserve["clid"] == clid) & (reserve.index != reid)).any():
+                return reply("[]")
+            stay = tables["roomunavailable"].loc[ruid]
+            room = tables["room"].loc[stay["rid"]]
+            chain = tables["chains"].loc[tables["hotel"].at[room["hid"], "chid"]]
+            markup = season_markup(stay["startdate"].month, chain["wintermkup"], chain["springmkup"], chain["summermkup"], chain["fallmkup"])
+            cost = reservation_cost(room["rprice"], (stay["enddate"] - stay["startdate"]).days, markup, tables["client"].at[clid, "memberyear"])
+            return reply(json.dumps([{"Total Cost": float(cost)}]))
+
+    # Registered one by one so they take precedence over creating a record in a table of the same name
+    def global_statistic(name):
+        with lock:
+            refusal = statistic_refusal(tables, request.get_json()["eid"])
+            if refusal:
+                return reply(json.dumps(refusal))
+            return reply(global_statistics[name](tables, facts()).to_json(orient="records"))
+
+    for name in global_statistics:
+        app.add_url_rule("/dataops/" + name, "statistic " + name, partial(global_statistic, name), methods=["POST"])
+
+    @app.route("/dataops/hotel/<int:hid>/<name>", methods=["POST"])
+    def local_statistic(hid, name):
+        with lock:
+            if name not in local_statistics or hid not in tables["hotel"].index:
+                return not_found()
+            refusal = statistic_refusal(tables, request.get_json()["eid"], hid)
+            if refusal:
+                return reply(json.dumps(refusal))
+            joined = facts()
+            return reply(local_statistics[name](tables, joined[joined["hid"] == hid], hid).to_json(orient="records"))
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the DataOps backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chains", type=int, default=10)
+    parser.add_argument("--hotels", type=int, default=100)
+    parser.add_argument("--rooms", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=20000)
+    parser.add_argument("--reservations", type=int, default=100000)
+    parser.add_argument("--employees", type=int, default=None)
+    parser.add_argument("--json-only", action="store_true", help="answer every request with JSON, as a backend without Arrow support")
+    args = parser.parse_args()
+    tables = generate(args.chains, args.hotels, args.rooms, args.clients, args.reservations, args.employees, args.seed)
+    create_app(tables, arrow=not args.json_only).run(host=args.host, port=args.port, threaded=True)
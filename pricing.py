@@ -0,0 +1,23 @@
+import numpy as np
+
+
+# Reservation pricing of the local stand-in backend. The UI also uses it for its price estimates, but the real
+# backend's pricing rules are not published, so only the price the backend returns on submit is authoritative
+
+# Season of every month (January first) as an index into (winter, spring, summer, fall) markups
+season_of_month = np.array([0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0])
+
+# Discount a client gets for at least the given years of membership, checked from the longest
+membership_tiers = [(15, 0.12), (10, 0.08), (5, 0.05), (1, 0.02)]
+
+def membership_discount(memberyear):
+    memberyear = np.asarray(memberyear)
+    return np.select([memberyear >= years for years, _ in membership_tiers], [discount for _, discount in membership_tiers], 0.0)
+
+def season_markup(month, winter, spring, summer, fall):
+    return np.choose(season_of_month[np.asarray(month) - 1], [winter, spring, summer, fall])
+
+# Price of a stay: nightly price times nights (at least one) times the chain's markup for the season the stay starts in,
+# less the client's membership discount. Works on scalars and on whole columns alike.
+def reservation_cost(rprice, nights, markup, memberyear):
+    return np.round(np.asarray(rprice) * np.maximum(nights, 1) * markup * (1 - membership_discount(memberyear)), 2)
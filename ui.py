@@ -1,12 +1,43 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
 from streamlit_option_menu import option_menu
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import json
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.ticker as ticker
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+import altair as alt
 import locale
 import datetime
+import os
+import threading
+import time
+import hashlib
+import sys
+import io
+import codecs
+from itertools import islice
+from graphlib import TopologicalSorter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial, wraps
+from requests.adapters import HTTPAdapter
+from cachetools import TLRUCache, LRUCache
+from PIL import Image
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.parquet as pq
+from pricing import reservation_cost, season_markup
+
+
+matplotlib.use("Agg")
 
 
 # Initialize session state for login status
@@ -30,7 +61,82 @@ Class: ICOM5016
 """}
 )
 
-url = "https://database-phase1-dataops-74deb9d967c0.herokuapp.com"
+# Backend to talk to; point DATAOPS_URL at local_backend.py to run against the local stand-in
+url = os.environ.get("DATAOPS_URL", "https://database-phase1-dataops-74deb9d967c0.herokuapp.com")
+
+# Connection pool size and (connect, read) timeouts for the backend, tunable per deployment
+http_pool_size = int(os.environ.get("DATAOPS_POOL_SIZE", "10"))
+http_timeout = (float(os.environ.get("DATAOPS_CONNECT_TIMEOUT", "5")), float(os.environ.get("DATAOPS_READ_TIMEOUT", "30")))
+
+# How long entity tables stay cached (seconds) and how many bytes the table cache may hold, counting
+# the decoded tables and everything derived from them
+table_cache_ttl = float(os.environ.get("DATAOPS_TABLE_TTL", "60"))
+table_cache_bytes = int(os.environ.get("DATAOPS_TABLE_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# Ask for entity tables as Arrow IPC streams; a backend without Arrow support answers JSON as before
+arrow_transport = os.environ.get("DATAOPS_ARROW", "1") == "1"
+arrow_stream_type = "application/vnd.apache.arrow.stream"
+# Arrow buffers come from the system allocator; jemalloc's arenas would keep tens of MB per process
+pa.set_memory_pool(pa.system_memory_pool())
+
+# Upper bound on backend fetches running at the same time across the process
+fetch_workers = int(os.environ.get("DATAOPS_FETCH_WORKERS", "8"))
+
+# Upper bound on bulk import and delete requests running at the same time across the process. They have a pool
+# of their own so a large import never queues page loads behind it
+bulk_workers = int(os.environ.get("DATAOPS_BULK_WORKERS", "4"))
+
+# How many IDs an ID picker lists before more are loaded
+picker_page_size = int(os.environ.get("DATAOPS_PICKER_PAGE_SIZE", "50"))
+
+# How many bytes of rendered chart images are kept for reuse across reruns and sessions
+chart_cache_bytes = int(os.environ.get("DATAOPS_CHART_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+# Raster memory (bytes) that figures being drawn at the same time may hold in this process
+figure_budget_bytes = int(os.environ.get("DATAOPS_FIGURE_BUDGET_BYTES", str(128 * 1024 * 1024)))
+# Seconds a render waits for budget before its chart fails
+figure_wait_seconds = float(os.environ.get("DATAOPS_FIGURE_WAIT", "30"))
+
+# Seconds a statistic is served without refreshing (overridable per endpoint with a JSON object, e.g.
+# {"/dataops/most/revenue": 900}), how old a result may get before it is refetched while the user waits,
+# and how many results are kept
+statistic_ttl = float(os.environ.get("DATAOPS_STATISTIC_TTL", "300"))
+statistic_ttls = json.loads(os.environ.get("DATAOPS_STATISTIC_TTLS", "{}"))
+statistic_stale_limit = float(os.environ.get("DATAOPS_STATISTIC_STALE_LIMIT", "3600"))
+statistic_cache_entries = int(os.environ.get("DATAOPS_STATISTIC_CACHE_ENTRIES", "1024"))
+
+# Rows of a bulk import or records of a bulk delete sent to the backend before progress is reported,
+# at most bulk_workers at a time
+import_chunk_size = int(os.environ.get("DATAOPS_IMPORT_CHUNK_SIZE", "100"))
+
+# Rows of an export converted and written at a time; only one batch is held as Python objects
+export_batch_rows = int(os.environ.get("DATAOPS_EXPORT_BATCH_ROWS", "5000"))
+
+# Rows of the Browse table sent to the browser at a time
+browse_page_rows = int(os.environ.get("DATAOPS_BROWSE_PAGE_ROWS", "200"))
+
+# Most hotels that can be compared side by side in Local Statistics
+compare_limit = int(os.environ.get("DATAOPS_COMPARE_LIMIT", "10"))
+chart_dpi = 200
+
+# Banner width matches the widest image Streamlit sends (wider ones are resized on every render),
+# logos are shown at a fixed width in the right column of the welcome pages
+banner_width = 1460
+logo_width = 200
+chain_logos = ["Chain1.png", "Chain2.png", "Chain3.png", "Chain4.png", "Chain5.png"]
+
+# "matplotlib" renders charts to PNG on the server, "vega" ships Vega-Lite specs for the browser to draw
+chart_mode = os.environ.get("DATAOPS_CHART_MODE", "matplotlib")
+
+# Performance panel in the sidebar, opened with ?perf=1 in the URL or DATAOPS_PERF_OVERLAY=1.
+# The numbers live in session_state and start over at every full rerun and every fragment rerun
+perf_enabled = os.environ.get("DATAOPS_PERF_OVERLAY") == "1" or st.query_params.get("perf") == "1"
+
+def start_perf_run():
+    st.session_state["perf"] = {"calls": [], "timings": [], "started": time.perf_counter()}
+
+if perf_enabled:
+    start_perf_run()
 
 
 if 'user' not in st.session_state:
@@ -64,6 +170,2616 @@ def is_int(string):
     except ValueError:
         return False
 
+# Shared keep-alive HTTP client, created once per process and reused across reruns and sessions
+@st.cache_resource
+def get_http_client(pool_size):
+    client = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    client.mount("https://", adapter)
+    client.mount("http://", adapter)
+    return client
+
+def record_perf(kind, row):
+    perf = st.session_state.get("perf") if perf_enabled else None
+    if perf is not None:
+        perf[kind].append(row)
+
+def record_call(method, path, status, seconds, size, cache):
+    record_perf("calls", {"Endpoint": path, "Method": method, "Status": str(status), "Latency (ms)": round(seconds * 1000, 1), "Size (bytes)": size, "Cache": cache})
+
+@contextmanager
+def perf_timer(stage, item):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_perf("timings", {"Stage": stage, "Item": item, "Time (ms)": round((time.perf_counter() - start) * 1000, 1)})
+
+# cache tells the performance panel whether the call fills a cache ("miss"), refreshes one ("revalidate") or bypasses them ("-")
+def api_request(method, path, timeout=None, cache="-", **kwargs):
+    client = get_http_client(http_pool_size)
+    start = time.perf_counter()
+    response = client.request(method, url + path, timeout=timeout or http_timeout, **kwargs)
+    # A streamed body is still unread here, so only its announced size is known
+    size = int(response.headers.get("Content-Length", 0)) if kwargs.get("stream") else len(response.content)
+    record_call(method, path, response.status_code, time.perf_counter() - start, size, cache)
+    return response
+
+def api_get(path, **kwargs):
+    return api_request("GET", path, **kwargs)
+
+def api_post(path, **kwargs):
+    return api_request("POST", path, **kwargs)
+
+def api_put(path, **kwargs):
+    return api_request("PUT", path, **kwargs)
+
+def api_delete(path, **kwargs):
+    return api_request("DELETE", path, **kwargs)
+
+# Process-wide cache of whole entity tables, sized by what each entry holds. An entry expires ttl seconds
+# after its fetch, also when it is put back after growing
+@st.cache_resource
+def get_table_cache(max_bytes, ttl):
+    return TLRUCache(maxsize=max_bytes, ttu=lambda endpoint, entry, now: entry["expires"], timer=time.monotonic, getsizeof=lambda entry: entry["size"]), threading.Lock()
+
+# Rough memory use of a value; the elements of large lists and dicts are estimated from the first 100.
+# Dicts in a list are rows whose keys are the same strings for every row (the JSON decoder shares them),
+# so only their values count
+def object_nbytes(value, row=False):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (np.ndarray, pa.Table)):
+        return value.nbytes
+    if isinstance(value, dict):
+        sample = [(0 if row and isinstance(key, str) else object_nbytes(key)) + object_nbytes(item) for key, item in islice(value.items(), 100)]
+    elif isinstance(value, (list, tuple, set)):
+        sample = [object_nbytes(item, row=True) for item in islice(value, 100)]
+    else:
+        return sys.getsizeof(value)
+    return sys.getsizeof(value) + (len(value) * sum(sample) // len(sample) if sample else 0)
+
+# Measures an entry again and puts it back in the cache, unless it was invalidated or refetched meanwhile.
+# Arrow columns point into the response body, JSON bodies are dropped once decoded
+def store_table_entry(endpoint, entry, new=False):
+    entry["size"] = (entry["nbytes"] if "arrow" in entry else 0) + object_nbytes(entry.get("records", [])) + object_nbytes(entry["derived"])
+    cache, lock = get_table_cache(table_cache_bytes, table_cache_ttl)
+    with lock:
+        if not new and cache.get(endpoint) is not entry:
+            return
+        try:
+            cache[endpoint] = entry
+        except ValueError:
+            # Larger than the whole cache, serve it without caching
+            cache.pop(endpoint, None)
+
+def fetch_table_entry(endpoint):
+    cache, lock = get_table_cache(table_cache_bytes, table_cache_ttl)
+    with lock:
+        entry = cache.get(endpoint)
+    if entry is not None:
+        record_call("GET", endpoint, "cached", 0, entry["nbytes"], "hit")
+    else:
+        headers = {"Accept": arrow_stream_type + ", application/json;q=0.9"} if arrow_transport else {}
+        response = api_get(endpoint, cache="miss", headers=headers)
+        entry = {"nbytes": len(response.content), "derived": {}, "expires": time.monotonic() + table_cache_ttl}
+        if response.headers.get("Content-Type", "").startswith(arrow_stream_type):
+            # The columns point into the response body, nothing is copied until records or frames are asked for
+            with perf_timer("Arrow decode", endpoint):
+                entry["arrow"] = pa.ipc.open_stream(response.content).read_all()
+        else:
+            with perf_timer("JSON decode", endpoint):
+                entry["records"] = response.json()
+        store_table_entry(endpoint, entry, new=True)
+    return entry
+
+# Dates come from the backend in the HTTP date format of Flask's JSON encoder
+http_date_format = "%a, %d %b %Y %H:%M:%S %Z"
+
+# Records of an Arrow table are made the first time they are needed, with dates in the same format as JSON
+def entry_records(endpoint, entry):
+    if "records" not in entry:
+        table = entry["arrow"]
+        with perf_timer("Arrow to records", endpoint):
+            for i, field in enumerate(table.schema):
+                if pa.types.is_date(field.type):
+                    table = table.set_column(i, field.name, pc.strftime(table.column(i).cast(pa.timestamp("s")), format=http_date_format.replace("%Z", "GMT")))
+            # Whole columns through numpy and zipped into rows is about three times faster than to_pylist.
+            # Columns with nulls go through to_pylist so they keep None instead of NaN
+            names = table.column_names
+            columns = [column.to_pylist() if column.null_count else column.to_numpy(zero_copy_only=False).tolist() for column in table.columns]
+            entry["records"] = [dict(zip(names, row)) for row in zip(*columns)]
+        store_table_entry(endpoint, entry)
+    return entry["records"]
+
+# Arrow columns go to pandas as they are, JSON records are converted row by row
+def entry_frame(entry):
+    if "arrow" in entry:
+        return entry["arrow"].to_pandas(date_as_object=False)
+    return pd.DataFrame.from_records(entry["records"])
+
+def fetch_table(endpoint):
+    return entry_records(endpoint, fetch_table_entry(endpoint))
+
+# Structures built from a cached table live as long as the table itself. They are built from its records,
+# or with from_frame from a DataFrame of it, which skips Python objects for tables that came as Arrow
+def derived_table(endpoint, name, build, from_frame=False):
+    entry = fetch_table_entry(endpoint)
+    if name not in entry["derived"]:
+        entry["derived"][name] = build(entry_frame(entry) if from_frame else entry_records(endpoint, entry))
+        store_table_entry(endpoint, entry)
+    return entry["derived"][name]
+
+def invalidate_table(endpoint):
+    cache, lock = get_table_cache(table_cache_bytes, table_cache_ttl)
+    with lock:
+        cache.pop(endpoint, None)
+
+def entity_ids(endpoint, key):
+    return [str(record[key]) for record in fetch_table(endpoint) if record[key] != -1]
+
+# Option labels shown by the ID pickers, keyed by table endpoint
+entity_labels = {
+    "/dataops/login": ("lid", "{username}"),
+    "/dataops/employee": ("eid", "{fname} {lname}, {position}"),
+    "/dataops/chains": ("chid", "{cname}"),
+    "/dataops/hotel": ("hid", "{hname}, {hcity}"),
+    "/dataops/roomdescription": ("rdid", "{rname}, {rtype}"),
+    "/dataops/client": ("clid", "{fname} {lname}"),
+    "/dataops/reserve": ("reid", "client {clid}, {payment}"),
+    "/dataops/room": ("rid", "hotel {hid}, description {rdid}"),
+    "/dataops/roomunavailable": ("ruid", "room {rid}"),
+}
+
+entity_endpoints = {
+    "Login": ("/dataops/login", "lid"),
+    "Employee": ("/dataops/employee", "eid"),
+    "Chain": ("/dataops/chains", "chid"),
+    "Hotel": ("/dataops/hotel", "hid"),
+    "Room Description": ("/dataops/roomdescription", "rdid"),
+    "Client": ("/dataops/client", "clid"),
+    "Reserve": ("/dataops/reserve", "reid"),
+    "Room": ("/dataops/room", "rid"),
+    "Room Unavailable": ("/dataops/roomunavailable", "ruid"),
+}
+entity_names = {endpoint: entity for entity, (endpoint, key) in entity_endpoints.items()}
+
+# Room types and guest capacities each room name may have
+room_constraints = {
+    "Standard": {"capacity": {1}, "types": {"Basic", "Premium"}},
+    "Standard Queen": {"capacity": {1, 2}, "types": {"Basic", "Premium", "Deluxe"}},
+    "Standard King": {"capacity": {2}, "types": {"Basic", "Premium", "Deluxe"}},
+    "Double Queen": {"capacity": {4}, "types": {"Basic", "Premium", "Deluxe"}},
+    "Double King": {"capacity": {4, 6}, "types": {"Basic", "Premium", "Deluxe", "Suite"}},
+    "Triple King": {"capacity": {6}, "types": {"Deluxe", "Suite"}},
+    "Executive Family": {"capacity": {4, 6, 8}, "types": {"Deluxe", "Suite"}},
+    "Presidential": {"capacity": {4, 6, 8}, "types": {"Suite"}}
+}
+payment_methods = ["cash", "check", "credit card", "debit card", "pear pay"]
+
+def build_label_lookup(endpoint, records):
+    key, template = entity_labels[endpoint]
+    lookup = {}
+    for record in records:
+        if record[key] != -1:
+            try:
+                lookup[str(record[key])] = str(record[key]) + " — " + template.format(**record)
+            except KeyError:
+                lookup[str(record[key])] = str(record[key])
+    return lookup
+
+# Searchable ID selectbox that lists one page of matching IDs at a time
+def id_picker(label, endpoint):
+    lookup = derived_table(endpoint, "labels", partial(build_label_lookup, endpoint))
+    search_col, select_col = st.columns([1, 2])
+    query = search_col.text_input("Search", key=label + " search", placeholder="ID or name").strip().lower()
+    if st.session_state.get(label + " query") != query:
+        st.session_state[label + " query"] = query
+        st.session_state[label + " pages"] = 1
+    limit = picker_page_size * st.session_state[label + " pages"]
+    matches = (rid for rid, text in lookup.items() if not query or rid.startswith(query) or query in text.lower())
+    options = list(islice(matches, limit + 1))
+    choice = select_col.selectbox(label, options[:limit], index=None, format_func=lookup.get, key=label)
+    if len(options) > limit and st.button("Load more", key=label + " more"):
+        st.session_state[label + " pages"] += 1
+        st.rerun()
+    return choice
+
+# Multiselect version of id_picker. The picked IDs are kept across searches, so records can be picked
+# from several searches and pages; IDs that are no longer in the table are dropped
+def ids_picker(label, endpoint):
+    lookup = derived_table(endpoint, "labels", partial(build_label_lookup, endpoint))
+    search_col, select_col = st.columns([1, 2])
+    query = search_col.text_input("Search", key=label + " search", placeholder="ID or name").strip().lower()
+    if st.session_state.get(label + " query") != query:
+        st.session_state[label + " query"] = query
+        st.session_state[label + " pages"] = 1
+    picked = [rid for rid in st.session_state.get(label + " picked", []) if rid in lookup]
+    limit = picker_page_size * st.session_state[label + " pages"]
+    matches = (rid for rid, text in lookup.items() if rid not in picked and (not query or rid.startswith(query) or query in text.lower()))
+    options = list(islice(matches, limit + 1))
+    choices = select_col.multiselect(label, picked + options[:limit], default=picked, format_func=lookup.get)
+    st.session_state[label + " picked"] = choices
+    if len(options) > limit and st.button("Load more", key=label + " more"):
+        st.session_state[label + " pages"] += 1
+        st.rerun()
+    return choices
+
+# Hashed indexes over the cached tables so most invalid submissions are turned down without a backend call.
+# The tables can be up to the table TTL old, so submissions that pass are still checked by the backend
+def build_login_index(records):
+    index = {"eids": {}, "usernames": {}}
+    for record in records:
+        if record["lid"] != -1:
+            index["eids"][str(record["eid"])] = record
+            index["usernames"][record["username"]] = record
+    return index
+
+def build_column_index(key, column, records):
+    return {str(record[key]): record[column] for record in records if record[key] != -1}
+
+def build_reservation_index(records):
+    return {(str(record["ruid"]), str(record["clid"])): str(record["reid"]) for record in records if record["reid"] != -1}
+
+# "eid" or "username" when another employee's login already uses it, curr_eid is the employee being updated
+def login_conflict(eid, username, curr_eid=None):
+    index = derived_table("/dataops/login", "index", build_login_index)
+    account = index["eids"].get(str(eid))
+    if account is not None and account["eid"] != curr_eid:
+        return "eid"
+    account = index["usernames"].get(username)
+    if account is not None and account["eid"] != curr_eid:
+        return "username"
+    return None
+
+def table_cached(endpoint):
+    cache, lock = get_table_cache(table_cache_bytes, table_cache_ttl)
+    with lock:
+        return cache.get(endpoint) is not None
+
+# Record or related records at path, None when the backend answers that there are none
+def fetch_if_found(path):
+    response = api_get(path)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    with perf_timer("JSON decode", path):
+        return response.json()
+
+# Capacity of the room behind a room unavailability. Uses the tables when all three are cached and
+# otherwise asks for the three records alone, so a check never downloads whole tables
+def room_capacity(ruid):
+    if all(map(table_cached, ["/dataops/roomunavailable", "/dataops/room", "/dataops/roomdescription"])):
+        rid = derived_table("/dataops/roomunavailable", "rooms", partial(build_column_index, "ruid", "rid")).get(str(ruid))
+        rdid = derived_table("/dataops/room", "descriptions", partial(build_column_index, "rid", "rdid")).get(str(rid))
+        return derived_table("/dataops/roomdescription", "capacities", partial(build_column_index, "rdid", "capacity")).get(str(rdid))
+    unavailable = fetch_if_found("/dataops/roomunavailable/" + str(ruid))
+    room = unavailable and fetch_if_found("/dataops/room/" + str(unavailable["rid"]))
+    description = room and fetch_if_found("/dataops/roomdescription/" + str(room["rdid"]))
+    return description["capacity"] if description else None
+
+# "duplicate" when another reservation has the same room unavailability and client, "capacity" when the
+# guests do not fit the room, reid is the reservation being updated. Only the reservations of this room
+# unavailability are loaded; the backend still has the final say when the reservation is sent
+def reservation_conflict(ruid, clid, guests, reid=None):
+    results, errors = fetch_all(
+        reservations = partial(fetch_if_found, "/dataops/reserve/byruid/" + str(ruid)),
+        capacity = partial(room_capacity, ruid)
+        )
+    show_fetch_errors(errors)
+    for record in results["reservations"] or []:
+        if str(record["clid"]) == str(clid) and str(record["reid"]) != str(reid) and record["reid"] != -1:
+            return "duplicate"
+    capacity = results["capacity"]
+    if capacity is not None and int(guests) > capacity:
+        return "capacity"
+    return None
+
+# Columns of a cached table by its ID, for lookups of many IDs at once
+def build_indexed_columns(key, columns, frame):
+    return frame.loc[frame[key] != -1, [key] + columns].set_index(key)
+
+def build_stays(frame):
+    frame = frame[frame["ruid"] != -1]
+    start, end = [frame[column] if pd.api.types.is_datetime64_any_dtype(frame[column]) else parse_http_dates(frame[column]) for column in ["startdate", "enddate"]]
+    return pd.DataFrame({"rid": frame["rid"].to_numpy(), "nights": (end - start).dt.days.to_numpy(), "month": start.dt.month.to_numpy()}, index=frame["ruid"].to_numpy())
+
+# Estimated total cost of every (ruid, clid) pair in one vectorized pass over the cached tables, with the
+# pricing of local_backend.py. The real backend may price differently, check_quote compares the two on submit.
+# NaN where the room unavailability, its room, hotel or chain, or the client is unknown
+def quote_reservations(ruids, clids):
+    # Load the tables behind the quote in parallel
+    results, errors = fetch_all(
+        rooms_unavailable = partial(fetch_table_entry, "/dataops/roomunavailable"),
+        rooms = partial(fetch_table_entry, "/dataops/room"),
+        hotels = partial(fetch_table_entry, "/dataops/hotel"),
+        chains = partial(fetch_table_entry, "/dataops/chains"),
+        clients = partial(fetch_table_entry, "/dataops/client")
+        )
+    show_fetch_errors(errors)
+    stays = derived_table("/dataops/roomunavailable", "stays", build_stays, from_frame=True)
+    rooms = derived_table("/dataops/room", "prices", partial(build_indexed_columns, "rid", ["hid", "rprice"]), from_frame=True)
+    hotels = derived_table("/dataops/hotel", "chains", partial(build_indexed_columns, "hid", ["chid"]), from_frame=True)
+    chains = derived_table("/dataops/chains", "markups", partial(build_indexed_columns, "chid", ["wintermkup", "springmkup", "summermkup", "fallmkup"]), from_frame=True)
+    clients = derived_table("/dataops/client", "memberyears", partial(build_indexed_columns, "clid", ["memberyear"]), from_frame=True)
+    stay = stays.reindex(np.asarray(ruids).astype("int64"))
+    room = rooms.reindex(stay["rid"])
+    chain = chains.reindex(hotels["chid"].reindex(room["hid"]))
+    memberyear = clients["memberyear"].reindex(np.asarray(clids).astype("int64")).to_numpy(dtype=float)
+    known = stay["nights"].notna().to_numpy() & room["rprice"].notna().to_numpy() & chain.notna().all(axis=1).to_numpy() & ~np.isnan(memberyear)
+    month = np.where(known, stay["month"].to_numpy(), 1).astype(int)
+    markup = season_markup(month, *[chain[column].to_numpy() for column in chains.columns])
+    cost = reservation_cost(room["rprice"].to_numpy(), stay["nights"].to_numpy(), markup, np.nan_to_num(memberyear))
+    return np.where(known, cost, np.nan)
+
+def quote_reservation(ruid, clid):
+    cost = quote_reservations([ruid], [clid])[0]
+    return None if np.isnan(cost) else float(cost)
+
+# Columns a bulk import file needs per entity and what each must hold: "text", "int" (whole number >= 0),
+# "float" (number >= 0), "bool", "date", a list of allowed values, or the table the ID must exist in
+import_specs = {
+    "Login": ("/dataops/login", {"eid": "/dataops/employee", "username": "text", "password": "text"}),
+    "Employee": ("/dataops/employee", {"hid": "/dataops/hotel", "fname": "text", "lname": "text", "age": "int", "position": ["Administrator", "Regular", "Supervisor"], "salary": "float"}),
+    "Chain": ("/dataops/chains", {"cname": "text", "springmkup": "float", "summermkup": "float", "wintermkup": "float", "fallmkup": "float"}),
+    "Hotel": ("/dataops/hotel", {"chid": "/dataops/chains", "hname": "text", "hcity": "text"}),
+    "Room Description": ("/dataops/roomdescription", {"rname": list(room_constraints), "rtype": "text", "capacity": "int", "ishandicap": "bool"}),
+    "Client": ("/dataops/client", {"fname": "text", "lname": "text", "age": "int", "memberyear": "int"}),
+    "Reserve": ("/dataops/reserve", {"ruid": "/dataops/roomunavailable", "clid": "/dataops/client", "payment": payment_methods, "guests": "int"}),
+    "Room": ("/dataops/room", {"hid": "/dataops/hotel", "rdid": "/dataops/roomdescription", "rprice": "float"}),
+    "Room Unavailable": ("/dataops/roomunavailable", {"rid": "/dataops/room", "startdate": "date", "enddate": "date"}),
+}
+# Tables the entity rules below look up besides the referenced ones
+import_lookups = {
+    "Login": ["/dataops/login"],
+    "Reserve": ["/dataops/reserve", "/dataops/room", "/dataops/roomdescription"],
+}
+boolean_words = {"true": True, "false": False, "yes": True, "no": False, "1": True, "0": False}
+
+# Checks whole columns at once and returns the rows ready to send, typed for the backend, and the rejected
+# rows with the first problem found in each. Row numbers are the file's, counting the header as row 1
+def validate_import(entity, frame):
+    endpoint, columns = import_specs[entity]
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise ValueError("The file is missing the column(s): " + ", ".join(missing))
+    references = {column: kind for column, kind in columns.items() if isinstance(kind, str) and kind.startswith("/dataops/")}
+    # Load the tables behind the checks in parallel
+    results, errors = fetch_all(**{table.rsplit("/", 1)[1]: partial(fetch_table, table) for table in set(references.values()).union(import_lookups.get(entity, []))})
+    show_fetch_errors(errors)
+
+    reasons = pd.Series("", index=frame.index)
+    def reject(mask, reason):
+        reasons[mask & (reasons == "")] = reason
+
+    clean = pd.DataFrame(index=frame.index)
+    for column, kind in columns.items():
+        text = frame[column].astype("string").str.strip()
+        blank = text.isna() | (text == "")
+        reject(blank, column + " is empty")
+        if kind in ("int", "float") or column in references:
+            numbers = pd.to_numeric(text, errors="coerce")
+            bad = numbers.isna() | (numbers < 0)
+            if kind == "float":
+                reject(~blank & bad, column + " must be a positive number")
+                clean[column] = numbers
+            else:
+                bad |= numbers % 1 != 0
+                reject(~blank & bad, column + " must be a positive whole number")
+                clean[column] = numbers.where(~bad).astype("Int64")
+            if column in references:
+                known = derived_table(kind, "labels", partial(build_label_lookup, kind))
+                reject(~bad & ~clean[column].astype("string").isin(list(known)), "there is no " + column + " " + text)
+        elif kind == "bool":
+            clean[column] = text.str.lower().map(boolean_words)
+            reject(~blank & clean[column].isna(), column + " must be true or false")
+        elif kind == "date":
+            clean[column] = pd.to_datetime(text, errors="coerce")
+            reject(~blank & clean[column].isna(), column + " must be a date")
+        elif isinstance(kind, list):
+            reject(~blank & ~text.isin(kind), column + " must be one of: " + ", ".join(kind))
+            clean[column] = text
+        else:
+            clean[column] = text
+
+    if entity == "Room Description":
+        allowed_types = {rname + "|" + rtype for rname, rules in room_constraints.items() for rtype in rules["types"]}
+        allowed_capacities = {rname + "|" + str(capacity) for rname, rules in room_constraints.items() for capacity in rules["capacity"]}
+        reject(~(clean["rname"] + "|" + clean["rtype"]).isin(allowed_types), "this room name does not come in rtype " + clean["rtype"])
+        reject(~(clean["rname"] + "|" + clean["capacity"].astype("string")).isin(allowed_capacities), "this room name does not hold " + clean["capacity"].astype("string") + " guests")
+    if entity == "Room Unavailable":
+        reject(clean["enddate"] < clean["startdate"], "enddate is before startdate")
+    if entity == "Login":
+        index = derived_table("/dataops/login", "index", build_login_index)
+        eids = clean["eid"].astype("string")
+        reject(eids.isin(list(index["eids"])), "there is already an account for this eid")
+        reject(clean["username"].isin(list(index["usernames"])), "this username is already taken")
+        reject(eids.duplicated(), "this eid is used in an earlier row")
+        reject(clean["username"].duplicated(), "this username is used in an earlier row")
+    if entity == "Reserve":
+        pair = clean["ruid"].astype("string") + "|" + clean["clid"].astype("string")
+        reserved = [ruid + "|" + clid for ruid, clid in derived_table("/dataops/reserve", "pairs", build_reservation_index)]
+        reject(pair.isin(reserved), "there is already a reservation for this ruid and clid")
+        reject(pair.duplicated(), "this ruid and clid are used in an earlier row")
+        # ruid -> rid -> rdid -> capacity, one column at a time
+        rid = clean["ruid"].astype("string").map(derived_table("/dataops/roomunavailable", "rooms", partial(build_column_index, "ruid", "rid")))
+        rdid = rid.astype("Int64").astype("string").map(derived_table("/dataops/room", "descriptions", partial(build_column_index, "rid", "rdid")))
+        capacity = rdid.astype("Int64").astype("string").map(derived_table("/dataops/roomdescription", "capacities", partial(build_column_index, "rdid", "capacity")))
+        reject((clean["guests"] > pd.to_numeric(capacity)).fillna(False), "there are more guests than the room holds")
+
+    valid = clean[reasons == ""].copy()
+    for column, kind in columns.items():
+        if kind == "date":
+            valid[column] = valid[column].dt.strftime("%Y-%m-%d")
+        elif kind == "int" or column in references:
+            valid[column] = valid[column].astype("int64")
+    rejects = frame[reasons != ""].assign(Reason=reasons[reasons != ""])
+    rejects.insert(0, "Row", rejects.index + 2)
+    return valid, rejects
+
+def import_row(entity, record):
+    endpoint = import_specs[entity][0]
+    if entity == "Reserve":
+        total_cost = api_get("/dataops/reserve/totalcost/" + str(record["ruid"]) + "/" + str(record["clid"])).json()
+        if not total_cost:
+            return "there is already a reservation for this ruid and clid"
+        record = dict(record, total_cost=float(total_cost[0]["Total Cost"]))
+    response = api_post(endpoint, json=record)
+    if not response.ok:
+        return "the backend answered " + str(response.status_code) + ": " + response.text[:200]
+    return None
+
+# Sends the rows a chunk at a time through the bulk pool and returns the reason each failed row failed
+def import_rows(entity, valid, progress):
+    pool = get_bulk_pool(bulk_workers)
+    ctx = get_script_run_ctx()
+    rows = list(zip(valid.index + 2, valid.to_dict("records")))
+    failures = {}
+    for start in range(0, len(rows), import_chunk_size):
+        futures = {pool.submit(run_with_ctx, ctx, partial(import_row, entity, record)): row for row, record in rows[start:start + import_chunk_size]}
+        for future in as_completed(futures):
+            try:
+                reason = future.result()
+            except requests.RequestException as error:
+                reason = str(error)
+            if reason:
+                failures[futures[future]] = reason
+        done = min(start + import_chunk_size, len(rows))
+        progress.progress(done / len(rows), text="Sent " + str(done) + " of " + str(len(rows)) + " rows")
+    invalidate_table(import_specs[entity][0])
+    return failures
+
+# Foreign keys as parent table -> [(child table, the column of the child holding the parent's ID)].
+# A record can only be deleted once nothing refers to it, so deletes go children first
+foreign_keys = {
+    "/dataops/chains": [("/dataops/hotel", "chid")],
+    "/dataops/hotel": [("/dataops/employee", "hid"), ("/dataops/room", "hid")],
+    "/dataops/employee": [("/dataops/login", "eid")],
+    "/dataops/roomdescription": [("/dataops/room", "rdid")],
+    "/dataops/room": [("/dataops/roomunavailable", "rid")],
+    "/dataops/roomunavailable": [("/dataops/reserve", "ruid")],
+    "/dataops/client": [("/dataops/reserve", "clid")],
+}
+table_parents = {endpoint: set() for endpoint, key in entity_endpoints.values()}
+for parent, children in foreign_keys.items():
+    for child, column in children:
+        table_parents[child].add(parent)
+# Every parent comes before its children
+table_order = list(TopologicalSorter(table_parents).static_order())
+
+def build_children_index(key, column, records):
+    children = {}
+    for record in records:
+        if record[key] != -1:
+            children.setdefault(str(record[column]), []).append(str(record[key]))
+    return children
+
+# Child IDs by the ID of their parent, built once per cached child table
+def children_by(child, column):
+    key = entity_labels[child][0]
+    return derived_table(child, "children by " + column, partial(build_children_index, key, column))
+
+def tables_below(endpoint):
+    tables = {endpoint}
+    for table in table_order:
+        if table in tables:
+            tables.update(child for child, column in foreign_keys.get(table, []))
+    return tables
+
+# Everything the selected records would take with them, worked out in one pass down the foreign key graph:
+# the IDs per table that depend on them directly or through other records, and how many direct dependents
+# each selected record has per child table. Records with no direct dependents can be deleted on their own
+def delete_impact(endpoint, ids):
+    results, errors = fetch_all(**{entity_names[table].lower().replace(" ", "_") + "_table": partial(fetch_table, table) for table in tables_below(endpoint)})
+    show_fetch_errors(errors)
+    dependents = {endpoint: set(ids)}
+    for table in table_order:
+        for child, column in foreign_keys.get(table, []):
+            if dependents.get(table):
+                children = children_by(child, column)
+                found = dependents.setdefault(child, set())
+                for rid in dependents[table]:
+                    found.update(children.get(rid, ()))
+    direct = pd.DataFrame({entity_names[child]: [len(children_by(child, column).get(rid, ())) for rid in ids] for child, column in foreign_keys.get(endpoint, [])}, index=ids, dtype="int64")
+    return {table: found for table, found in dependents.items() if found}, direct
+
+# Deletes the records table by table, children before parents, a chunk at a time through the bulk pool.
+# Parents are left alone once a delete below them failed, so nothing is left pointing at a missing record.
+# Returns the reason each failed record failed by table and ID
+def delete_records(records, progress):
+    pool = get_bulk_pool(bulk_workers)
+    ctx = get_script_run_ctx()
+    total = sum(len(ids) for ids in records.values())
+    done = 0
+    failures = {}
+    for table in reversed(table_order):
+        ids = sorted(records.get(table, ()), key=int)
+        for start in range(0, len(ids), import_chunk_size):
+            futures = {pool.submit(run_with_ctx, ctx, partial(api_delete, table + "/" + rid)): rid for rid in ids[start:start + import_chunk_size]}
+            for future in as_completed(futures):
+                try:
+                    response = future.result()
+                    reason = None if response.ok else "the backend answered " + str(response.status_code) + ": " + response.text[:200]
+                except requests.RequestException as error:
+                    reason = str(error)
+                if reason:
+                    failures[(entity_names[table], futures[future])] = reason
+            done += len(futures)
+            progress.progress(done / total, text="Deleted " + str(done) + " of " + str(total) + " records")
+        if ids:
+            invalidate_table(table)
+        if failures:
+            break
+    return failures
+
+# Arrow types of the exported columns by their import_specs kind. Choice lists are text and
+# the columns that name the table they refer to hold IDs
+export_types = {"text": pa.string(), "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "date": pa.date32()}
+# Columns the backend returns besides the ID and the importable ones, and columns kept out of exports
+export_extras = {"Reserve": {"total_cost": "float"}}
+export_hidden = {"password"}
+
+# Kinds of every column the backend returns for the entity, ID first
+def entity_kinds(entity):
+    return {entity_endpoints[entity][1]: "int", **import_specs[entity][1], **export_extras.get(entity, {})}
+
+def export_schema(entity):
+    return pa.schema([(column, pa.string() if isinstance(kind, list) else export_types.get(kind, pa.int64())) for column, kind in entity_kinds(entity).items() if column not in export_hidden])
+
+# Parses each distinct date once. The zone is always GMT, matching it literally keeps pandas on its vectorized parser
+def parse_http_dates(values):
+    values = pd.Series(values, dtype=object).astype("category")
+    dates = pd.to_datetime(values.cat.categories, format=http_date_format.replace("%Z", "GMT"))
+    return pd.Series(dates.take(values.cat.codes, allow_fill=True, fill_value=pd.NaT), index=values.index)
+
+# Yields the objects of a JSON array response one at a time as the body downloads
+def iter_json_array(response):
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    for chunk in response.iter_content(chunk_size=1 << 16):
+        buffer += text.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,[]":
+                pos += 1
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The object goes on in the next chunk
+                break
+            if isinstance(item, dict):
+                yield item
+        buffer = buffer[pos:]
+    if buffer.strip():
+        raise ValueError("The backend response ended in the middle of a record")
+
+def export_batch(schema, records):
+    columns = []
+    for field in schema:
+        values = [record.get(field.name) for record in records]
+        if field.type == pa.date32():
+            dates = parse_http_dates(values).to_numpy().astype("datetime64[D]")
+            columns.append(pa.array(dates, type=pa.date32(), from_pandas=True))
+        else:
+            columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+# Streams a whole table from the backend into a CSV or Parquet file, export_batch_rows rows at a time.
+# Bypasses the table cache so the export is as current as the backend, and returns the file and its row count
+def export_table(entity, file_format, progress):
+    endpoint, key = entity_endpoints[entity]
+    schema = export_schema(entity)
+    sink = io.BytesIO()
+    writer = pq.ParquetWriter(sink, schema) if file_format == "Parquet" else pa.csv.CSVWriter(sink, schema)
+    rows = 0
+    with api_get(endpoint, stream=True) as response, writer:
+        response.raise_for_status()
+        size = int(response.headers.get("Content-Length", 0))
+        records = (record for record in iter_json_array(response) if record.get(key) != -1)
+        while batch := list(islice(records, export_batch_rows)):
+            writer.write_batch(export_batch(schema, batch))
+            rows += len(batch)
+            if size:
+                progress.progress(min(response.raw.tell() / size, 1.0), text="Exported " + str(rows) + " rows")
+    return sink.getvalue(), rows
+
+# Text columns with few distinct values, kept as categoricals in browse frames
+category_columns = {"payment", "position", "rname", "rtype", "hcity"}
+
+# Typed frame of a cached table, built once per table: ints downcast, repeated text as categoricals and
+# dates parsed in one vectorized pass. Shared by the Browse tab and the bulk delete previews
+def build_browse_frame(entity, frame):
+    kinds = {column: kind for column, kind in entity_kinds(entity).items() if column not in export_hidden}
+    key = entity_endpoints[entity][1]
+    frame = frame.reindex(columns=list(kinds))
+    frame = frame[frame[key] != -1].reset_index(drop=True)
+    for column, kind in kinds.items():
+        if kind == "date" and not pd.api.types.is_datetime64_any_dtype(frame[column]):
+            frame[column] = parse_http_dates(frame[column])
+        elif column in category_columns or isinstance(kind, list):
+            frame[column] = frame[column].astype("category")
+        elif kind == "int" or kind in entity_labels:
+            frame[column] = pd.to_numeric(frame[column], downcast="integer")
+    # Sorted row orders are added by browse_order as they are asked for
+    return {"frame": frame, "orders": {}}
+
+def browse_frame(entity):
+    return derived_table(entity_endpoints[entity][0], "browse", partial(build_browse_frame, entity), from_frame=True)["frame"]
+
+# Row positions of the browse frame in sorted order, kept per column and direction with the frame itself
+# so sorting never turns the cached table into records
+def browse_order(entity, column, descending):
+    endpoint = entity_endpoints[entity][0]
+    browse = derived_table(endpoint, "browse", partial(build_browse_frame, entity), from_frame=True)
+    if (column, descending) not in browse["orders"]:
+        browse["orders"][(column, descending)] = browse["frame"].sort_values(column, ascending=not descending, kind="stable").index.to_numpy()
+        cache, lock = get_table_cache(table_cache_bytes, table_cache_ttl)
+        with lock:
+            entry = cache.get(endpoint)
+        if entry is not None:
+            store_table_entry(endpoint, entry)
+    return browse["orders"][(column, descending)]
+
+# Rows with a text cell containing the query or, for a number, an int cell equal to it. Categoricals are
+# matched on their categories, not on every row
+def browse_matches(frame, query):
+    mask = np.zeros(len(frame), dtype=bool)
+    for column in frame.columns:
+        values = frame[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            categories = values.cat.categories
+            mask |= values.isin(categories[categories.astype(str).str.lower().str.contains(query, regex=False)]).to_numpy()
+        elif values.dtype == object:
+            mask |= values.str.lower().str.contains(query, regex=False, na=False).to_numpy()
+        elif pd.api.types.is_integer_dtype(values) and query.isdigit():
+            mask |= (values == int(query)).to_numpy()
+    return mask
+
+def fetch_json(path, **kwargs):
+    response = api_get(path, **kwargs)
+    with perf_timer("JSON decode", path):
+        return response.json()
+
+@st.cache_resource
+def get_fetch_pool(workers):
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dataops-fetch")
+
+@st.cache_resource
+def get_bulk_pool(workers):
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dataops-bulk")
+
+# Worker threads borrow the calling script's context so cached resources resolve for its session
+def run_with_ctx(ctx, call):
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return call()
+
+# Run independent fetches in parallel and collect the results and errors of each call by name
+def fetch_all(**calls):
+    pool = get_fetch_pool(fetch_workers)
+    ctx = get_script_run_ctx()
+    futures = {name: pool.submit(run_with_ctx, ctx, call) for name, call in calls.items()}
+    results = {}
+    errors = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as error:
+            errors[name] = error
+    return results, errors
+
+def show_fetch_errors(errors):
+    for name, error in errors.items():
+        st.error("Could not load the " + name.replace("_", " ") + ": " + str(error))
+    if errors:
+        st.stop()
+
+
+# Creates Agg figures outside of pyplot's global registry and closes every figure a render created once
+# it is done, so figures never outlive their request. Renders wait while the live figures would exceed the budget,
+# at most wait_seconds so a render that never releases its figures cannot hang every later one
+class FigureManager:
+    def __init__(self, budget_bytes, wait_seconds):
+        self.budget_bytes = budget_bytes
+        self.wait_seconds = wait_seconds
+        self.live_bytes = 0
+        self.live_figures = 0
+        self.condition = threading.Condition()
+        self.local = threading.local()
+
+    def subplots(self, figsize):
+        # Only render_png releases figures, so one made outside of it is refused before it is counted
+        created = getattr(self.local, "created", None)
+        if created is None:
+            raise RuntimeError("Figures can only be created while render_png runs")
+        size = int(figsize[0] * chart_dpi * figsize[1] * chart_dpi * 4)
+        with self.condition:
+            # A single figure is always admitted, even when it is larger than the budget on its own
+            if not self.condition.wait_for(lambda: not self.live_figures or self.live_bytes + size <= self.budget_bytes, self.wait_seconds):
+                raise TimeoutError("The chart could not be drawn, the server is busy drawing other charts")
+            self.live_bytes += size
+            self.live_figures += 1
+        try:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        except BaseException:
+            self.release(size)
+            raise
+        created.append((fig, size))
+        return fig, fig.subplots()
+
+    def release(self, size):
+        with self.condition:
+            self.live_bytes -= size
+            self.live_figures -= 1
+            self.condition.notify_all()
+
+    def render_png(self, plot, df):
+        self.local.created = []
+        try:
+            fig = plot(df)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=chart_dpi, bbox_inches="tight")
+            return buffer.getvalue()
+        finally:
+            for fig, size in self.local.created:
+                fig.clear()
+                self.release(size)
+            self.local.created = None
+
+@st.cache_resource
+def get_figure_manager(budget_bytes, wait_seconds):
+    return FigureManager(budget_bytes, wait_seconds)
+
+def new_figure(figsize):
+    return get_figure_manager(figure_budget_bytes, figure_wait_seconds).subplots(figsize)
+
+# Colors shared by the matplotlib and Vega-Lite charts
+bar_color = "#151C62"
+payment_colors = ['#5abf6e', '#bf5a5a', '#5a5fbf', '#bfad5a', '#a35abf']
+room_type_colors = ['#5abf6e', '#bf5a5a', '#5a5fbf', '#bfad5a']
+month_colors = {
+    'January': '#5abf6e',
+    'February': '#ff5c69',
+    'March': '#5a5fbf',
+    'April': '#bfad5a',
+    'May': '#a35abf',
+    'June': '#ff99f1',
+    'July': '#706f70',
+    'August': '#c7c7f0',
+    'September': '#69f5c6',
+    'October': '#e09753',
+    'November': '#e6e856',
+    'December': '#7bb0d1'
+}
+all_months = list(month_colors)
+
+# Chart builders for each statistic: they take the query result as a DataFrame and return the figure
+def plot_chain_revenue(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 4))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Chain', y='Revenue', ax=ax, legend=False, color="#151C62", figsize= (9,3.5))
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    # Set axis labels and title
+    ax.set_xlabel('Chains')
+    ax.set_ylabel('Revenue Earned')
+    ax.set_title('Top 3 chains with the highest total revenue')
+
+    # Set the y-axis tick labels to use locale currency format
+    formatter = ticker.ScalarFormatter(useLocale=True)
+    ax.yaxis.set_major_formatter(formatter)
+
+    # Format the y-axis tick labels using locale currency format
+    for tick in ax.get_yticklabels():
+        tick.set_text(locale.currency(float(tick.get_text()), grouping=True))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(locale.currency(height, grouping=True),
+                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color='white')
+                        # Set pandas option
+    pd.options.display.float_format = '{:.2f}'.format
+
+    ax.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_payment_methods(df):
+    # Plotting the pie chart using matplotlib
+    fig, ax = new_figure(figsize=(10, 4))
+    # Create the pie chart
+    wedges, texts, autotexts = ax.pie(df['Reservation Percentage'], autopct='%1.1f%%', colors=payment_colors,)
+
+    # Add legend
+    ax.legend(wedges, df['Payment Method'], title='Payment Method', loc='center left', bbox_to_anchor=(1, 0, 0.5, 1))
+
+    # Adjust layout
+    ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+    # Set title
+    ax.set_title('Total reservation percentage by payment method')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_least_rooms(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(15, 3))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Chain', y='Rooms Available', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Set axis labels and title
+    ax.set_xlabel('Chain')
+    ax.set_ylabel('Number of Rooms Available')
+    ax.set_title('Top 3 hotel chains with the least rooms')
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color = 'white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_most_capacity(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(12, 4))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Hotel', y='Capacity', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Set axis labels and title
+    ax.set_xlabel('Hotel')
+    ax.set_ylabel('Client Capacity')
+    ax.set_title('Top 5 hotels with the most client capacity')
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color='white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_most_reservations(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(11, 4))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Hotel', y='Reservations', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Set axis labels and title
+    ax.set_xlabel('Hotel')
+    ax.set_ylabel('Reservations')
+    ax.set_title('Top 10% of the hotels that had the most reservations')
+
+    # Format y-axis tick labels with commas
+    ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:,.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color='white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+# Axis-aligned rectangles as polygon vertices, for drawing many of them in a single collection
+def rectangle_vertices(left, bottom, width, height):
+    right = left + width
+    top = bottom + height
+    return np.stack([np.column_stack([left, bottom]), np.column_stack([left, top]),
+                     np.column_stack([right, top]), np.column_stack([right, bottom])], axis=1)
+
+# Stacked bar chart with one bar per row of the frame and one segment per column. Segment positions come
+# from a single cumulative sum, and all segments, label backgrounds and labels are added in one batch.
+# Returns the legend handles, one per column.
+def plot_stacked_bars(ax, frame, colors, width=0.5):
+    positions = np.arange(len(frame.index))
+    values = frame.to_numpy(dtype=float)
+    tops = values.cumsum(axis=1)
+    bottoms = tops - values
+    totals = tops[:, -1] if len(frame.columns) else np.zeros(len(positions))
+    y_max = max(totals.max(initial=0), 1) * 1.05
+
+    # Draw only the non-zero segments
+    rows, cols = np.nonzero(values)
+    segments = rectangle_vertices(positions[rows] - width / 2, bottoms[rows, cols], width, values[rows, cols])
+    ax.add_collection(PolyCollection(segments, facecolors=np.asarray(colors)[cols], linewidths=0))
+
+    # Annotate each segment at its middle, over a light gray background
+    middles = bottoms[rows, cols] + values[rows, cols] / 2
+    box_height = y_max * 0.04
+    boxes = rectangle_vertices(positions[rows] - 0.15, middles - box_height / 2, 0.3, np.full(len(rows), box_height))
+    ax.add_collection(PolyCollection(boxes, facecolors='lightgray', alpha=0.5, linewidths=0))
+    for x_pos, y_pos, value in zip(positions[rows], middles, values[rows, cols].astype(int)):
+        ax.text(x_pos, y_pos, str(value), ha='center', va='center')
+
+    # Annotate the top of each bar with its total
+    for x_pos, total in zip(positions, totals.astype(int)):
+        ax.text(x_pos, total, str(total), ha='center', va='bottom', fontweight='bold')
+
+    ax.set_xticks(positions, frame.index)
+    ax.set_xlim(-0.5, len(positions) - 0.5)
+    ax.set_ylim(0, y_max)
+    return [Patch(color=color, label=column) for column, color in zip(frame.columns, colors)]
+
+def plot_reservations_by_month(df):
+    # Pivot to chains as rows and all 12 months as columns, months without reservations as 0
+    frame = df.pivot_table(index='Chain', columns='Month', values='Reservations', aggfunc='sum', fill_value=0)
+    frame = frame.reindex(columns=all_months, fill_value=0)
+
+    # Plotting the stacked bar chart
+    fig, ax = new_figure(figsize=(10, 5))
+    handles = plot_stacked_bars(ax, frame, [month_colors[month] for month in frame.columns])
+
+    # Set axis labels and title
+    ax.set_xlabel('Chain ID')
+    ax.set_ylabel('Reservations')
+    ax.set_title('Top 3 month with the most reservation by chain')
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Create the legend with all 12 months
+    ax.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.2, 1.0))
+    return fig
+
+def plot_handicap_rooms(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Room ID', y='Reservations', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    # Set axis labels and title
+    ax.set_xlabel('Handicap Room ID')
+    ax.set_ylabel('Reservations')
+    ax.set_title('Top 5 handicap rooms that were reserved the most')
+
+    # Format y-axis tick labels with commas
+    ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:,.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold',color="white")
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_least_unavailable(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Room ID', y='Days Unavailable', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    # Set axis labels and title
+    ax.set_xlabel('Room ID')
+    ax.set_ylabel('Days Unavailable')
+    ax.set_title('Top 3 rooms that were the least time unavailable')
+
+    # Format y-axis tick labels with commas
+    ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:,.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height - (height*.10)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold',color='white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_credit_card_clients(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(6, 4))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Full Name', y='Credit Card Reservations', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Set axis labels and title
+    ax.set_xlabel('Client Name')
+    ax.set_ylabel('Credit Card Reservations')
+    ax.set_title('Top 5 clients under 30 years old that made the most reservation with a credit card')
+
+    ax.set_ylim(top=5)
+    # Format y-axis tick labels with commas
+    ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:,.0f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height - (height*.30)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color='white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_highest_paid(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Employee Name', y='Salary', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+    # Set axis labels and title
+    ax.set_xlabel('Employee Name')
+    ax.set_ylabel('Salary')
+    ax.set_title('Top 3 highest paid regular employees')
+
+    # Set the y-axis tick labels to use locale currency format
+    formatter = ticker.ScalarFormatter(useLocale=True)
+    ax.yaxis.set_major_formatter(formatter)
+
+    # Format the y-axis tick labels using locale currency format
+    for tick in ax.get_yticklabels():
+        tick_value = float(tick.get_text().replace(',', ''))
+        # Format the tick label as currency
+        tick.set_text(locale.currency(tick_value, grouping=True))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(locale.currency(height, grouping=True),
+                xy=(bar.get_x() + bar.get_width() / 2, height - (height*.10)),
+                xytext=(0, -1),  # 3 points vertical offset
+                textcoords="offset points",
+                ha='center', va='bottom', fontweight='bold', color='white')
+
+    ax.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_most_discounts(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Client ID', y='Discounts', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    # Set axis labels and title
+    ax.set_xlabel('Client ID')
+    ax.set_ylabel('Total Discounted Price')
+    ax.set_title('Top 5 clients that received the most discounts')
+
+    # Set the y-axis tick labels to use locale currency format
+    formatter = ticker.ScalarFormatter(useLocale=True)
+    ax.yaxis.set_major_formatter(formatter)
+
+    # Format the y-axis tick labels using locale currency format
+    for tick in ax.get_yticklabels():
+        tick_value = float(tick.get_text().replace(',', ''))
+        # Format the tick label as currency
+        tick.set_text(locale.currency(tick_value, grouping=True))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(locale.currency(height, grouping=True),
+                xy=(bar.get_x() + bar.get_width() / 2, height - (height*0.1)),
+                xytext=(0, -1),  # 3 points vertical offset
+                textcoords="offset points",
+                ha='center', va='bottom', fontweight='bold', color='white')
+
+    ax.ticklabel_format(axis="y", style="plain")
+    return fig
+
+def plot_room_types(df):
+    # Plotting the pie chart using matplotlib
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # Create the pie chart
+    wedges, texts, autotexts = ax.pie(df['Total Reservations'], autopct='%1.1f%%', colors=room_type_colors)
+
+    # Add legend
+    ax.legend(wedges, df['Room Type'], title='Room Type', loc='center left', bbox_to_anchor=(1, 0, 0.5, 1))
+
+    # Adjust layout
+    ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+
+    # Set title
+    ax.set_title('Total reservation percentage by room type')
+    return fig
+
+def plot_least_guests(df):
+    # Plotting the bar chart using matplotlib
+    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
+    fig, ax = new_figure(figsize=(10, 3.5))
+    # plt.gca().set_facecolor('#D3D3D3')
+    bars = df.plot(kind='bar', x='Room ID', y='Guest to Capacity Ratio', ax=ax, legend=False, color="#151C62")
+
+    # Rotate the x-axis labels
+    setp(ax.get_xticklabels(), rotation=0, ha='center')
+
+    # Set axis labels and title
+    ax.set_xlabel('Room ID')
+    ax.set_ylabel('Guest to Capacity Ratio')
+    ax.set_title('Top 3 rooms that were reserved that had the least guest-to-capacity ratio')
+    ax.set_ylim(top=1)
+    # Format y-axis tick labels with commas
+    ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,.2f}'.format(float(x))))
+
+    # Annotate each bar with its value
+    for bar in bars.patches:
+        height = bar.get_height()
+        ax.annotate(f'{height:,.2f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height - (height*.20)),
+                    xytext=(0, -1),  # 3 points vertical offset
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontweight='bold', color='white')
+
+    # plt.ticklabel_format(axis="y", style="plain")
+    return fig
+
+
+# Vega-Lite versions of the charts above, drawn by the browser
+def vega_bar(df, x, y, x_title, y_title, title, value_format, label_angle=0, y_max=None):
+    scale = alt.Scale(domainMax=y_max) if y_max else alt.Undefined
+    base = alt.Chart(df, title=title).encode(
+        x=alt.X(x + ":N", title=x_title, sort=None, axis=alt.Axis(labelAngle=-label_angle)),
+        y=alt.Y(y + ":Q", title=y_title, scale=scale, axis=alt.Axis(format=value_format)),
+    )
+    bars = base.mark_bar(color=bar_color)
+    labels = base.mark_text(baseline="top", dy=4, color="white", fontWeight="bold").encode(text=alt.Text(y + ":Q", format=value_format))
+    return bars + labels
+
+def vega_pie(df, value, category, title, colors):
+    df = df.assign(Share=df[value] / df[value].sum())
+    base = alt.Chart(df, title=title).encode(
+        theta=alt.Theta(value + ":Q", stack=True),
+        color=alt.Color(category + ":N", title=category, sort=None, scale=alt.Scale(domain=list(df[category]), range=colors[:len(df)])),
+    )
+    wedges = base.mark_arc(outerRadius=120)
+    labels = base.mark_text(radius=90, color="black").encode(text=alt.Text("Share:Q", format=".1%"))
+    return wedges + labels
+
+def vega_chain_revenue(df):
+    return vega_bar(df, "Chain", "Revenue", "Chains", "Revenue Earned", "Top 3 chains with the highest total revenue", "$,.2f")
+
+def vega_payment_methods(df):
+    return vega_pie(df, "Reservation Percentage", "Payment Method", "Total reservation percentage by payment method", payment_colors)
+
+def vega_least_rooms(df):
+    return vega_bar(df, "Chain", "Rooms Available", "Chain", "Number of Rooms Available", "Top 3 hotel chains with the least rooms", ",.0f", label_angle=45)
+
+def vega_most_capacity(df):
+    return vega_bar(df, "Hotel", "Capacity", "Hotel", "Client Capacity", "Top 5 hotels with the most client capacity", ",.0f", label_angle=45)
+
+def vega_most_reservations(df):
+    return vega_bar(df, "Hotel", "Reservations", "Hotel", "Reservations", "Top 10% of the hotels that had the most reservations", ",.0f", label_angle=45)
+
+def vega_reservations_by_month(df):
+    df = df.assign(**{"Month Order": df["Month"].map(all_months.index)}).sort_values(["Chain", "Month Order"])
+    df["Middle"] = df.groupby("Chain")["Reservations"].cumsum() - df["Reservations"] / 2
+    totals = df.groupby("Chain", as_index=False)["Reservations"].sum()
+    x = alt.X("Chain:N", title="Chain ID", axis=alt.Axis(labelAngle=-45))
+    bars = alt.Chart(df, title="Top 3 month with the most reservation by chain").mark_bar().encode(
+        x=x,
+        y=alt.Y("Reservations:Q", title="Reservations", stack="zero"),
+        color=alt.Color("Month:N", scale=alt.Scale(domain=all_months, range=list(month_colors.values()))),
+        order=alt.Order("Month Order:Q"),
+    )
+    labels = alt.Chart(df).mark_text().encode(x=x, y="Middle:Q", text="Reservations:Q")
+    sums = alt.Chart(totals).mark_text(baseline="bottom", dy=-2, fontWeight="bold").encode(x=x, y="Reservations:Q", text="Reservations:Q")
+    return bars + labels + sums
+
+def vega_handicap_rooms(df):
+    return vega_bar(df, "Room ID", "Reservations", "Handicap Room ID", "Reservations", "Top 5 handicap rooms that were reserved the most", ",.0f")
+
+def vega_least_unavailable(df):
+    return vega_bar(df, "Room ID", "Days Unavailable", "Room ID", "Days Unavailable", "Top 3 rooms that were the least time unavailable", ",.0f")
+
+def vega_credit_card_clients(df):
+    return vega_bar(df, "Full Name", "Credit Card Reservations", "Client Name", "Credit Card Reservations", "Top 5 clients under 30 years old that made the most reservation with a credit card", ",.0f", label_angle=45, y_max=5)
+
+def vega_highest_paid(df):
+    return vega_bar(df, "Employee Name", "Salary", "Employee Name", "Salary", "Top 3 highest paid regular employees", "$,.2f", label_angle=45)
+
+def vega_most_discounts(df):
+    return vega_bar(df, "Client ID", "Discounts", "Client ID", "Total Discounted Price", "Top 5 clients that received the most discounts", "$,.2f")
+
+def vega_room_types(df):
+    return vega_pie(df, "Total Reservations", "Room Type", "Total reservation percentage by room type", room_type_colors)
+
+def vega_least_guests(df):
+    return vega_bar(df, "Room ID", "Guest to Capacity Ratio", "Room ID", "Guest to Capacity Ratio", "Top 3 rooms that were reserved that had the least guest-to-capacity ratio", ",.2f", y_max=1)
+
+# Backend aggregation behind each global statistic
+global_statistic_endpoints = {
+    "Top 3 chains with the highest total revenue.": "/dataops/most/revenue",
+    "Total reservation percentage by payment method.": "/dataops/paymentmethod",
+    "Top 3 hotel chains with the least rooms.": "/dataops/least/rooms",
+    "Top 5 hotels with the most client capacity.": "/dataops/most/capacity",
+    "Top 10% of the hotels that had the most reservations.": "/dataops/most/reservation",
+    "Top 3 month with the most reservation by chain.": "/dataops/most/profitmonth",
+}
+
+# Route, label and value columns and the no-data message behind each local statistic
+local_statistic_endpoints = {
+    "Top 5 handicap rooms that were reserved the most.": ("/dataops/hotel/{hid}/handicaproom", "Room ID", "Reservations", "This hotel does not have any handicap rooms"),
+    "Top 3 rooms that were the least time unavailable.": ("/dataops/hotel/{hid}/leastreserve", "Room ID", "Days Unavailable", "This hotel does not have any rooms"),
+    "Top 5 clients under 30 years old that made the most reservation with a credit card.": ("/dataops/hotel/{hid}/mostcreditcard", "Full Name", "Credit Card Reservations", "This hotel does not have any clients"),
+    "Top 3 highest paid regular employees.": ("/dataops/hotel/{hid}/highestpaid", "Employee Name", "Salary", "This hotel does not have any regular employees"),
+    "Top 5 clients that received the most discounts.": ("/dataops/hotel/{hid}/mostdiscount", "Client ID", "Discounts", "This hotel does not have any reservations"),
+    "Total reservation percentage by room type.": ("/dataops/hotel/{hid}/roomtype", "Room Type", "Total Reservations", "This hotel does not have any reservations"),
+    "Top 3 rooms that were reserved that had the least guest-to-capacity ratio.": ("/dataops/hotel/{hid}/leastguests", "Room ID", "Guest to Capacity Ratio", "This hotel does not have any rooms"),
+}
+
+# What the user is told when the backend refuses a hotel's statistics
+local_access_messages = {
+    "The hotel's chain is not accessible to this employee": "As a supervisor, you do not have access to this hotel chain's statistics",
+    "User is not a regular employee of this hotel": "As a regular employee, you do not have access to this hotel's statistics",
+}
+
+# Both renderers of every statistic
+statistic_charts = {
+    "Top 3 chains with the highest total revenue.": (plot_chain_revenue, vega_chain_revenue),
+    "Total reservation percentage by payment method.": (plot_payment_methods, vega_payment_methods),
+    "Top 3 hotel chains with the least rooms.": (plot_least_rooms, vega_least_rooms),
+    "Top 5 hotels with the most client capacity.": (plot_most_capacity, vega_most_capacity),
+    "Top 10% of the hotels that had the most reservations.": (plot_most_reservations, vega_most_reservations),
+    "Top 3 month with the most reservation by chain.": (plot_reservations_by_month, vega_reservations_by_month),
+    "Top 5 handicap rooms that were reserved the most.": (plot_handicap_rooms, vega_handicap_rooms),
+    "Top 3 rooms that were the least time unavailable.": (plot_least_unavailable, vega_least_unavailable),
+    "Top 5 clients under 30 years old that made the most reservation with a credit card.": (plot_credit_card_clients, vega_credit_card_clients),
+    "Top 3 highest paid regular employees.": (plot_highest_paid, vega_highest_paid),
+    "Top 5 clients that received the most discounts.": (plot_most_discounts, vega_most_discounts),
+    "Total reservation percentage by room type.": (plot_room_types, vega_room_types),
+    "Top 3 rooms that were reserved that had the least guest-to-capacity ratio.": (plot_least_guests, vega_least_guests),
+}
+
+@st.cache_resource
+def get_chart_cache(max_bytes):
+    return LRUCache(maxsize=max_bytes, getsizeof=len), threading.Lock()
+
+def data_fingerprint(querydata):
+    return hashlib.sha1(json.dumps(querydata, sort_keys=True, default=str).encode()).hexdigest()
+
+def show_as_of(as_of):
+    st.caption("As of " + as_of.strftime("%b %d, %Y %I:%M:%S %p"))
+
+# Serve the chart's PNG from cache when the same statistic was already drawn for the same data
+def show_chart(statistic, hid, querydata, as_of):
+    plot, vega_chart = statistic_charts[statistic]
+    if chart_mode == "vega":
+        with perf_timer("DataFrame", statistic):
+            df = pd.DataFrame(querydata)
+        with perf_timer("Render", statistic):
+            st.altair_chart(vega_chart(df), use_container_width=True)
+        show_as_of(as_of)
+        return
+    cache, lock = get_chart_cache(chart_cache_bytes)
+    key = (statistic, st.session_state["eid"], hid, data_fingerprint(querydata))
+    with lock:
+        image = cache.get(key)
+    if image is not None:
+        record_perf("timings", {"Stage": "Render (cached)", "Item": statistic, "Time (ms)": 0.0})
+    if image is None:
+        with perf_timer("DataFrame", statistic):
+            df = pd.DataFrame(querydata)
+        try:
+            with perf_timer("Render", statistic):
+                image = get_figure_manager(figure_budget_bytes, figure_wait_seconds).render_png(plot, df)
+        except TimeoutError as error:
+            st.error(str(error))
+            return
+        with lock:
+            try:
+                cache[key] = image
+            except ValueError:
+                pass
+    st.image(image, use_column_width=True)
+    show_as_of(as_of)
+
+@st.cache_resource
+def get_statistic_cache(max_entries):
+    return LRUCache(maxsize=max_entries), threading.Lock(), set()
+
+# Ask the backend and keep the answer, unless it is one of the backend's refusal messages
+def refresh_statistic(endpoint, eid, hid, cache_state="miss"):
+    cache, lock, refreshing = get_statistic_cache(statistic_cache_entries)
+    key = (endpoint, eid, hid)
+    try:
+        response = api_post(endpoint.format(hid=hid), json={"eid" : eid}, cache=cache_state)
+        with perf_timer("JSON decode", endpoint.format(hid=hid)):
+            querydata = response.json()
+        entry = {"data": querydata, "fetched": time.monotonic(), "as_of": datetime.datetime.now()}
+        # Only successful answers with rows are cached; errors and messages are shown once and asked again next time
+        with lock:
+            if response.ok and isinstance(querydata, list):
+                cache[key] = entry
+            else:
+                cache.pop(key, None)
+        return entry
+    finally:
+        with lock:
+            refreshing.discard(key)
+
+# Statistics are served from cache; past their TTL the cached answer is still returned right away while
+# the pool fetches a fresh one, and only answers older than the stale limit make the user wait
+def fetch_statistic(endpoint, eid, hid=None):
+    cache, lock, refreshing = get_statistic_cache(statistic_cache_entries)
+    key = (endpoint, int(eid), hid)
+    with lock:
+        entry = cache.get(key)
+        age = time.monotonic() - entry["fetched"] if entry else None
+        revalidate = entry is not None and age > statistic_ttls.get(endpoint, statistic_ttl) and key not in refreshing
+        if revalidate:
+            refreshing.add(key)
+    if entry is None or age > statistic_stale_limit:
+        entry = refresh_statistic(*key)
+    else:
+        record_call("POST", endpoint.format(hid=hid), "cached", 0, 0, "stale" if revalidate else "hit")
+        if revalidate:
+            get_fetch_pool(fetch_workers).submit(run_with_ctx, get_script_run_ctx(), partial(refresh_statistic, *key, "revalidate"))
+    return entry["data"], entry["as_of"]
+
+# All global statistics on one page: every query starts at once and each panel is drawn as soon as its data arrives
+def show_global_dashboard():
+    pool = get_fetch_pool(fetch_workers)
+    ctx = get_script_run_ctx()
+    columns = st.columns(2)
+    panels = {}
+    futures = {}
+    for i, (statistic, endpoint) in enumerate(global_statistic_endpoints.items()):
+        panels[statistic] = columns[i % 2].empty()
+        panels[statistic].info("Loading: " + statistic.rstrip("."))
+        futures[pool.submit(run_with_ctx, ctx, partial(fetch_statistic, endpoint, st.session_state["eid"]))] = statistic
+    for future in as_completed(futures):
+        statistic = futures[future]
+        with panels[statistic].container():
+            # A failed fetch or chart only fails its own panel
+            try:
+                querydata, as_of = future.result()
+                if querydata == "Employee is not an Administrator":
+                    st.write("You are not an Administrator and therefore do not have access to view this statistic")
+                elif isinstance(querydata, str) or not querydata:
+                    st.warning("There is no data for: " + statistic.rstrip("."))
+                else:
+                    show_chart(statistic, None, querydata, as_of)
+            except Exception as error:
+                st.error("Could not load " + statistic.rstrip(".") + ": " + str(error))
+
+
+# Several hotels side by side: every hotel's query runs on the shared fetch pool and the answers are merged into one table and chart
+def show_hotel_comparison(statistic, hids):
+    endpoint, category, value, empty_message = local_statistic_endpoints[statistic]
+    lookup = derived_table("/dataops/hotel", "labels", partial(build_label_lookup, "/dataops/hotel"))
+    calls = {hid: partial(fetch_statistic, endpoint, st.session_state["eid"], hid) for hid in hids}
+    results, errors = fetch_all(**calls)
+    frames = []
+    oldest = None
+    for hid in hids:
+        hotel = lookup.get(hid, hid)
+        querydata, as_of = results.get(hid, (None, None))
+        if hid in errors:
+            st.error(hotel + ": could not load this hotel's statistics: " + str(errors[hid]))
+        elif isinstance(querydata, str) and querydata in local_access_messages:
+            st.warning(hotel + ": " + local_access_messages[querydata])
+        elif isinstance(querydata, str) or not querydata:
+            st.warning(hotel + ": " + empty_message)
+        else:
+            frames.append(pd.DataFrame(querydata).assign(Hotel=hotel))
+            oldest = min(oldest, as_of) if oldest else as_of
+    if not frames:
+        return
+    with perf_timer("DataFrame", "Hotel comparison"):
+        comparison = pd.concat(frames, ignore_index=True)
+    comparison = comparison[["Hotel"] + [column for column in comparison.columns if column != "Hotel"]]
+    chart = alt.Chart(comparison, title=statistic.rstrip(".")).mark_bar().encode(
+        x=alt.X(category + ":N", title=category, sort=None),
+        xOffset=alt.XOffset("Hotel:N"),
+        y=alt.Y(value + ":Q", title=value),
+        color=alt.Color("Hotel:N", title="Hotel"),
+        tooltip=["Hotel", category, value],
+    )
+    st.altair_chart(chart, use_container_width=True)
+    st.dataframe(comparison, use_container_width=True, hide_index=True)
+    show_as_of(oldest)
+
+
+# Banner and chain logos are resized and compressed once per process: the banner becomes a JPEG and the
+# logos a single PNG sprite, already at the size they are shown so Streamlit sends the bytes as they are
+@st.cache_resource
+def get_assets(banner_width, logo_width):
+    with Image.open("Hotel_Analytical_System_1.png") as source:
+        banner = source.convert("RGB").resize((banner_width, round(source.height * banner_width / source.width)), Image.LANCZOS)
+    banner_bytes = io.BytesIO()
+    banner.save(banner_bytes, "JPEG", quality=82, optimize=True, progressive=True)
+
+    logos = []
+    for path in chain_logos:
+        with Image.open(path) as source:
+            logos.append(source.convert("RGBA").resize((logo_width, round(source.height * logo_width / source.width)), Image.LANCZOS))
+    # Transparent gaps keep the spacing the separate images had
+    gap = 16
+    sprite = Image.new("RGBA", (logo_width, sum(logo.height for logo in logos) + gap * (len(logos) - 1)), (0, 0, 0, 0))
+    top = 0
+    for logo in logos:
+        sprite.paste(logo, (0, top))
+        top += logo.height + gap
+    sprite_bytes = io.BytesIO()
+    sprite.quantize(256, method=Image.FASTOCTREE).save(sprite_bytes, "PNG", optimize=True)
+    return banner_bytes.getvalue(), sprite_bytes.getvalue()
+
+def show_banner():
+    banner, _ = get_assets(banner_width, logo_width)
+    st.image(banner, use_column_width=True, output_format="JPEG")
+
+def show_chain_logos():
+    _, sprite = get_assets(banner_width, logo_width)
+    st.image(sprite, width=logo_width, output_format="PNG")
+
+
+# Backend calls, decoding and chart timings of this rerun
+def show_perf_overlay(container):
+    manager = get_figure_manager(figure_budget_bytes, figure_wait_seconds)
+    perf = st.session_state["perf"]
+    with container:
+        backend_ms = sum(call["Latency (ms)"] for call in perf["calls"])
+        st.metric("Rerun time", "%.0f ms" % ((time.perf_counter() - perf["started"]) * 1000))
+        st.caption("%d backend calls, %.0f ms waiting on the backend, %d live figures (%.1f MB)" % (
+            sum(call["Cache"] != "hit" and call["Cache"] != "stale" for call in perf["calls"]), backend_ms, manager.live_figures, manager.live_bytes / 2 ** 20))
+        if perf["calls"]:
+            st.dataframe(pd.DataFrame(perf["calls"]), hide_index=True, use_container_width=True)
+        if perf["timings"]:
+            st.dataframe(pd.DataFrame(perf["timings"]), hide_index=True, use_container_width=True)
+
+# st.experimental_fragment that also measures its own reruns. A fragment rerun cannot redraw the
+# sidebar, so it starts the numbers over and shows them at the end of the fragment instead
+def perf_fragment(func):
+    @wraps(func)
+    def run(*args, **kwargs):
+        if not perf_enabled or not get_script_run_ctx().fragment_ids_this_run:
+            return func(*args, **kwargs)
+        start_perf_run()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            show_perf_overlay(st.expander("Performance of this fragment rerun", expanded=True))
+    return st.experimental_fragment(run)
+
+
+# Sidebar login/logout box; typing or clicking in it only reruns the box
+@perf_fragment
+def auth_box():
+    if not st.session_state['user']:
+        st.subheader("Login Section")
+        username = st.text_input("User Name")
+        password = st.text_input("Password", type='password')
+        if st.session_state['logout']:
+            st.success("You have successfully logged out")
+            st.session_state['logout'] = False
+        if st.button("Login"):
+            if username and password:
+                data = api_get("/dataops/login/byusernamepassword",
+                    params = {
+                        "username" : username,
+                        "password" : password
+                        }
+                    ).json()         
+
+                if data == "Not Found":
+                    st.warning("The Username or Password is incorrect")
+                else:
+                    st.session_state['user'] = data["username"]
+                    st.session_state['password'] = data["password"]
+                    st.session_state['eid'] = data["eid"]
+                    st.session_state['login'] = True
+                    st.session_state['position'] = data["position"]
+                    st.rerun()
+            else:
+                st.warning("Please input a Username and Password")
+    else:
+        st.subheader("Logout Section")
+        if not st.session_state['login']:
+            st.warning("You are already logged in as {}".format(st.session_state["user"]))
+        if st.button("Logout"):
+            st.session_state['user'] = None
+            st.session_state['password'] = None
+            st.session_state['eid'] = None
+            st.session_state['logout'] = True
+            st.session_state['position'] = None
+            st.rerun()
+
+
+# Sidebar account creation box; filling it in only reruns the box
+@perf_fragment
+def create_account_box():
+    employee_ids = entity_ids("/dataops/employee", "eid")
+    st.subheader("Create Account Section")
+    eid = st.selectbox("Employee ID", employee_ids, index=None)
+    username = st.text_input("User Name")
+    password = st.text_input("Password", type='password')
+    if st.button("Create Account"):
+        if username and password and eid:
+            conflict = login_conflict(eid, username)
+            if conflict is None:
+                # The indexes can be stale, the backend has the final word
+                results, errors = fetch_all(
+                    account = partial(fetch_json, "/dataops/login/byemployeeid/" + str(eid)),
+                    login = partial(fetch_json, "/dataops/login/byusername", params = {"username" : username})
+                    )
+                show_fetch_errors(errors)
+                if results["account"] != "Not Found":
+                    conflict = "eid"
+                elif results["login"] != "Not Found":
+                    conflict = "username"
+            if conflict == "eid":
+                st.warning("There is already an account for this Employee ID")
+            elif conflict == "username":
+                st.warning("This username is already taken")
+            else:
+                api_post("/dataops/login", json={"eid" : int(eid), "username" : username, "password" : password}).json()
+                invalidate_table("/dataops/login")
+                st.success("Account was created successfully")
+
+        else:
+            st.warning("Please fill all the fields above")
+
+
+# Bulk Create from an uploaded CSV or Excel file, checked as a whole before anything is sent
+def show_import(entity):
+    st.header("")
+    st.caption("The file needs the columns: " + ", ".join(import_specs[entity][1]))
+    upload = st.file_uploader("Upload a CSV or Excel file", type=["csv", "xlsx"], key="import " + entity)
+    if upload is None:
+        return
+    if st.session_state.get("imported " + entity) == upload.file_id:
+        st.info("This file was imported, upload another file to import more")
+        return
+    try:
+        if upload.name.lower().endswith(".xlsx"):
+            frame = pd.read_excel(upload, dtype=str)
+        else:
+            frame = pd.read_csv(upload, dtype=str)
+    except Exception as error:
+        st.error("Could not read the file: " + str(error))
+        return
+    try:
+        valid, rejects = validate_import(entity, frame)
+    except ValueError as error:
+        st.warning(str(error))
+        return
+    st.write(str(len(valid)) + " rows are ready to import and " + str(len(rejects)) + " rows were rejected")
+    if entity == "Reserve" and len(valid):
+        st.write("The reservations are estimated at " + locale.currency(np.nansum(quote_reservations(valid["ruid"], valid["clid"])), grouping=True) + " in total, the backend sets the final prices")
+    if len(rejects):
+        st.dataframe(rejects, hide_index=True, use_container_width=True)
+    if len(valid) and st.button("Import " + str(len(valid)) + " rows", use_container_width=True):
+        failures = import_rows(entity, valid, st.progress(0.0, text="Sending rows"))
+        st.session_state["imported " + entity] = upload.file_id
+        st.success(str(len(valid) - len(failures)) + " rows were imported")
+        if failures:
+            st.warning(str(len(failures)) + " rows were turned down by the backend")
+            st.dataframe(pd.DataFrame({"Row": list(failures), "Reason": list(failures.values())}), hide_index=True, use_container_width=True)
+
+def show_records_page(label, endpoint, ids):
+    frame = browse_frame(entity_names[endpoint])
+    rows = frame[frame[entity_labels[endpoint][0]].isin([int(rid) for rid in ids])]
+    pages = max(1, -(-len(rows) // picker_page_size))
+    page = st.number_input("Page", min_value=1, max_value=pages, key=label + " page") if pages > 1 else 1
+    st.dataframe(rows.iloc[(page - 1) * picker_page_size:page * picker_page_size], hide_index=True, use_container_width=True)
+
+# Bulk Delete of several records of one table. Without cascade only the records nothing refers to are
+# deleted, with cascade everything that depends on them goes too
+def show_bulk_delete(entity):
+    endpoint = entity_endpoints[entity][0]
+    st.header("")
+    ids = ids_picker("Pick the " + entity + " records to delete", endpoint)
+    if not ids:
+        return
+    dependents, direct = delete_impact(endpoint, ids)
+    blocked = direct.index[direct.sum(axis=1) > 0] if len(direct.columns) else direct.index[:0]
+    cascade = len(blocked) > 0 and st.toggle("Also delete every record that depends on them", key="cascade delete")
+    if cascade:
+        records = dependents
+        st.write("This deletes " + ", ".join(str(len(records[table])) + " " + entity_names[table] + " records" for table in table_order if table in records))
+        for table in table_order:
+            if table in records and table != endpoint:
+                with st.expander(entity_names[table] + " records that go with them (" + str(len(records[table])) + ")"):
+                    show_records_page("cascade " + table, table, records[table])
+    else:
+        records = {endpoint: set(ids) - set(blocked)}
+        st.write(str(len(records[endpoint])) + " records can be deleted and " + str(len(blocked)) + " are kept because other records refer to them")
+        if len(blocked):
+            lookup = derived_table(endpoint, "labels", partial(build_label_lookup, endpoint))
+            counts = direct.loc[blocked]
+            counts.insert(0, entity, [lookup[rid] for rid in blocked])
+            st.dataframe(counts, hide_index=True, use_container_width=True)
+            for child, column in foreign_keys.get(endpoint, []):
+                children = children_by(child, column)
+                found = {rid for parent in blocked for rid in children.get(parent, ())}
+                if found:
+                    with st.expander(entity_names[child] + " records that refer to them (" + str(len(found)) + ")"):
+                        show_records_page("blocked " + child, child, found)
+    total = sum(len(found) for found in records.values())
+    if total and st.button("Delete " + str(total) + " records", use_container_width=True):
+        failures = delete_records(records, st.progress(0.0, text="Deleting records"))
+        st.success(str(total - len(failures)) + " records were deleted")
+        if failures:
+            st.warning(str(len(failures)) + " records were turned down by the backend, the records they depend on were kept")
+            st.dataframe(pd.DataFrame({"Table": [table for table, rid in failures], "ID": [rid for table, rid in failures], "Reason": list(failures.values())}), hide_index=True, use_container_width=True)
+
+# Sortable, searchable table of the entity picked on the Browse page, one page of rows at a time
+@perf_fragment
+def browse_form(selected_entity):
+    if not selected_entity:
+        return
+    st.header("")
+    frame = browse_frame(selected_entity)
+    search_col, sort_col, order_col = st.columns([2, 1, 1])
+    query = search_col.text_input("Search", key="browse search", placeholder="ID or text").strip().lower()
+    column = sort_col.selectbox("Sort by", list(frame.columns), key="browse sort " + selected_entity)
+    order = order_col.radio("Order", ["Ascending", "Descending"], horizontal=True, key="browse order")
+    rows = browse_order(selected_entity, column, order == "Descending")
+    if query:
+        rows = rows[browse_matches(frame, query)[rows]]
+    pages = max(1, -(-len(rows) // browse_page_rows))
+    # A new search or sort starts again from the first page
+    page = st.number_input("Page", min_value=1, max_value=pages, key=" ".join(["browse page", selected_entity, query, column, order])) if pages > 1 else 1
+    start = (page - 1) * browse_page_rows
+    st.caption("Rows " + str(min(start + 1, len(rows))) + " to " + str(min(start + browse_page_rows, len(rows))) + " of " + str(len(rows)))
+    dates = {name: st.column_config.DateColumn(format="YYYY-MM-DD") for name, kind in entity_kinds(selected_entity).items() if kind == "date"}
+    st.dataframe(frame.iloc[rows[start:start + browse_page_rows]], hide_index=True, use_container_width=True, column_config=dates)
+
+# Estimated price of the picked stay and client, shown while the rest of the form is filled in
+def show_quote(ruid, clid):
+    if not (ruid and clid):
+        return None
+    quote = quote_reservation(ruid, clid)
+    if quote is not None:
+        st.metric("Estimated total cost", locale.currency(quote, grouping=True), help="Estimated from cached data, the backend sets the price when the reservation is saved")
+    return quote
+
+# The backend's price is the one stored. It can differ from the estimate when the cached tables are out of date
+# or the backend prices stays differently
+def check_quote(quote, total_cost):
+    if quote is not None and round(quote, 2) != round(total_cost, 2):
+        st.info("The backend priced the reservation at " + locale.currency(total_cost, grouping=True) + " instead of the estimated " + locale.currency(quote, grouping=True))
+
+# Whole-table download of the entity picked on the Export page. The file is only handed to the download
+# button, which holds it until the next rerun, so no session keeps a copy of the table; exporting again
+# makes a new one
+@perf_fragment
+def export_form(selected_entity):
+    if not selected_entity:
+        return
+    st.header("")
+    file_format = st.radio("File format", ["CSV", "Parquet"], horizontal=True, key="export format")
+    if st.button("Export all " + selected_entity + " records", use_container_width=True):
+        try:
+            data, rows = export_table(selected_entity, file_format, st.progress(0.0, text="Exporting"))
+        except (requests.RequestException, ValueError) as error:
+            st.error("Could not export the records: " + str(error))
+            return
+        name = selected_entity.lower().replace(" ", "_") + (".parquet" if file_format == "Parquet" else ".csv")
+        mime = "application/vnd.apache.parquet" if file_format == "Parquet" else "text/csv"
+        st.download_button("Download " + name + " (" + str(rows) + " rows)", data, file_name=name, mime=mime, use_container_width=True)
+
+# The form of the entity picked on the Create page; its widgets only rerun the form. Typed fields are
+# batched in an st.form until Create is pressed, ID pickers stay outside it for their search and paging
+@perf_fragment
+def create_form(selected_entity):
+    if selected_entity and st.toggle("Import from a file", key="import mode"):
+        show_import(selected_entity)
+        return
+
+    if selected_entity == "Login":
+        st.header("")
+        eid = id_picker("Enter Employee ID", "/dataops/employee")
+        with st.form("create_login"):
+            usernamelogin = st.text_input("Enter Username")
+            passwordlogin = st.text_input("Password", type='password')
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if usernamelogin and passwordlogin and eid:
+                conflict = login_conflict(eid, usernamelogin)
+                if conflict is None:
+                    # The indexes can be stale, the backend has the final word
+                    results, errors = fetch_all(
+                        account = partial(fetch_json, "/dataops/login/byemployeeid/" + str(eid)),
+                        login = partial(fetch_json, "/dataops/login/byusername", params = {"username" : usernamelogin})
+                        )
+                    show_fetch_errors(errors)
+                    if results["account"] != "Not Found":
+                        conflict = "eid"
+                    elif results["login"] != "Not Found":
+                        conflict = "username"
+                if conflict == "eid":
+                    st.warning("There is already an account for this Employee ID")
+                elif conflict == "username":
+                    st.warning("This username is already taken")
+                else:
+                    api_post("/dataops/login", json={"eid" : int(eid), "username" : usernamelogin, "password" : passwordlogin}).json()
+                    invalidate_table("/dataops/login")
+                    st.success("Account was created successfully")
+            else:
+                st.warning("Please fill all the fields above")
+
+    if selected_entity == "Employee":
+        st.header("")
+        hid = id_picker("Enter Hotel ID", "/dataops/hotel")
+        with st.form("create_employee"):
+            fname = st.text_input("Enter First Name")
+            lname = st.text_input("Enter Last Name")
+            age = st.text_input("Enter Age")
+            position = st.radio("Choose a Position", {"Administrator","Regular","Supervisor"}, index=None)
+            salary = st.text_input("Enter Salary")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if hid and fname and lname and age and position and salary:
+                if is_int(age) and is_float(salary):
+                    api_post("/dataops/employee", json={"hid" : int(hid), "fname" : fname, "lname" : lname, "age" : int(age), "position" : position, "salary" : float(salary)}).json()
+                    invalidate_table("/dataops/employee")
+                    st.success("Employee was created successfully")
+                else:
+                    st.warning("The age must be a positive whole number and the salary must be a numerical value")
+            else:
+                st.warning("Please fill all the above fields")
+
+    if selected_entity == "Chain":
+        st.header("")
+        with st.form("create_chain"):
+            cname = st.text_input("Enter Chain Name")
+            springmkup = st.text_input("Enter Spring Markup Amount")
+            summermkup = st.text_input("Enter Summer Markup Amount")
+            wintermkup = st.text_input("Enter Winter Markup Amount")
+            fallmkup = st.text_input("Enter Fall Markup Amount")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if cname and springmkup and summermkup and wintermkup and fallmkup:
+                if is_float(springmkup) and is_float(summermkup) and is_float(wintermkup) and is_float(fallmkup):
+                    api_post("/dataops/chains", json={"cname" : cname, "springmkup" : float(springmkup), "summermkup" : float(summermkup), "wintermkup" : float(wintermkup), "fallmkup" : float(fallmkup)}).json()
+                    invalidate_table("/dataops/chains")
+                    st.success("Chain was created successfully")
+                else:
+                    st.warning("The spring, summer, fall and winter markups must be numerical values")
+            else:
+                st.warning("Please fill all the fields above")
+
+    if selected_entity == "Hotel":
+        st.header("")
+        chid = id_picker("Enter Chain ID", "/dataops/chains")
+        with st.form("create_hotel"):
+            hname = st.text_input("Enter Hotel Name")
+            hcity = st.text_input("Enter Hotel City")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if chid and hname and hcity:
+                api_post("/dataops/hotel", json={"chid" : chid, "hname" : hname, "hcity" : hcity}).json()
+                invalidate_table("/dataops/hotel")
+                st.success("Hotel was created successfully")
+            else:
+                st.warning("Please fill all the fields above")
+
+    if selected_entity == "Room Description":
+        st.header("")
+        # Outside the form so the room types and capacities follow the chosen name right away
+        rname = st.radio("Choose Room Name", list(room_constraints.keys()))
+        constraints = room_constraints.get(rname, {"capacity": set(), "types": set()})
+        with st.form("create_room_description"):
+            rtype = st.radio("Choose Room Type", constraints["types"])
+            capacity = st.radio("Choose Capacity Of Guests", constraints["capacity"])
+            ishandicap = st.radio("Choose Handicapped Accessibility", {False, True})
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            api_post("/dataops/roomdescription", json={"rname" : rname, "rtype" : rtype, "capacity" : capacity, "ishandicap" : ishandicap}).json()
+            invalidate_table("/dataops/roomdescription")
+            st.success("Room description was created successfully")
+
+    if selected_entity == "Client":
+        st.header("")
+        with st.form("create_client"):
+            fname = st.text_input("Enter First Name")
+            lname = st.text_input("Enter Last Name")
+            age = st.text_input("Enter Employee Age")
+            memberyear = st.text_input("Enter Member Year Amount")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if fname and lname and age and memberyear:
+                if is_int(age) and is_int(memberyear):
+                        api_post("/dataops/client", json={"fname" : fname, "lname" : lname, "age" : int(age), "memberyear" : int(memberyear)}).json()
+                        invalidate_table("/dataops/client")
+                        st.success("Client was created successfully")
+                else:
+                        st.warning("The age and member year must be integer values")
+            else:
+                st.warning("Please fill all the fields above")
+
+    if selected_entity == "Reserve":
+        st.header("")
+        # Load the tables behind both pickers in parallel
+        results, errors = fetch_all(
+            rooms_unavailable = partial(fetch_table, "/dataops/roomunavailable"),
+            clients = partial(fetch_table, "/dataops/client")
+            )
+        show_fetch_errors(errors)
+        ruid = id_picker("Enter Unavailable Room ID", "/dataops/roomunavailable")
+        clid = id_picker("Enter Client ID", "/dataops/client")
+        quote = show_quote(ruid, clid)
+        with st.form("create_reserve"):
+            payment = st.selectbox("Enter Payment Method", payment_methods, index=None)
+            guests = st.text_input("Enter Reservation Guests")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if ruid and clid and payment and guests:
+                if is_int(guests):
+                    conflict = reservation_conflict(ruid, clid, guests)
+                    total_cost = None
+                    if conflict is None:
+                        total_cost = api_get("/dataops/reserve/totalcost/" + str(ruid) + "/" + str(clid)).json()
+                    if conflict == "capacity":
+                        st.warning("The amount of guests is more than the room can hold")
+                    elif not total_cost:
+                        st.warning("There is already a reservation with the selected Client ID and the selected Room Unavailable ID")
+                    else:
+                        api_post("/dataops/reserve", json={"ruid" : ruid, "clid" : clid, "total_cost" : float(total_cost[0]["Total Cost"]), "payment" : payment, "guests" : guests}).json()
+                        invalidate_table("/dataops/reserve")
+                        st.success("Reservation was created successfully")
+                        check_quote(quote, float(total_cost[0]["Total Cost"]))
+                else:
+                    st.warning("The amount of guests must be a positive whole number")
+            else:
+                st.warning("Please fill all the fields above")
+
+
+    if selected_entity == "Room":
+        st.header("")
+        # Load the tables behind both pickers in parallel
+        results, errors = fetch_all(
+            hotels = partial(fetch_table, "/dataops/hotel"),
+            room_descriptions = partial(fetch_table, "/dataops/roomdescription")
+            )
+        show_fetch_errors(errors)
+        hid = id_picker("Enter Hotel ID", "/dataops/hotel")
+        rdid = id_picker("Enter Room Description ID", "/dataops/roomdescription")
+        with st.form("create_room"):
+            rprice = st.text_input("Enter Room Price")
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if hid and rdid and rprice:
+                if is_float(rprice):
+                    api_post("/dataops/room", json={"hid" : hid, "rdid" : rdid, "rprice" : float(rprice)}).json()
+                    invalidate_table("/dataops/room")
+                    st.success("Room was created successfully")
+                else:
+                    st.warning("The price must be a numerical value")
+            else:
+                st.warning("Please fill all the fields above")
+
+    if selected_entity == "Room Unavailable":
+        st.header("")
+        rid = id_picker("Enter Room ID", "/dataops/room")
+        with st.form("create_room_unavailable"):
+            dates = st.date_input("Enter the Reservation's Start and End Date", value=(datetime.datetime.now(), datetime.datetime.now() + datetime.timedelta(days=1)))   
+            submitted = st.form_submit_button("Create", use_container_width=True)
+
+        if submitted:
+            if rid:        
+                if len(dates) < 2:
+                    st.warning("Please select a start and end date for the reservation")
+                else:
+                    startdate = dates[0]
+                    enddate = dates[1]
+                    api_post("/dataops/roomunavailable", json={"rid" : rid, "startdate" : str(startdate), "enddate" : str(enddate)}).json()
+                    invalidate_table("/dataops/roomunavailable")
+                    st.success("Room Unavailable was created successfully")
+            else:
+                st.warning("Please fill all the fields above")
+
+
+# The form of the entity picked on the Update page; its widgets only rerun the form. Typed fields are
+# batched in an st.form until Update is pressed, ID pickers stay outside it for their search and paging
+@perf_fragment
+def update_form(selected_entity):
+
+    if selected_entity == "Login":
+        st.header("")
+        lid = id_picker("Enter Login ID", "/dataops/login")
+        if lid:
+            results, errors = fetch_all(
+                login = partial(fetch_json, "/dataops/login/" + lid),
+                employees = partial(fetch_table, "/dataops/employee")
+                )
+            show_fetch_errors(errors)
+            selected_login = results["login"]
+            curr_username = selected_login["username"]
+            curr_password = selected_login["password"]
+            curr_eid = selected_login["eid"]
+            eid = id_picker("Enter the new Employee ID", "/dataops/employee")
+            with st.form("update_login"):
+                username = st.text_input("Enter the new Username", value=curr_username)
+                password = st.text_input("Enter the new Password", value=curr_password, type='password')
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if lid and eid and username and password:
+                    conflict = login_conflict(eid, username, curr_eid)
+                    if conflict is None:
+                        # The indexes can be stale, the backend has the final word
+                        new_login_by_id = api_get("/dataops/login/byemployeeid/" + eid).json()
+                        if new_login_by_id != "Not Found" and new_login_by_id["eid"] != curr_eid:
+                            conflict = "eid"
+                        else:
+                            new_login_by_username = api_get("/dataops/login/byusername", 
+                                                                params = {
+                                                                    "username" : username
+                                                                }).json()
+                            if new_login_by_username != "Not Found" and new_login_by_username["eid"] != curr_eid:
+                                conflict = "username"
+                    if conflict == "eid":
+                        st.warning("The selected Employee ID is already being used")
+                    elif conflict == "username":
+                        st.warning("The selected Username is already being used")
+                    else:
+                        api_put("/dataops/login/" + lid, json={"lid" : lid, "eid" : eid, "username" : username, "password" : password}).json()
+                        invalidate_table("/dataops/login")
+                        st.success("The record was successfully updated")
+                else:
+                    st.warning("Please fill all the fields above")
+
+    if selected_entity == "Employee":
+        st.header("")
+        eid = id_picker("Enter Employee ID", "/dataops/employee")
+        if eid:
+            results, errors = fetch_all(
+                employee = partial(fetch_json, "/dataops/employee/" + eid),
+                hotels = partial(fetch_table, "/dataops/hotel")
+                )
+            show_fetch_errors(errors)
+            selected_employee = results["employee"]
+            curr_hid = selected_employee["hid"]
+            curr_fname = selected_employee["fname"]
+            curr_lname = selected_employee["lname"]
+            curr_age = selected_employee["age"]
+            curr_position = selected_employee["position"]
+            curr_salary = selected_employee["salary"]
+            hid = id_picker("Enter the new Hotel ID", "/dataops/hotel")
+            with st.form("update_employee"):
+                fname = st.text_input("Enter the new First Name", value=curr_fname)
+                lname = st.text_input("Enter the new Last Name", value=curr_lname)
+                age = st.text_input("Enter the new Age", value=curr_age)
+                if curr_position == "Regular":
+                    idx = 1
+                elif curr_position == "Administrator":
+                    idx = 0
+                else:
+                    idx = 2
+                position = st.radio("Choose a Position", ["Administrator","Regular","Supervisor"], index=idx)
+                salary = st.text_input("Enter the new Salary", value=curr_salary)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if hid and fname and lname and age and position and salary:
+                    if is_float(salary) and is_int(age):
+                        api_put("/dataops/employee/" + eid, json={"eid" : eid, "hid" : hid, "fname" : fname, "lname" : lname, "age" : age, "position" : position, "salary" : salary}).json()
+                        invalidate_table("/dataops/employee")
+                        st.success("The record was successfully updated")
+                    else:
+                        st.warning("The salary and age must be numerical values with the age being a positive whole number")
+                else:
+                    st.warning("Please fill all the fields above")
+
+    if selected_entity == "Chain":
+        st.header("")
+        chid = id_picker("Enter Chain ID", "/dataops/chains")
+        if chid:
+            selected_chain = api_get("/dataops/chains/" + chid).json()
+            curr_cname = selected_chain["cname"]
+            curr_springmkup = selected_chain["springmkup"]
+            curr_summermkup = selected_chain["summermkup"]
+            curr_fallmkup = selected_chain["fallmkup"]
+            curr_wintermkup = selected_chain["wintermkup"]
+            with st.form("update_chain"):
+                cname = st.text_input("Enter the new Chain Name", value=curr_cname)
+                springmkup = st.text_input("Enter the new Spring Markup", value=curr_springmkup)
+                summermkup = st.text_input("Enter the new Summer Markup", value=curr_summermkup)
+                fallmkup = st.text_input("Enter the new Fall Markup", value=curr_fallmkup)
+                wintermkup = st.text_input("Enter the new Winter Markup", value=curr_wintermkup)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if chid and cname and springmkup and summermkup and fallmkup and wintermkup:
+                    if is_float(springmkup) and is_float(summermkup) and is_float(wintermkup) and is_float(fallmkup):
+                        api_put("/dataops/chains/" + chid, json={"chid" : chid, "cname" : cname, "springmkup" : springmkup, "summermkup" : summermkup, "fallmkup" : fallmkup, "wintermkup" : wintermkup}).json()
+                        invalidate_table("/dataops/chains")
+                        st.success("The record was successfully updated")
+                    else:
+                        st.warning("The Spring, Summer, Fall and Winter Markups must be numerical values")
+                else:
+                    st.warning("Please fill all the above fields")
+
+    if selected_entity == "Reserve":
+        st.header("")
+        reid = id_picker("Enter Reservation ID", "/dataops/reserve")
+        if reid:
+            results, errors = fetch_all(
+                reservation = partial(fetch_json, "/dataops/reserve/" + reid),
+                clients = partial(fetch_table, "/dataops/client"),
+                rooms_unavailable = partial(fetch_table, "/dataops/roomunavailable")
+                )
+            show_fetch_errors(errors)
+            selected_reserve = results["reservation"]
+            curr_clid = selected_reserve["clid"]
+            curr_guests = selected_reserve["guests"]
+            curr_payment = selected_reserve["payment"]
+            curr_ruid = selected_reserve["ruid"]
+
+            if curr_payment == "cash":
+                idx = 0
+            elif curr_payment == "check":
+                idx = 1
+            elif curr_payment == "credit card":
+                idx = 2
+            elif curr_payment == "debit card":
+                idx = 3
+            else:
+                idx = 4
+
+            clid = id_picker("Enter the new Client ID", "/dataops/client")
+            ruid = id_picker("Enter the new Room Unavailable ID", "/dataops/roomunavailable")
+            quote = show_quote(ruid, clid)
+            with st.form("update_reserve"):
+                guests = st.text_input("Enter the new amount of Guests", value = curr_guests)
+                payment = st.selectbox("Enter the new Payment Method", payment_methods, index=idx)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if reid and clid and ruid and guests and payment:
+                    if is_int(guests):
+                        conflict = reservation_conflict(ruid, clid, guests, reid)
+                        total_cost = None
+                        if conflict is None:
+                            total_cost = api_get("/dataops/reserve/totalcost/" + str(ruid) + "/" + str(clid) + "/" + str(reid)).json()
+                        if conflict == "capacity":
+                            st.warning("The amount of guests is more than the room can hold")
+                        elif not total_cost:
+                            st.warning("There is already a reservation with the selected Client ID and the selected Room Unavailable ID")
+                        else:
+                            api_put("/dataops/reserve/" + str(reid), json={"reid" : reid, "ruid" : ruid, "clid" : clid, "total_cost" : float(total_cost[0]["Total Cost"]), "payment" : payment, "guests" : guests}).json()
+                            invalidate_table("/dataops/reserve")
+                            st.success("The record was successfully updated")
+                            check_quote(quote, float(total_cost[0]["Total Cost"]))
+                    else:
+                        st.warning("The amount of guests must be a positive whole number")
+                else:
+                    st.warning("Please fill all the above fields")
+
+    if selected_entity == "Client":
+        st.header("")
+        clid = id_picker("Enter Client ID", "/dataops/client")
+        if clid:
+            selected_client = api_get("/dataops/client/" + clid).json()
+            curr_fname = selected_client["fname"]
+            curr_lname = selected_client["lname"]
+            curr_age = selected_client["age"]
+            curr_memberyear = selected_client["memberyear"]
+            with st.form("update_client"):
+                fname = st.text_input("Enter the new First name", value = curr_fname)
+                lname = st.text_input("Enter the new Last Name", value = curr_lname)
+                age = st.text_input("Enter the new Age", value = curr_age)
+                memberyear = st.text_input("Enter the new Years of Membership", value = curr_memberyear)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if clid and fname and lname and age and memberyear:
+                    if is_int(age) and is_int(memberyear):
+                        api_put("/dataops/client/" + str(clid), json={"clid" : clid, "fname" : fname, "lname" : lname, "age" : int(age), "memberyear" : int(memberyear)}).json()
+                        invalidate_table("/dataops/client")
+                        st.success("The record was successfully updated")
+                    else:
+                        st.warning("The age and membership year must be positive whole numbers")
+                else:
+                    st.warning("Please fill all the above fields")
+
+    if selected_entity == "Room Unavailable":
+        st.header("")
+        ruid = id_picker("Enter Room Unavailable ID", "/dataops/roomunavailable")
+        if ruid:
+            results, errors = fetch_all(
+                room_unavailable = partial(fetch_json, "/dataops/roomunavailable/" + ruid),
+                rooms = partial(fetch_table, "/dataops/room")
+                )
+            show_fetch_errors(errors)
+            selected_room_unavailable = results["room_unavailable"]
+            curr_rid = selected_room_unavailable["rid"]
+            curr_startdate = selected_room_unavailable["startdate"]
+            curr_enddate = selected_room_unavailable["enddate"]
+            curr_startdate = datetime.datetime.strptime(curr_startdate, http_date_format)
+            curr_enddate = datetime.datetime.strptime(curr_enddate, http_date_format)
+            rid = id_picker("Enter the new Room ID", "/dataops/room")
+            with st.form("update_room_unavailable"):
+                dates = st.date_input("Enter the Reservation's Start and End Date", value=(curr_startdate, curr_enddate))
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if len(dates) == 2:
+                    startdate = dates[0]
+                    enddate = dates[1]
+                    if ruid and rid and startdate and enddate:
+                        api_put("/dataops/roomunavailable/" + str(ruid), json={"ruid" : ruid, "rid" : rid, "startdate" : str(startdate), "enddate" : str(enddate)}).json()
+                        invalidate_table("/dataops/roomunavailable")
+                        st.success("The record was successfully updated")
+                else:
+                    st.warning("Please select a start and end date for the reservation")
+
+    if selected_entity == "Room":
+        st.header("")
+        rid = id_picker("Enter the Room ID", "/dataops/room")
+        if rid:
+            results, errors = fetch_all(
+                room = partial(fetch_json, "/dataops/room/" + rid),
+                hotels = partial(fetch_table, "/dataops/hotel"),
+                room_descriptions = partial(fetch_table, "/dataops/roomdescription")
+                )
+            show_fetch_errors(errors)
+            selected_room = results["room"]
+            curr_hid = selected_room["hid"]
+            curr_rdid = selected_room["rdid"]
+            curr_rprice = selected_room["rprice"]
+            hid = id_picker("Enter the new Hotel ID", "/dataops/hotel")
+            rdid = id_picker("Enter the new Room Description ID", "/dataops/roomdescription")
+            with st.form("update_room"):
+                rprice = st.text_input("Enter the new Room Price", value=curr_rprice)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if rid and hid and rdid and rprice:
+                    if is_float(rprice):
+                        api_put("/dataops/room/" + str(rid), json={"rid" : rid, "hid" : hid, "rdid" : rdid, "rprice" : float(rprice)}).json()
+                        invalidate_table("/dataops/room")
+                        st.success("The record was successfully updated")
+                    else:
+                        st.warning("The room's price must be a positive numerical value")
+                else:
+                    st.warning("Please fill all the above fields")
+
+    if selected_entity == "Hotel":
+        st.header("")
+        hid = id_picker("Enter Hotel ID", "/dataops/hotel")
+        if hid:
+            results, errors = fetch_all(
+                hotel = partial(fetch_json, "/dataops/hotel/" + hid),
+                chains = partial(fetch_table, "/dataops/chains")
+                )
+            show_fetch_errors(errors)
+            selected_hotel = results["hotel"]
+            curr_chid = selected_hotel["chid"]
+            curr_hcity = selected_hotel["hcity"]
+            curr_hname = selected_hotel["hname"]
+
+            chid = id_picker("Enter the new Chain ID", "/dataops/chains")
+            with st.form("update_hotel"):
+                hcity = st.text_input("Enter the new Hotel City", value=curr_hcity)
+                hname = st.text_input("Enter the new Hotel Name", value=curr_hname)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if chid and hcity and hid and hname:
+                    api_put("/dataops/hotel/" + str(hid), json={"chid" : chid, "hcity" : hcity, "hid" : hid, "hname" : hname}).json()
+                    invalidate_table("/dataops/hotel")
+                    st.success("The record was successfully updated")
+                else:
+                    st.warning("Please fill all the fields above")
+
+    if selected_entity == "Room Description":
+        st.header("")
+        rdid = id_picker("Enter Room Description ID", "/dataops/roomdescription")
+        if rdid: 
+            selected_room_description = api_get("/dataops/roomdescription/" + rdid).json()
+            curr_capacity = selected_room_description["capacity"]
+            curr_ishandicap = selected_room_description["ishandicap"]
+            curr_rname = selected_room_description["rname"]
+            curr_rtype = selected_room_description["rtype"]
+
+            idx = list(room_constraints).index(curr_rname)
+            # Outside the form so the room types and capacities follow the chosen name right away
+            rname = st.radio("Choose Room Name", list(room_constraints.keys()), index=idx)
+            constraints = room_constraints.get(rname, {"capacity": set(), "types": set()})
+            with st.form("update_room_description"):
+                rtype = st.radio("Choose Room Type", constraints["types"], index=None)
+                capacity = st.radio("Choose Capacity Of Guests", constraints["capacity"],index=None)
+                ishandicap = st.radio("Choose Handicapped Accessibility", {False, True}, index=None)
+                submitted = st.form_submit_button("Update", use_container_width=True)
+
+            if submitted:
+                if capacity and (ishandicap == True or ishandicap == False) and rdid and rname and rtype:
+                    api_put("/dataops/roomdescription/" + str(rdid), json={"capacity" : capacity, "ishandicap" : ishandicap, "rdid" : rdid, "rname" : rname, "rtype" : rtype}).json()
+                    invalidate_table("/dataops/roomdescription")
+                    st.success("The record was successfully updated")
+                else:
+                    st.warning("Please fill all the fields above")
+
+
+# The form of the entity picked on the Delete page; its widgets only rerun the form
+@perf_fragment
+def delete_form(selected_entity):
+    if selected_entity and st.toggle("Delete several at once", key="bulk delete mode"):
+        show_bulk_delete(selected_entity)
+        return
+
+    if selected_entity == "Chain":
+        st.header("")
+        chid = id_picker("Enter Chain ID", "/dataops/chains")
+        if chid:
+            if st.button("Delete", use_container_width=True):
+                related_hotels = api_get("/dataops/hotel/bychid/" + str(chid)).json()
+                if related_hotels == "Not Found":
+                    api_delete("/dataops/chains/" + str(chid))
+                    invalidate_table("/dataops/chains")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is a hotel associated with this chain")
+                    st.subheader("Table of all hotels (hid) associated with this chain")
+                    st.dataframe(related_hotels, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Login":
+        st.header("")
+        lid = id_picker("Enter Login ID", "/dataops/login")
+        if lid:
+            if st.button("Delete", use_container_width=True):
+                api_delete("/dataops/login/" + str(lid))
+                invalidate_table("/dataops/login")
+                st.success("The record was successfully deleted")
+
+
+    if selected_entity == "Employee":
+        st.header("")
+        eid = id_picker("Enter Employee ID", "/dataops/employee")
+        if eid:
+            if st.button("Delete", use_container_width=True):
+                related_logins = api_get("/dataops/login/byemployeeid/" + str(eid)).json()
+                if related_logins == "Not Found":
+                    api_delete("/dataops/employee/" + str(eid))
+                    invalidate_table("/dataops/employee")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is a login associated with this employee")
+                    st.subheader("Table of all logins (lid) associated with this employee")
+                    st.dataframe(related_logins, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Reserve":
+        st.header("")
+        reid = id_picker("Enter Reservation ID", "/dataops/reserve")
+        if reid:
+            if st.button("Delete", use_container_width=True):
+                api_delete("/dataops/reserve/" + str(reid))
+                invalidate_table("/dataops/reserve")
+                st.success("The record was successfully deleted")
+
+    if selected_entity == "Room Unavailable":
+        st.header("")
+        ruid = id_picker("Enter Room Unavailable ID", "/dataops/roomunavailable")
+        if ruid:
+            if st.button("Delete", use_container_width=True):
+                related_reserves = api_get("/dataops/reserve/byruid/" + str(ruid)).json()
+                if related_reserves == "Not Found":
+                    api_delete("/dataops/roomunavailable/" + str(ruid))
+                    invalidate_table("/dataops/roomunavailable")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is a reservation associated with this unavailable room")
+                    st.subheader("Table of all reservations (reid) associated with this unavailable room")
+                    st.dataframe(related_reserves, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Room":
+        st.header("")
+        rid = id_picker("Enter the Room ID", "/dataops/room")
+        if rid:
+            if st.button("Delete", use_container_width=True):
+                related_roomunavailable = api_get("/dataops/roomunavailable/byrid/" + str(rid)).json()
+                if related_roomunavailable == "Not Found":
+                    api_delete("/dataops/room/" + str(rid))
+                    invalidate_table("/dataops/room")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is an unavailable room associated with this room")
+                    st.subheader("Table of all unavailable rooms (ruid) associated with this room")
+                    st.dataframe(related_roomunavailable, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Hotel":
+        st.header("")
+        hid = id_picker("Enter Hotel ID", "/dataops/hotel")
+        if hid:
+            if st.button("Delete", use_container_width=True):
+                results, errors = fetch_all(
+                    related_employees = partial(fetch_json, "/dataops/employee/byhid/" + str(hid)),
+                    related_rooms = partial(fetch_json, "/dataops/room/byhid/" + str(hid))
+                    )
+                show_fetch_errors(errors)
+                related_employees = results["related_employees"]
+                if related_employees == "Not Found":
+                    related_rooms = results["related_rooms"]
+                    if related_rooms == "Not Found":
+                        api_delete("/dataops/hotel/" + str(hid))
+                        invalidate_table("/dataops/hotel")
+                        st.success("The record was successfully deleted")
+                    else:
+                        st.warning("There is a room associated with this hotel")
+                        st.subheader("Table of all rooms (rid) associated with this hotel")
+                        st.dataframe(related_rooms, hide_index=True, use_container_width=True)
+                else:
+                    st.warning("There is an employee associated with this hotel")
+                    st.subheader("Table of all employees (eid) associated with this hotel")
+                    st.dataframe(related_employees, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Room Description":
+        st.header("")
+        rdid = id_picker("Enter Room Description ID", "/dataops/roomdescription")
+        if rdid: 
+            if st.button("Delete", use_container_width=True):
+                related_rooms = api_get("/dataops/room/byrdid/" + str(rdid)).json()
+                if related_rooms == "Not Found":
+                    api_delete("/dataops/roomdescription/" + str(rdid))
+                    invalidate_table("/dataops/roomdescription")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is a room associated with this description")
+                    st.subheader("Table of all rooms (rid) associated with this description")
+                    st.dataframe(related_rooms, hide_index=True, use_container_width=True)
+
+    if selected_entity == "Client":
+        st.header("")
+        clid = id_picker("Enter Client ID", "/dataops/client")
+        if clid:
+            if st.button("Delete", use_container_width=True):
+                related_reserves = api_get("/dataops/reserve/byclid/" + str(clid)).json()
+                if related_reserves == "Not Found" :
+                    api_delete("/dataops/client/" + str(clid))
+                    invalidate_table("/dataops/client")
+                    st.success("The record was successfully deleted")
+                else:
+                    st.warning("There is a reservation associated with this client")
+                    st.subheader("Table of all reservations (reid) associated with this client")
+                    st.dataframe(related_reserves, hide_index=True, use_container_width=True)
+
+
+# Global statistic picker and chart; picking another statistic only reruns the panel
+@perf_fragment
+def global_statistics_panel(statistics):
+    statistic_choice = st.selectbox("Global Statistics", statistics, index=None)
+    if st.session_state['user']:
+        if statistic_choice == "Top 3 chains with the highest total revenue.":
+            st.header("")
+            querydata, as_of = fetch_statistic("/dataops/most/revenue", st.session_state["eid"])
+
+            if querydata == "Employee is not an Administrator":
+                st.write("You are not an Administrator and therefore do not have access to view this statistic")
+            else:
+                show_chart(statistic_choice, None, querydata, as_of)
+
+
+        elif statistic_choice == "Total reservation percentage by payment method.":
+            st.header("")
+            st.header("")
+
+            querydata, as_of = fetch_statistic("/dataops/paymentmethod", st.session_state["eid"])
+            show_chart(statistic_choice, None, querydata, as_of)
+
+        elif statistic_choice == "Top 3 hotel chains with the least rooms.":
+            st.header("")
+            querydata, as_of = fetch_statistic("/dataops/least/rooms", st.session_state["eid"])
+            show_chart(statistic_choice, None, querydata, as_of)
+
+        elif statistic_choice == "Top 5 hotels with the most client capacity.":
+            st.header("")
+            querydata, as_of = fetch_statistic("/dataops/most/capacity", st.session_state["eid"])
+            show_chart(statistic_choice, None, querydata, as_of)
+
+        elif statistic_choice == "Top 10% of the hotels that had the most reservations.":
+            st.header("")
+            querydata, as_of = fetch_statistic("/dataops/most/reservation", st.session_state["eid"])
+            show_chart(statistic_choice, None, querydata, as_of)
+        elif statistic_choice == "Top 3 month with the most reservation by chain.":
+            st.header("")
+            querydata, as_of = fetch_statistic("/dataops/most/profitmonth", st.session_state["eid"])
+            show_chart(statistic_choice, None, querydata, as_of)
+
+
+# Local statistic picker, hotel picker and chart; only the panel reruns on changes
+@perf_fragment
+def local_statistics_panel(statistics):
+    statistic_choice = st.selectbox("Local Statistics", statistics, index=None)
+    compare = st.toggle("Compare hotels")
+    if statistic_choice and compare:
+        lookup = derived_table("/dataops/hotel", "labels", partial(build_label_lookup, "/dataops/hotel"))
+        selected_ids = st.multiselect("Hotel IDs", list(lookup), format_func=lookup.get, max_selections=compare_limit)
+        st.header("")
+        if selected_ids:
+            show_hotel_comparison(statistic_choice, selected_ids)
+    elif statistic_choice == "Top 5 handicap rooms that were reserved the most.":
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/handicaproom", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any handicap rooms")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+
+    elif statistic_choice == "Top 3 rooms that were the least time unavailable.":
+
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/leastreserve", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any rooms")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+    elif statistic_choice == "Top 5 clients under 30 years old that made the most reservation with a credit card.":
+
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/mostcreditcard", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any clients")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+
+    elif statistic_choice == "Top 3 highest paid regular employees.":
+
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/highestpaid", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any regular employees")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+    elif statistic_choice == "Top 5 clients that received the most discounts.":
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/mostdiscount", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any reservations")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+
+    elif statistic_choice == "Total reservation percentage by room type.":
+
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/roomtype", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any reservations")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+
+    elif statistic_choice == "Top 3 rooms that were reserved that had the least guest-to-capacity ratio.":
+
+        selected_id = id_picker("Hotel IDs", "/dataops/hotel")
+        st.header("")
+        if selected_id:
+            querydata, as_of = fetch_statistic("/dataops/hotel/{hid}/leastguests", st.session_state["eid"], selected_id)
+
+            if querydata == "The hotel's chain is not accessible to this employee":
+                st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
+            elif querydata == "User is not a regular employee of this hotel":
+                st.warning("As a regular employee, you do not have access to this hotel's statistics")
+            elif not querydata:
+                st.warning("This hotel does not have any rooms")
+            else:
+                show_chart(statistic_choice, selected_id, querydata, as_of)
+
 
 def main():
     if not st.session_state['user'] and st.session_state['first_time']:
@@ -98,18 +2814,6 @@ def main():
     else:
         create_entities = ["Reserve"]
 
-    entity_endpoints = {
-                "Login": ("/dataops/login", "lid"),
-                "Employee": ("/dataops/employee", "eid"),
-                "Chain": ("/dataops/chains", "chid"),
-                "Hotel": ("/dataops/hotel", "hid"),
-                "Room Description": ("/dataops/roomdescription", "rdid"),
-                "Client": ("/dataops/client", "clid"),
-                "Reserve": ("/dataops/reserve", "reid"),
-                "Room": ("/dataops/room", "rid"),
-                "Room Unavailable": ("/dataops/roomunavailable", "ruid"),
-            }
-    
     fade_in_style = """
         <style>
         @keyframes fadeIn {
@@ -125,7 +2829,7 @@ def main():
     st.markdown(fade_in_style, unsafe_allow_html=True)
 
     if choice == "Home":
-        st.image('Hotel_Analytical_System_1.png', use_column_width=True)
+        show_banner()
         st.markdown('<h2 class="fade-in">Welcome to our Hotel Analytical System!🏨</h2>', unsafe_allow_html=True)
         if st.session_state['user']:
             st.success('You are currently logged in.')
@@ -134,14 +2838,10 @@ def main():
 
         col1, col2 = st.columns([3, 1])  # Split page into two columns, ratio 3:1
 
-    # List of hotel photo paths
-        hotel_photos = ['Chain1.png', 'Chain2.png', 'Chain3.png', 'Chain4.png', 'Chain5.png']
-
     # Display hotel photos in the right column
         with col2:
             st.write("<h3 class='fade-in'>Our Biggest Users:</h3>", unsafe_allow_html=True)
-            for photo in hotel_photos:
-                st.image(photo, width=200, caption='')
+            show_chain_logos()
 
         about_text = """
     <div class="fade-in">
@@ -188,10 +2888,11 @@ def main():
         if st.session_state["position"] == "Administrator":            
             crud_choice = option_menu(
                     menu_title = None,
-                    options = ["Create", "Update", "Delete"],
-                    icons= ["pencil-square", "arrow-clockwise", "trash"],
+                    options = ["Create", "Update", "Delete", "Browse", "Export"],
+                    icons= ["pencil-square", "arrow-clockwise", "trash", "table", "download"],
                     orientation= "horizontal",
-                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},}
+                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},},
+                    key = "crud_menu"
                     )
         else:
             crud_choice = option_menu(
@@ -199,634 +2900,42 @@ def main():
                     options = ["Create"],
                     icons= ["pencil-square"],
                     orientation= "horizontal",
-                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},}
+                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},},
+                    key = "create_menu"
                     )
         st.sidebar.success("Logged in as " + st.session_state["position"])
         
         if crud_choice == "Create":
             selected_entity = st.selectbox("Select Entity to Create", create_entities, index=None)
-            if selected_entity == "Login":
-                st.header("")
-                employee_ids = requests.get(url + "/dataops/employee").json()
-                employee_ids = [employee["eid"] for employee in employee_ids if employee["eid"] != -1]
-                eid = st.selectbox("Enter Employee ID", employee_ids, index=None)
-                usernamelogin = st.text_input("Enter Username")
-                passwordlogin = st.text_input("Password", type='password')
-                
-                if st.button("Create", use_container_width=True):
-                    if usernamelogin and passwordlogin and eid:
-                        account = requests.get(url + "/dataops/login/byemployeeid/" + str(eid)).json()
-                        data = requests.get(url + "/dataops/login/byusername",
-                            params = {
-                                "username" : usernamelogin
-                                }
-                            ).json()
-                        if account != "Not Found":
-                            st.warning("There is already an account for this Employee ID")
-                        elif data != "Not Found":
-                            st.warning("This username is already taken")
-                        else:
-                            requests.post(url + "/dataops/login", json={"eid" : int(eid), "username" : usernamelogin, "password" : passwordlogin}).json()
-                            st.success("Account was created successfully")
-                    else:
-                        st.warning("Please fill all the fields above")
-
-            if selected_entity == "Employee":
-                st.header("")
-                hotel_ids = requests.get(url + "/dataops/hotel").json()
-                hotel_ids = [str(hotel["hid"]) for hotel in hotel_ids if hotel["hid"] != -1]
-                hid = st.selectbox("Enter Hotel ID", hotel_ids, index=None)
-                fname = st.text_input("Enter First Name")
-                lname = st.text_input("Enter Last Name")
-                age = st.text_input("Enter Age")
-                position = st.radio("Choose a Position", {"Administrator","Regular","Supervisor"}, index=None)
-                salary = st.text_input("Enter Salary")
-                
-                if st.button("Create", use_container_width=True):
-                    if hid and fname and lname and age and position and salary:
-                        if is_int(age) and is_float(salary):
-                            requests.post(url + "/dataops/employee", json={"hid" : int(hid), "fname" : fname, "lname" : lname, "age" : int(age), "position" : position, "salary" : float(salary)}).json()
-                            st.success("Employee was created successfully")
-                        else:
-                            st.warning("The age must be a positive whole number and the salary must be a numerical value")
-                    else:
-                        st.warning("Please fill all the above fields")
-
-            if selected_entity == "Chain":
-                st.header("")
-                cname = st.text_input("Enter Chain Name")
-                springmkup = st.text_input("Enter Spring Markup Amount")
-                summermkup = st.text_input("Enter Summer Markup Amount")
-                wintermkup = st.text_input("Enter Winter Markup Amount")
-                fallmkup = st.text_input("Enter Fall Markup Amount")
-                
-                if st.button("Create", use_container_width=True):
-                    if cname and springmkup and summermkup and wintermkup and fallmkup:
-                        if is_float(springmkup) and is_float(summermkup) and is_float(wintermkup) and is_float(fallmkup):
-                            requests.post(url + "/dataops/chains", json={"cname" : cname, "springmkup" : float(springmkup), "summermkup" : float(summermkup), "wintermkup" : float(wintermkup), "fallmkup" : float(fallmkup)}).json()
-                            st.success("Chain was created successfully")
-                        else:
-                            st.warning("The spring, summer, fall and winter markups must be numerical values")
-                    else:
-                        st.warning("Please fill all the fields above")
-
-            if selected_entity == "Hotel":
-                st.header("")
-                chain_ids = requests.get(url + "/dataops/chains").json()
-                chain_ids = [str(chain["chid"]) for chain in chain_ids if chain["chid"] != -1]
-                chid = st.selectbox("Enter Chain ID", chain_ids, index=None)
-                hname = st.text_input("Enter Hotel Name")
-                hcity = st.text_input("Enter Hotel City")
-                
-                if st.button("Create", use_container_width=True):
-                    if chid and hname and hcity:
-                        requests.post(url + "/dataops/hotel", json={"chid" : chid, "hname" : hname, "hcity" : hcity}).json()
-                        st.success("Hotel was created successfully")
-                    else:
-                        st.warning("Please fill all the fields above")
-
-            if selected_entity == "Room Description":
-                st.header("")
-                room_constraints = {
-                    "Standard": {"capacity": {1}, "types": {"Basic", "Premium"}},
-                    "Standard Queen": {"capacity": {1, 2}, "types": {"Basic", "Premium", "Deluxe"}},
-                    "Standard King": {"capacity": {2}, "types": {"Basic", "Premium", "Deluxe"}},
-                    "Double Queen": {"capacity": {4}, "types": {"Basic", "Premium", "Deluxe"}},
-                    "Double King": {"capacity": {4, 6}, "types": {"Basic", "Premium", "Deluxe", "Suite"}},
-                    "Triple King": {"capacity": {6}, "types": {"Deluxe", "Suite"}},
-                    "Executive Family": {"capacity": {4, 6, 8}, "types": {"Deluxe", "Suite"}},
-                    "Presidential": {"capacity": {4, 6, 8}, "types": {"Suite"}}
-                }
-                rname = st.radio("Choose Room Name", list(room_constraints.keys()))
-                constraints = room_constraints.get(rname, {"capacity": set(), "types": set()})
-                rtype = st.radio("Choose Room Type", constraints["types"])
-                capacity = st.radio("Choose Capacity Of Guests", constraints["capacity"])
-                ishandicap = st.radio("Choose Handicapped Accessibility", {False, True})
-                
-                if st.button("Create", use_container_width=True):
-                    requests.post(url + "/dataops/roomdescription", json={"rname" : rname, "rtype" : rtype, "capacity" : capacity, "ishandicap" : ishandicap}).json()
-                    st.success("Room description was created successfully")
-                    
-            if selected_entity == "Client":
-                st.header("")
-                fname = st.text_input("Enter First Name")
-                lname = st.text_input("Enter Last Name")
-                age = st.text_input("Enter Employee Age")
-                memberyear = st.text_input("Enter Member Year Amount")
-                
-                if st.button("Create", use_container_width=True):
-                    if fname and lname and age and memberyear:
-                        if is_int(age) and is_int(memberyear):
-                                requests.post(url + "/dataops/client", json={"fname" : fname, "lname" : lname, "age" : int(age), "memberyear" : int(memberyear)}).json()
-                                st.success("Client was created successfully")
-                        else:
-                                st.warning("The age and member year must be integer values")
-                    else:
-                        st.warning("Please fill all the fields above")
-
-            if selected_entity == "Reserve":
-                st.header("")
-                methods = ["cash", "check", "credit card", "debit card", "pear pay"]
-                clients = requests.get(url + "/dataops/client").json()
-                roomsunavailable = requests.get(url + "/dataops/roomunavailable").json()
-                roomunavailable_ids = [str(room["ruid"]) for room in roomsunavailable if room["ruid"] != -1]
-                client_ids = [str(client["clid"]) for client in clients if client["clid"] != -1]
-                ruid = st.selectbox("Enter Unavailable Room ID", roomunavailable_ids, index=None)
-                clid = st.selectbox("Enter Client ID", client_ids, index=None)
-                payment = st.selectbox("Enter Payment Method", methods, index=None)
-                guests = st.text_input("Enter Reservation Guests")
-                
-                if st.button("Create", use_container_width=True):
-                    if ruid and clid and payment and guests:
-                        if is_int(guests):
-                            total_cost = requests.get(url + "/dataops/reserve/totalcost/" + str(ruid) + "/" + str(clid)).json()
-                            if not total_cost:
-                                st.warning("There is already a reservation with the selected Client ID and the selected Room Unavailable ID")
-                            else:
-                                requests.post(url + "/dataops/reserve", json={"ruid" : ruid, "clid" : clid, "total_cost" : float(total_cost[0]["Total Cost"]), "payment" : payment, "guests" : guests}).json()
-                                st.success("Reservation was created successfully")
-                        else:
-                            st.warning("The amount of guests must be a positive whole number")
-                    else:
-                        st.warning("Please fill all the fields above")
-                        
-
-            if selected_entity == "Room":
-                st.header("")
-                hotel_ids = requests.get(url + "/dataops/hotel").json()
-                hotel_ids = [str(hotel["hid"]) for hotel in hotel_ids if hotel["hid"] != -1]
-                roomdescription_ids = requests.get(url + "/dataops/roomdescription").json()
-                roomdescription_ids = [str(roomdescription["rdid"]) for roomdescription in roomdescription_ids if roomdescription["rdid"] != -1]
-                hid = st.selectbox("Enter Hotel ID", hotel_ids, index=None)
-                rdid = st.selectbox("Enter Room Description ID", roomdescription_ids, index=None)
-                rprice = st.text_input("Enter Room Price")
-                
-                if st.button("Create", use_container_width=True):
-                    if hid and rdid and rprice:
-                        if is_float(rprice):
-                            requests.post(url + "/dataops/room", json={"hid" : hid, "rdid" : rdid, "rprice" : float(rprice)}).json()
-                            st.success("Room was created successfully")
-                        else:
-                            st.warning("The price must be a numerical value")
-                    else:
-                        st.warning("Please fill all the fields above")
-
-            if selected_entity == "Room Unavailable":
-                st.header("")
-                room_ids = requests.get(url + "/dataops/room").json()
-                room_ids = [str(room["rid"]) for room in room_ids if room["rid"] != -1]
-                rid = st.selectbox("Enter Room ID", room_ids, index=None)
-                dates = st.date_input("Enter the Reservation's Start and End Date", value=(datetime.datetime.now(), datetime.datetime.now() + datetime.timedelta(days=1)))   
-                
-                if st.button("Create", use_container_width=True):   
-                    if rid:        
-                        if len(dates) < 2:
-                            st.warning("Please select a start and end date for the reservation")
-                        else:
-                            startdate = dates[0]
-                            enddate = dates[1]
-                            requests.post(url + "/dataops/roomunavailable", json={"rid" : rid, "startdate" : str(startdate), "enddate" : str(enddate)}).json()
-                            st.success("Room Unavailable was created successfully")
-                    else:
-                        st.warning("Please fill all the fields above")
+            create_form(selected_entity)
                                 
         elif crud_choice == "Update":
             selected_entity = st.selectbox("Select Entity to Update", create_entities, index=None)
-            
-            if selected_entity == "Login":
-                st.header("")
-                logins = requests.get(url + "/dataops/login").json()
-                login_ids = [str(login["lid"]) for login in logins if login["lid"] != -1]
-                lid = st.selectbox("Enter Login ID", login_ids, index=None)
-                if lid:
-                    selected_login = requests.get(url + "/dataops/login/" + lid).json()
-                    employees = requests.get(url + "/dataops/employee").json()
-                    employee_ids = [str(employee["eid"]) for employee in employees if employee["eid"] != -1]
-                    curr_username = selected_login["username"]
-                    curr_password = selected_login["password"]
-                    curr_eid = selected_login["eid"]
-                    eid = st.selectbox("Enter the new Employee ID", employee_ids, index=None)
-                    username = st.text_input("Enter the new Username", value=curr_username)
-                    password = st.text_input("Enter the new Password", value=curr_password, type='password')
-                    
-                    if st.button("Update", use_container_width=True):
-                        if lid and eid and username and password:
-                            new_login_by_id = requests.get(url + "/dataops/login/byemployeeid/" + eid).json()
-                            if (new_login_by_id != "Not Found" and new_login_by_id["eid"] == curr_eid) or new_login_by_id == "Not Found":
-                                new_login_by_username = requests.get(url + "/dataops/login/byusername", 
-                                                                    params = {
-                                                                        "username" : username
-                                                                    }).json()
-                                if (new_login_by_username != "Not Found" and new_login_by_username["eid"] == curr_eid) or new_login_by_username == "Not Found":
-                                    requests.put(url + "/dataops/login/" + lid, json={"lid" : lid, "eid" : eid, "username" : username, "password" : password}).json()
-                                    st.success("The record was successfully updated")
-                                else:
-                                    st.warning("The selected Username is already being used")
-                            else:
-                                st.warning("The selected Employee ID is already being used")
-                        else:
-                            st.warning("Please fill all the fields above")
-                                
-            if selected_entity == "Employee":
-                st.header("")
-                employees = requests.get(url + "/dataops/employee").json()
-                employee_ids = [str(employee["eid"]) for employee in employees if employee["eid"] != -1]
-                eid = st.selectbox("Enter Employee ID", employee_ids, index=None)
-                if eid:
-                    selected_employee = requests.get(url + "/dataops/employee/" + eid).json()
-                    hotels = requests.get(url + "/dataops/hotel").json()
-                    hotel_ids = [str(hotel["hid"]) for hotel in hotels if hotel["hid"] != -1]
-                    curr_hid = selected_employee["hid"]
-                    curr_fname = selected_employee["fname"]
-                    curr_lname = selected_employee["lname"]
-                    curr_age = selected_employee["age"]
-                    curr_position = selected_employee["position"]
-                    curr_salary = selected_employee["salary"]
-                    hid = st.selectbox("Enter the new Hotel ID", hotel_ids, index=None)
-                    fname = st.text_input("Enter the new First Name", value=curr_fname)
-                    lname = st.text_input("Enter the new Last Name", value=curr_lname)
-                    age = st.text_input("Enter the new Age", value=curr_age)
-                    if curr_position == "Regular":
-                        idx = 1
-                    elif curr_position == "Administrator":
-                        idx = 0
-                    else:
-                        idx = 2
-                    position = st.radio("Choose a Position", ["Administrator","Regular","Supervisor"], index=idx)
-                    salary = st.text_input("Enter the new Salary", value=curr_salary)
-                    if st.button("Update", use_container_width=True):
-                        if hid and fname and lname and age and position and salary:
-                            if is_float(salary) and is_int(age):
-                                requests.put(url + "/dataops/employee/" + eid, json={"eid" : eid, "hid" : hid, "fname" : fname, "lname" : lname, "age" : age, "position" : position, "salary" : salary}).json()
-                                st.success("The record was successfully updated")
-                            else:
-                                st.warning("The salary and age must be numerical values with the age being a positive whole number")
-                        else:
-                            st.warning("Please fill all the fields above")
-                            
-            if selected_entity == "Chain":
-                st.header("")
-                chains = requests.get(url + "/dataops/chains").json()
-                chain_ids = [str(chain["chid"]) for chain in chains if chain["chid"] != -1]
-                chid = st.selectbox("Enter Chain ID", chain_ids, index=None)
-                if chid:
-                    selected_chain = requests.get(url + "/dataops/chains/" + chid).json()
-                    curr_cname = selected_chain["cname"]
-                    curr_springmkup = selected_chain["springmkup"]
-                    curr_summermkup = selected_chain["summermkup"]
-                    curr_fallmkup = selected_chain["fallmkup"]
-                    curr_wintermkup = selected_chain["wintermkup"]
-                    cname = st.text_input("Enter the new Chain Name", value=curr_cname)
-                    springmkup = st.text_input("Enter the new Spring Markup", value=curr_springmkup)
-                    summermkup = st.text_input("Enter the new Summer Markup", value=curr_summermkup)
-                    fallmkup = st.text_input("Enter the new Fall Markup", value=curr_fallmkup)
-                    wintermkup = st.text_input("Enter the new Winter Markup", value=curr_wintermkup)
-                    if st.button("Update", use_container_width=True):
-                        if chid and cname and springmkup and summermkup and fallmkup and wintermkup:
-                            if is_float(springmkup) and is_float(summermkup) and is_float(wintermkup) and is_float(fallmkup):
-                                requests.put(url + "/dataops/chains/" + chid, json={"chid" : chid, "cname" : cname, "springmkup" : springmkup, "summermkup" : summermkup, "fallmkup" : fallmkup, "wintermkup" : wintermkup}).json()
-                                st.success("The record was successfully updated")
-                            else:
-                                st.warning("The Spring, Summer, Fall and Winter Markups must be numerical values")
-                        else:
-                            st.warning("Please fill all the above fields")
-            
-            if selected_entity == "Reserve":
-                st.header("")
-                methods = ["cash", "check", "credit card", "debit card", "pear pay"]
-                reserves = requests.get(url + "/dataops/reserve").json()
-                reserve_ids = [str(reserve["reid"]) for reserve in reserves if reserve["reid"] != -1]
-                reid = st.selectbox("Enter Reservation ID", reserve_ids, index=None)
-                if reid:
-                    selected_reserve = requests.get(url+"/dataops/reserve/" + reid).json()
-                    clients = requests.get(url + "/dataops/client").json()
-                    client_ids = [str(client["clid"]) for client in clients if client["clid"] != -1]
-                    roomunavailables = requests.get(url + "/dataops/roomunavailable").json()
-                    roomunavailable_ids = [str(roomunavailable["ruid"]) for roomunavailable in roomunavailables if roomunavailable ["ruid"] != -1]
-                    curr_clid = selected_reserve["clid"]
-                    curr_guests = selected_reserve["guests"]
-                    curr_payment = selected_reserve["payment"]
-                    curr_ruid = selected_reserve["ruid"]
-                    
-                    if curr_payment == "cash":
-                        idx = 0
-                    elif curr_payment == "check":
-                        idx = 1
-                    elif curr_payment == "credit card":
-                        idx = 2
-                    elif curr_payment == "debit card":
-                        idx = 3
-                    else:
-                        idx = 4
-                        
-                    clid = st.selectbox("Enter the new Client ID", client_ids, index=None)
-                    ruid = st.selectbox("Enter the new Room Unavailable ID", roomunavailable_ids, index=None)
-                    guests = st.text_input("Enter the new amount of Guests", value = curr_guests)
-                    payment = st.selectbox("Enter the new Payment Method", methods, index=idx)
-                    if st.button("Update", use_container_width=True):
-                        if reid and clid and ruid and guests and payment:
-                            if is_int(guests):
-                                total_cost = requests.get(url + "/dataops/reserve/totalcost/" + str(ruid) + "/" + str(clid) + "/" + str(reid)).json()
-                                if not total_cost:
-                                    st.warning("There is already a reservation with the selected Client ID and the selected Room Unavailable ID")
-                                else:
-                                    requests.put(url + "/dataops/reserve/" + str(reid), json={"reid" : reid, "ruid" : ruid, "clid" : clid, "total_cost" : float(total_cost[0]["Total Cost"]), "payment" : payment, "guests" : guests}).json()
-                                    st.success("The record was successfully updated")
-                            else:
-                                st.warning("The amount of guests must be a positive whole number")
-                        else:
-                            st.warning("Please fill all the above fields")
-                            
-            if selected_entity == "Client":
-                st.header("")
-                clients = requests.get(url + "/dataops/client").json()
-                client_ids = [str(client["clid"]) for client in clients if client ["clid"] != -1]
-                clid = st.selectbox("Enter Client ID", client_ids, index=None)
-                if clid:
-                    selected_client = requests.get(url + "/dataops/client/" + clid).json()
-                    curr_fname = selected_client["fname"]
-                    curr_lname = selected_client["lname"]
-                    curr_age = selected_client["age"]
-                    curr_memberyear = selected_client["memberyear"]
-                    fname = st.text_input("Enter the new First name", value = curr_fname)
-                    lname = st.text_input("Enter the new Last Name", value = curr_lname)
-                    age = st.text_input("Enter the new Age", value = curr_age)
-                    memberyear = st.text_input("Enter the new Years of Membership", value = curr_memberyear)
-                    if st.button("Update", use_container_width=True):
-                        if clid and fname and lname and age and memberyear:
-                            if is_int(age) and is_int(memberyear):
-                                requests.put(url + "/dataops/client/" + str(clid), json={"clid" : clid, "fname" : fname, "lname" : lname, "age" : int(age), "memberyear" : int(memberyear)}).json()
-                                st.success("The record was successfully updated")
-                            else:
-                                st.warning("The age and membership year must be positive whole numbers")
-                        else:
-                            st.warning("Please fill all the above fields")
-            
-            if selected_entity == "Room Unavailable":
-                st.header("")
-                roomunavailables = requests.get(url + "/dataops/roomunavailable").json()
-                roomunavailable_ids = [str(roomunavailable["ruid"]) for roomunavailable in roomunavailables if roomunavailable["ruid"] != -1]
-                ruid = st.selectbox("Enter Room Unavailable ID", roomunavailable_ids, index = None)
-                if ruid:
-                    selected_room_unavailable = requests.get(url + "/dataops/roomunavailable/" + ruid).json()
-                    rooms = requests.get(url + "/dataops/room").json()
-                    room_ids = [str(room["rid"]) for room in rooms if room["rid"] != -1]
-                    curr_rid = selected_room_unavailable["rid"]
-                    curr_startdate = selected_room_unavailable["startdate"]
-                    curr_enddate = selected_room_unavailable["enddate"]
-                    date_format = "%a, %d %b %Y %H:%M:%S %Z"
-                    curr_startdate = datetime.datetime.strptime(curr_startdate, date_format)
-                    curr_enddate = datetime.datetime.strptime(curr_enddate, date_format)
-                    rid = st.selectbox("Enter the new Room ID", room_ids, index = None)
-                    dates = st.date_input("Enter the Reservation's Start and End Date", value=(curr_startdate, curr_enddate))
-                    if st.button("Update", use_container_width=True):
-                        if len(dates) == 2:
-                            startdate = dates[0]
-                            enddate = dates[1]
-                            if ruid and rid and startdate and enddate:
-                                requests.put(url + "/dataops/roomunavailable/" + str(ruid), json={"ruid" : ruid, "rid" : rid, "startdate" : str(startdate), "enddate" : str(enddate)}).json()
-                                st.success("The record was successfully updated")
-                        else:
-                            st.warning("Please select a start and end date for the reservation")
-            
-            if selected_entity == "Room":
-                st.header("")
-                rooms = requests.get(url + "/dataops/room").json()
-                room_ids = [str(room["rid"]) for room in rooms if room["rid"] != -1]
-                rid = st.selectbox("Enter the Room ID", room_ids, index = None)
-                if rid:
-                    selected_room = requests.get(url + "/dataops/room/" + rid).json()
-                    hotels = requests.get(url + "/dataops/hotel").json()
-                    hotel_ids = [str(hotel["hid"]) for hotel in hotels if hotel["hid"] != -1]
-                    roomdescriptions = requests.get(url + "/dataops/roomdescription").json()
-                    roomdescription_ids = [str(roomdescription["rdid"]) for roomdescription in roomdescriptions if roomdescription["rdid"] != -1]
-                    curr_hid = selected_room["hid"]
-                    curr_rdid = selected_room["rdid"]
-                    curr_rprice = selected_room["rprice"]
-                    hid = st.selectbox("Enter the new Hotel ID", hotel_ids, index=None)
-                    rdid = st.selectbox("Enter the new Room Description ID", roomdescription_ids, index=None)
-                    rprice = st.text_input("Enter the new Room Price", value=curr_rprice)
-                    if st.button("Update", use_container_width=True):
-                        if rid and hid and rdid and rprice:
-                            if is_float(rprice):
-                                requests.put(url + "/dataops/room/" + str(rid), json={"rid" : rid, "hid" : hid, "rdid" : rdid, "rprice" : float(rprice)}).json()
-                                st.success("The record was successfully updated")
-                            else:
-                                st.warning("The room's price must be a positive numerical value")
-                        else:
-                            st.warning("Please fill all the above fields")
-            
-            if selected_entity == "Hotel":
-                st.header("")
-                hotels = requests.get(url + "/dataops/hotel").json()
-                hotel_ids = [str(hotel["hid"]) for hotel in hotels if hotel["hid"] != -1]
-                hid = st.selectbox("Enter Hotel ID", hotel_ids, index=None)
-                if hid:
-                    selected_hotel = requests.get(url + "/dataops/hotel/" + hid).json()
-                    chains = requests.get(url + "/dataops/chains").json()
-                    chains_ids = [str(chain["chid"]) for chain in chains if chain["chid"] != -1]
-                    curr_chid = selected_hotel["chid"]
-                    curr_hcity = selected_hotel["hcity"]
-                    curr_hname = selected_hotel["hname"]
-
-                    chid = st.selectbox("Enter the new Chain ID", chains_ids, index=None)
-                    hcity = st.text_input("Enter the new Hotel City", value=curr_hcity)
-                    hname = st.text_input("Enter the new Hotel Name", value=curr_hname)
-                    if st.button("Update", use_container_width=True):
-                        if chid and hcity and hid and hname:
-                            requests.put(url + "/dataops/hotel/" + str(hid), json={"chid" : chid, "hcity" : hcity, "hid" : hid, "hname" : hname}).json()
-                            st.success("The record was successfully updated")
-                        else:
-                            st.warning("Please fill all the fields above")
-                            
-            if selected_entity == "Room Description":
-                st.header("")
-                roomdescriptions = requests.get(url + "/dataops/roomdescription").json()
-                roomdescription_ids = [str(roomdescription["rdid"]) for roomdescription in roomdescriptions if roomdescription["rdid"] != -1]
-                rdid = st.selectbox("Enter Room Description ID", roomdescription_ids, index=None)
-                if rdid: 
-                    selected_room_description = requests.get(url + "/dataops/roomdescription/" + rdid).json()
-                    curr_capacity = selected_room_description["capacity"]
-                    curr_ishandicap = selected_room_description["ishandicap"]
-                    curr_rname = selected_room_description["rname"]
-                    curr_rtype = selected_room_description["rtype"]
-                    
-                    room_constraints = {
-                        "Standard": {"capacity": {1}, "types": {"Basic", "Premium"}, "idx" : 0},
-                        "Standard Queen": {"capacity": {1, 2}, "types": {"Basic", "Premium", "Deluxe"}, "idx" : 1},
-                        "Standard King": {"capacity": {2}, "types": {"Basic", "Premium", "Deluxe"}, "idx" : 2},
-                        "Double Queen": {"capacity": {4}, "types": {"Basic", "Premium", "Deluxe"}, "idx" : 3},
-                        "Double King": {"capacity": {4, 6}, "types": {"Basic", "Premium", "Deluxe", "Suite"}, "idx" : 4},
-                        "Triple King": {"capacity": {6}, "types": {"Deluxe", "Suite"}, "idx" : 5},
-                        "Executive Family": {"capacity": {4, 6, 8}, "types": {"Deluxe", "Suite"}, "idx" : 6},
-                        "Presidential": {"capacity": {4, 6, 8}, "types": {"Suite"}, "idx" : 7}
-                    }
-                    
-                    idx = room_constraints[curr_rname]["idx"]
-                    rname = st.radio("Choose Room Name", list(room_constraints.keys()), index=idx)
-                    constraints = room_constraints.get(rname, {"capacity": set(), "types": set()})
-                    rtype = st.radio("Choose Room Type", constraints["types"], index=None)
-                    capacity = st.radio("Choose Capacity Of Guests", constraints["capacity"],index=None)
-                    ishandicap = st.radio("Choose Handicapped Accessibility", {False, True}, index=None)
-                    
-                    if st.button("Update", use_container_width=True):
-                        if capacity and (ishandicap == True or ishandicap == False) and rdid and rname and rtype:
-                            requests.put(url + "/dataops/roomdescription/" + str(rdid), json={"capacity" : capacity, "ishandicap" : ishandicap, "rdid" : rdid, "rname" : rname, "rtype" : rtype}).json()
-                            st.success("The record was successfully updated")
-                        else:
-                            st.warning("Please fill all the fields above")
+            update_form(selected_entity)
 
                     
         elif crud_choice == "Delete":
             selected_entity = st.selectbox("Select Entity to Delete", create_entities, index=None)
-            if selected_entity == "Chain":
-                st.header("")
-                chains = requests.get(url + "/dataops/chains").json()
-                chain_ids = [str(chain["chid"]) for chain in chains if chain["chid"] != -1]
-                chid = st.selectbox("Enter Chain ID", chain_ids, index=None)
-                if chid:
-                    if st.button("Delete", use_container_width=True):
-                        related_hotels = requests.get(url + "/dataops/hotel/bychid/" + str(chid)).json()
-                        if related_hotels == "Not Found":
-                            requests.delete(url + "/dataops/chains/" + str(chid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is a hotel associated with this chain")
-                            st.subheader("Table of all hotels (hid) associated with this chain")
-                            st.table(related_hotels)
-                            
-            if selected_entity == "Login":
-                st.header("")
-                logins = requests.get(url + "/dataops/login").json()
-                login_ids = [str(login["lid"]) for login in logins if login["lid"] != -1]
-                lid = st.selectbox("Enter Login ID", login_ids, index=None)
-                if lid:
-                    if st.button("Delete", use_container_width=True):
-                        requests.delete(url + "/dataops/login/" + str(lid))
-                        st.success("The record was successfully deleted")
-                        
-                        
-            if selected_entity == "Employee":
-                st.header("")
-                employees = requests.get(url + "/dataops/employee").json()
-                employee_ids = [str(employee["eid"]) for employee in employees if employee["eid"] != -1]
-                eid = st.selectbox("Enter Employee ID", employee_ids, index=None)
-                if eid:
-                    if st.button("Delete", use_container_width=True):
-                        related_logins = requests.get(url + "/dataops/login/byemployeeid/" + str(eid)).json()
-                        if related_logins == "Not Found":
-                            requests.delete(url + "/dataops/employee/" + str(eid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is a login associated with this employee")
-                            st.subheader("Table of all logins (lid) associated with this employee")
-                            st.table(related_logins)
-            
-            if selected_entity == "Reserve":
-                st.header("")
-                reserves = requests.get(url + "/dataops/reserve").json()
-                reserve_ids = [str(reserve["reid"]) for reserve in reserves if reserve["reid"] != -1]
-                reid = st.selectbox("Enter Reservation ID", reserve_ids, index=None)
-                if reid:
-                    if st.button("Delete", use_container_width=True):
-                        requests.delete(url + "/dataops/reserve/" + str(reid))
-                        st.success("The record was successfully deleted")
-            
-            if selected_entity == "Room Unavailable":
-                st.header("")
-                roomunavailables = requests.get(url + "/dataops/roomunavailable").json()
-                roomunavailable_ids = [str(roomunavailable["ruid"]) for roomunavailable in roomunavailables if roomunavailable["ruid"] != -1]
-                ruid = st.selectbox("Enter Room Unavailable ID", roomunavailable_ids, index = None)
-                if ruid:
-                    if st.button("Delete", use_container_width=True):
-                        related_reserves = requests.get(url + "/dataops/reserve/byruid/" + str(ruid)).json()
-                        if related_reserves == "Not Found":
-                            requests.delete(url + "/dataops/roomunavailable/" + str(ruid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is a reservation associated with this unavailable room")
-                            st.subheader("Table of all reservations (reid) associated with this unavailable room")
-                            st.table(related_reserves)
-                            
-            if selected_entity == "Room":
-                st.header("")
-                rooms = requests.get(url + "/dataops/room").json()
-                room_ids = [str(room["rid"]) for room in rooms if room["rid"] != -1]
-                rid = st.selectbox("Enter the Room ID", room_ids, index = None)
-                if rid:
-                    if st.button("Delete", use_container_width=True):
-                        related_roomunavailable = requests.get(url + "/dataops/roomunavailable/byrid/" + str(rid)).json()
-                        if related_roomunavailable == "Not Found":
-                            requests.delete(url + "/dataops/room/" + str(rid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is an unavailable room associated with this room")
-                            st.subheader("Table of all unavailable rooms (ruid) associated with this room")
-                            st.table(related_roomunavailable)
-                            
-            if selected_entity == "Hotel":
-                st.header("")
-                hotels = requests.get(url + "/dataops/hotel").json()
-                hotel_ids = [str(hotel["hid"]) for hotel in hotels if hotel["hid"] != -1]
-                hid = st.selectbox("Enter Hotel ID", hotel_ids, index=None)
-                if hid:
-                    if st.button("Delete", use_container_width=True):
-                        related_employees = requests.get(url + "/dataops/employee/byhid/" + str(hid)).json()
-                        if related_employees == "Not Found":
-                            related_rooms = requests.get(url + "/dataops/room/byhid/" + str(hid)).json()
-                            if related_rooms == "Not Found":
-                                requests.delete(url + "/dataops/hotel/" + str(hid))
-                                st.success("The record was successfully deleted")
-                            else:
-                                st.warning("There is a room associated with this hotel")
-                                st.subheader("Table of all rooms (rid) associated with this hotel")
-                                st.table(related_rooms)
-                        else:
-                            st.warning("There is an employee associated with this hotel")
-                            st.subheader("Table of all employees (eid) associated with this hotel")
-                            st.table(related_employees)
-            
-            if selected_entity == "Room Description":
-                st.header("")
-                roomdescriptions = requests.get(url + "/dataops/roomdescription").json()
-                roomdescription_ids = [str(roomdescription["rdid"]) for roomdescription in roomdescriptions if roomdescription["rdid"] != -1]
-                rdid = st.selectbox("Enter Room Description ID", roomdescription_ids, index=None)
-                if rdid: 
-                    if st.button("Delete", use_container_width=True):
-                        related_rooms = requests.get(url + "/dataops/room/byrdid/" + str(rdid)).json()
-                        if related_rooms == "Not Found":
-                            requests.delete(url + "/dataops/roomdescription/" + str(rdid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is a room associated with this description")
-                            st.subheader("Table of all rooms (rid) associated with this description")
-                            st.table(related_rooms)
-            
-            if selected_entity == "Client":
-                st.header("")
-                clients = requests.get(url + "/dataops/client").json()
-                client_ids = [str(client["clid"]) for client in clients if client ["clid"] != -1]
-                clid = st.selectbox("Enter Client ID", client_ids, index=None)
-                if clid:
-                    if st.button("Delete", use_container_width=True):
-                        related_reserves = requests.get(url + "/dataops/reserve/byclid/" + str(clid)).json()
-                        if related_reserves == "Not Found" :
-                            requests.delete(url + "/dataops/client/" + str(clid))
-                            st.success("The record was successfully deleted")
-                        else:
-                            st.warning("There is a reservation associated with this client")
-                            st.subheader("Table of all reservations (reid) associated with this client")
-                            st.table(related_reserves)
+            delete_form(selected_entity)
+
+        elif crud_choice == "Browse":
+            selected_entity = st.selectbox("Select Entity to Browse", create_entities, index=None)
+            browse_form(selected_entity)
+
+        elif crud_choice == "Export":
+            selected_entity = st.selectbox("Select Entity to Export", create_entities, index=None)
+            export_form(selected_entity)
                             
 #-------------------------------------------------------------------------------------------------#
     elif choice == "Statistics":
         if st.session_state["position"] == "Administrator":
             statistic_choice = option_menu(
                     menu_title = None,
-                    options = ["Global Statistics", "Local Statistics"],
-                    icons= ["globe-americas", "bar-chart"],
+                    options = ["Global Statistics", "Global Dashboard", "Local Statistics"],
+                    icons= ["globe-americas", "grid-1x2", "bar-chart"],
                     orientation= "horizontal",
-                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},}
+                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},},
+                    key = "statistics_menu"
                     )
         else: 
             statistic_choice = option_menu(
@@ -834,585 +2943,24 @@ def main():
                     options = ["Local Statistics"],
                     icons= ["bar-chart"],
                     orientation= "horizontal",
-                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},}
+                    styles={"nav-link-selected": {"background-color": "SlateGrey"},"nav-link": {"font-size": "25px", "margin":"0px", "--hover-color": "LightGray"},},
+                    key = "local_statistics_menu"
                     )
         st.sidebar.success("Logged in as " + st.session_state["position"])
         if st.session_state['login']:
             st.sidebar.success("Logged in as {}".format(st.session_state['user']))
             st.session_state['login'] = False
+        if statistic_choice == "Global Dashboard" and st.session_state['user']:
+            show_global_dashboard()
         if statistic_choice == "Global Statistics":
-            statistic_choice = st.selectbox("Global Statistics", global_administrator, index=None)
-        if st.session_state['user']:
-            if statistic_choice == "Top 3 chains with the highest total revenue.":
-                st.header("")
-                querydata = requests.post(url + "/dataops/most/revenue", json={"eid" : int(st.session_state["eid"])}).json()
-                
-                if querydata == "Employee is not an Administrator":
-                    st.write("You are not an Administrator and therefore do not have access to view this statistic")
-                else:
-                    df = pd.DataFrame(querydata)
-
-                    # Plotting the bar chart using matplotlib
-                    # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                    fig, ax = plt.subplots(figsize=(10, 4))
-                    # plt.gca().set_facecolor('#D3D3D3')
-                    bars = df.plot(kind='bar', x='Chain', y='Revenue', ax=ax, legend=False, color="#151C62", figsize= (9,3.5))
-
-                    # Rotate the x-axis labels
-                    plt.xticks(rotation=0, ha='center')
-
-                    # Set axis labels and title
-                    plt.xlabel('Chains')
-                    plt.ylabel('Revenue Earned')
-                    plt.title('Top 3 chains with the highest total revenue')
-                    
-                    # Set the y-axis tick labels to use locale currency format
-                    formatter = ticker.ScalarFormatter(useLocale=True)
-                    ax.yaxis.set_major_formatter(formatter)
-
-                    # Format the y-axis tick labels using locale currency format
-                    for tick in ax.get_yticklabels():
-                        tick.set_text(locale.currency(float(tick.get_text()), grouping=True))
-                    
-                    # Annotate each bar with its value
-                    for bar in bars.patches:
-                        height = bar.get_height()
-                        ax.annotate(locale.currency(height, grouping=True),
-                                    xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
-                                    xytext=(0, -1),  # 3 points vertical offset
-                                    textcoords="offset points",
-                                    ha='center', va='bottom', fontweight='bold', color='white')
-                                        # Set pandas option
-                    pd.options.display.float_format = '{:.2f}'.format
-               
-                    # Show the plot
-                    plt.ticklabel_format(axis="y", style="plain")
-                    st.pyplot(fig, use_container_width=True)
-
-                
-            elif statistic_choice == "Total reservation percentage by payment method.":
-                st.header("")
-                st.header("")
-                
-                querydata = requests.post(url + "/dataops/paymentmethod", json={"eid" : int(st.session_state["eid"])}).json()
-                df = pd.DataFrame(querydata)
-
-                # Plotting the pie chart using matplotlib
-                fig, ax = plt.subplots(figsize= (10,4))
-                colors = ['#5abf6e', '#bf5a5a', '#5a5fbf', '#bfad5a', '#a35abf']
-                # Create the pie chart
-                wedges, texts, autotexts = ax.pie(df['Reservation Percentage'], autopct='%1.1f%%', colors=colors,)
-
-                # Add legend
-                ax.legend(wedges, df['Payment Method'], title='Payment Method', loc='center left', bbox_to_anchor=(1, 0, 0.5, 1))
-
-                # Adjust layout
-                plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-                # Set title
-                plt.title('Total reservation percentage by payment method')
-                
-                # Show the plot
-                # plt.ticklabel_format(axis="y", style="plain")
-                st.pyplot(fig, use_container_width=True,)
-                
-            elif statistic_choice == "Top 3 hotel chains with the least rooms.":
-                st.header("")
-                querydata = requests.post(url + "/dataops/least/rooms", json={"eid" : int(st.session_state["eid"])}).json()
-                df = pd.DataFrame(querydata)
-
-                # Plotting the bar chart using matplotlib
-                # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                fig, ax = plt.subplots(figsize=(15,3))
-                # plt.gca().set_facecolor('#D3D3D3')
-                bars = df.plot(kind='bar', x='Chain', y='Rooms Available', ax=ax, legend=False, color="#151C62")
-
-                # Rotate the x-axis labels
-                plt.xticks(rotation=45, ha='right')
-
-                # Set axis labels and title
-                plt.xlabel('Chain')
-                plt.ylabel('Number of Rooms Available')
-                plt.title('Top 3 hotel chains with the least rooms')
-                
-                # Annotate each bar with its value
-                for bar in bars.patches:
-                    height = bar.get_height()
-                    ax.annotate(f'{height:.0f}',
-                                xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
-                                xytext=(0, -1),  # 3 points vertical offset
-                                textcoords="offset points",
-                                ha='center', va='bottom', fontweight='bold', color = 'white')
-                
-                # Show the plot
-                # plt.ticklabel_format(axis="y", style="plain")
-                st.pyplot(fig, use_container_width=True)
-                
-            elif statistic_choice == "Top 5 hotels with the most client capacity.":
-                st.header("")
-                querydata = requests.post(url + "/dataops/most/capacity", json={"eid" : int(st.session_state["eid"])}).json()
-                df = pd.DataFrame(querydata)
-
-                # Plotting the bar chart using matplotlib
-                # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                fig, ax = plt.subplots(figsize=(12, 4))
-                # plt.gca().set_facecolor('#D3D3D3')
-                bars = df.plot(kind='bar', x='Hotel', y='Capacity', ax=ax, legend=False, color="#151C62")
-
-                # Rotate the x-axis labels
-                plt.xticks(rotation=45, ha='right')
-
-                # Set axis labels and title
-                plt.xlabel('Hotel')
-                plt.ylabel('Client Capacity')
-                plt.title('Top 5 hotels with the most client capacity')
-                
-                # Annotate each bar with its value
-                for bar in bars.patches:
-                    height = bar.get_height()
-                    ax.annotate(f'{height:.0f}',
-                                xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
-                                xytext=(0, -1),  # 3 points vertical offset
-                                textcoords="offset points",
-                                ha='center', va='bottom', fontweight='bold', color='white')
-                
-                # Show the plot
-                # plt.ticklabel_format(axis="y", style="plain")
-                st.pyplot(fig, use_container_width=True)
-                
-            elif statistic_choice == "Top 10% of the hotels that had the most reservations.":
-                st.header("")
-                querydata = requests.post(url + "/dataops/most/reservation", json={"eid" : int(st.session_state["eid"])}).json()
-                df = pd.DataFrame(querydata)
-
-                # Plotting the bar chart using matplotlib
-                # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                fig, ax = plt.subplots(figsize=(11, 4))
-                # plt.gca().set_facecolor('#D3D3D3')
-                bars = df.plot(kind='bar', x='Hotel', y='Reservations', ax=ax, legend=False, color="#151C62")
-
-                # Rotate the x-axis labels
-                plt.xticks(rotation=45, ha='right')
-
-                # Set axis labels and title
-                plt.xlabel('Hotel')
-                plt.ylabel('Reservations')
-                plt.title('Top 10% of the hotels that had the most reservations')
-                
-                # Format y-axis tick labels with commas
-                ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
-                
-                # Annotate each bar with its value
-                for bar in bars.patches:
-                    height = bar.get_height()
-                    ax.annotate(f'{height:,.0f}',
-                                xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
-                                xytext=(0, -1),  # 3 points vertical offset
-                                textcoords="offset points",
-                                ha='center', va='bottom', fontweight='bold', color='white')
-                
-                # Show the plot
-                # plt.ticklabel_format(axis="y", style="plain")
-                st.pyplot(fig, use_container_width=True)
-            elif statistic_choice == "Top 3 month with the most reservation by chain.":
-                st.header("")
-                querydata = requests.post(url + "/dataops/most/profitmonth", json={"eid" : int(st.session_state["eid"])}).json()
-                df = pd.DataFrame(querydata)
-                
-                # Pivot the DataFrame to have chains as rows and months as columns
-                pivot_df = df.pivot(index='Chain', columns='Month', values='Reservations')
-
-                # Create a dummy DataFrame containing all 12 months
-                all_months = ['January', 'February', 'March', 'April', 'May', 'June', 
-                            'July', 'August', 'September', 'October', 'November', 'December']
-                
-                # Define colors for each month
-                color_map = {
-                    'January': '#5abf6e',
-                    'February': '#ff5c69',
-                    'March': '#5a5fbf',
-                    'April': '#bfad5a',
-                    'May': '#a35abf',
-                    'June': '#ff99f1',
-                    'July': '#706f70',
-                    'August': '#c7c7f0',
-                    'September': '#69f5c6',
-                    'October': '#e09753',
-                    'November': '#e6e856',
-                    'December': '#7bb0d1'
-                }
-
-                dummy_df = pd.DataFrame(columns=all_months, index=pivot_df.index).infer_objects(copy=False).fillna(0)
-
-                # Concatenate the actual data with the dummy DataFrame
-                concat_df = pd.concat([pivot_df, dummy_df], axis=1).infer_objects(copy=False).fillna(0)
-
-                # Remove duplicate columns (if any)
-                concat_df = concat_df.loc[:,~concat_df.columns.duplicated()]
-
-                # Sort the columns in the concatenated DataFrame
-                concat_df = concat_df.reindex(all_months, axis=1)
-
-                # Plotting the stacked bar chart
-                fig, ax = plt.subplots(figsize=(10, 5))
-                concat_df.plot(kind='bar', stacked=True, ax=ax, color=[color_map[col] for col in concat_df.columns])
-
-                # Set axis labels and title
-                plt.xlabel('Chain ID')
-                plt.ylabel('Reservations')
-                plt.title('Top 3 month with the most reservation by chain')
-
-                # Rotate the x-axis labels
-                plt.xticks(rotation=45, ha='right')
-
-                # Annotate each bar with its value
-                for i, chain in enumerate(concat_df.index):
-                    sum_of_values = int(concat_df.loc[chain].sum())
-                    for month in concat_df.columns:
-                        value = int(concat_df.loc[chain, month])
-                        if value:
-                            x_pos = i
-                            y_pos = concat_df.loc[chain, :month].sum() - value / 2
-                            
-                            # Add a light gray background patch
-                            ax.add_patch(plt.Rectangle((x_pos-0.15, y_pos - 10), 0.3, 20, color='lightgray', alpha=0.5, zorder=1))
-                            
-                            # Add the annotation text
-                            ax.text(x_pos, y_pos, str(value), ha='center', va='center')
-                            
-                    # Add the annotation text for sum of values
-                    ax.text(x_pos, sum_of_values, str(sum_of_values), ha='center', va='bottom', fontweight='bold')
-                
-                # Create the legend with all 12 months
-                plt.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
-
-                # Show the plot
-                st.pyplot(fig, use_container_width=True)
+            global_statistics_panel(global_administrator)
                 
         if statistic_choice == "Local Statistics" and st.session_state['user']:
-            # Get all hotel IDs except -1
-            hotel_ids = requests.get(url + "/dataops/hotel").json()
-            hotel_ids = [str(hotel["hid"]) for hotel in hotel_ids if hotel["hid"] != -1]
-            
-            statistic_choice = st.selectbox("Local Statistics", local_administrator, index=None)
-            if statistic_choice == "Top 5 handicap rooms that were reserved the most.":
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/handicaproom", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any handicap rooms")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Room ID', y='Reservations', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=0, ha='center')
-
-                        # Set axis labels and title
-                        plt.xlabel('Handicap Room ID')
-                        plt.ylabel('Reservations')
-                        plt.title('Top 5 handicap rooms that were reserved the most')
-                        
-                        # Format y-axis tick labels with commas
-                        ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
-                        
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(f'{height:,.0f}',
-                                        xy=(bar.get_x() + bar.get_width() / 2, height-(height*.10)),
-                                        xytext=(0, -1),  # 3 points vertical offset
-                                        textcoords="offset points",
-                                        ha='center', va='bottom', fontweight='bold',color="white")
-                        
-                        # Show the plot
-                        # plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
-                    
-            elif statistic_choice == "Top 3 rooms that were the least time unavailable.":
-                
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/leastreserve", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any rooms")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Room ID', y='Days Unavailable', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=0, ha='center')
-
-                        # Set axis labels and title
-                        plt.xlabel('Room ID')
-                        plt.ylabel('Days Unavailable')
-                        plt.title('Top 3 rooms that were the least time unavailable')
-                        
-                        # Format y-axis tick labels with commas
-                        ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
-                        
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(f'{height:,.0f}',
-                                        xy=(bar.get_x() + bar.get_width() / 2, height - (height*.10)),
-                                        xytext=(0, -1),  # 3 points vertical offset
-                                        textcoords="offset points",
-                                        ha='center', va='bottom', fontweight='bold',color='white')
-                        
-                        # Show the plot
-                        # plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
-            elif statistic_choice == "Top 5 clients under 30 years old that made the most reservation with a credit card.":
-                
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/mostcreditcard", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any clients")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(6, 4))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Full Name', y='Credit Card Reservations', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=45, ha='right')
-
-                        # Set axis labels and title
-                        plt.xlabel('Client Name')
-                        plt.ylabel('Credit Card Reservations')
-                        plt.title('Top 5 clients under 30 years old that made the most reservation with a credit card')
-                        
-                        ax.set_ylim(top=5)
-                        # Format y-axis tick labels with commas
-                        ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,}'.format(int(x))))
-                        
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(f'{height:,.0f}',
-                                        xy=(bar.get_x() + bar.get_width() / 2, height - (height*.30)),
-                                        xytext=(0, -1),  # 3 points vertical offset
-                                        textcoords="offset points",
-                                        ha='center', va='bottom', fontweight='bold', color='white')
-                        
-                        # Show the plot
-                        # plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
-                        
-            elif statistic_choice == "Top 3 highest paid regular employees.":
-                
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/highestpaid", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any regular employees")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Employee Name', y='Salary', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=45, ha='right')
-
-                        # Set axis labels and title
-                        plt.xlabel('Employee Name')
-                        plt.ylabel('Salary')
-                        plt.title('Top 3 highest paid regular employees')
-                        
-                        # Set the y-axis tick labels to use locale currency format
-                        formatter = ticker.ScalarFormatter(useLocale=True)
-                        ax.yaxis.set_major_formatter(formatter)
-
-                        # Format the y-axis tick labels using locale currency format
-                        for tick in ax.get_yticklabels():
-                            tick_value = float(tick.get_text().replace(',', ''))
-                            # Format the tick label as currency
-                            tick.set_text(locale.currency(tick_value, grouping=True))
-                    
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(locale.currency(height, grouping=True),
-                                    xy=(bar.get_x() + bar.get_width() / 2, height - (height*.10)),
-                                    xytext=(0, -1),  # 3 points vertical offset
-                                    textcoords="offset points",
-                                    ha='center', va='bottom', fontweight='bold', color='white')
-                        
-                        # Show the plot
-                        plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
-            elif statistic_choice == "Top 5 clients that received the most discounts.":
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/mostdiscount", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any reservations")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Client ID', y='Discounts', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=0, ha='center')
-
-                        # Set axis labels and title
-                        plt.xlabel('Client ID')
-                        plt.ylabel('Total Discounted Price')
-                        plt.title('Top 5 clients that received the most discounts')
-                        
-                        # Set the y-axis tick labels to use locale currency format
-                        formatter = ticker.ScalarFormatter(useLocale=True)
-                        ax.yaxis.set_major_formatter(formatter)
-
-                        # Format the y-axis tick labels using locale currency format
-                        for tick in ax.get_yticklabels():
-                            tick_value = float(tick.get_text().replace(',', ''))
-                            # Format the tick label as currency
-                            tick.set_text(locale.currency(tick_value, grouping=True))
-                    
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(locale.currency(height, grouping=True),
-                                    xy=(bar.get_x() + bar.get_width() / 2, height - (height*0.1)),
-                                    xytext=(0, -1),  # 3 points vertical offset
-                                    textcoords="offset points",
-                                    ha='center', va='bottom', fontweight='bold', color='white')
-                        
-                        # Show the plot
-                        plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
-                        
-            elif statistic_choice == "Total reservation percentage by room type.":
-                
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/roomtype", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any reservations")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        
-                        
-                        # Plotting the pie chart using matplotlib
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        colors = ['#5abf6e', '#bf5a5a', '#5a5fbf', '#bfad5a']
-                        # Create the pie chart
-                        wedges, texts, autotexts = ax.pie(df['Total Reservations'], autopct='%1.1f%%', colors=colors)
-
-                        # Add legend
-                        ax.legend(wedges, df['Room Type'], title='Room Type', loc='center left', bbox_to_anchor=(1, 0, 0.5, 1))
-
-                        # Adjust layout
-                        plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-
-                        # Set title
-                        plt.title('Total reservation percentage by room type')
-
-                        # Show the plot
-                        st.pyplot(fig, use_container_width=True)
-
-            elif statistic_choice == "Top 3 rooms that were reserved that had the least guest-to-capacity ratio.":
-                
-                selected_id = st.selectbox("Hotel IDs", hotel_ids, index=None)
-                st.header("")
-                if selected_id:
-                    querydata = requests.post(url + "/dataops/hotel/" + selected_id + "/leastguests", json={"eid" : int(st.session_state["eid"])}).json()
-                    
-                    if querydata == "The hotel's chain is not accessible to this employee":
-                        st.warning("As a supervisor, you do not have access to this hotel chain's statistics")
-                    elif querydata == "User is not a regular employee of this hotel":
-                        st.warning("As a regular employee, you do not have access to this hotel's statistics")
-                    elif not querydata:
-                        st.warning("This hotel does not have any rooms")
-                    else:
-                        df = pd.DataFrame(querydata)
-                        # Plotting the bar chart using matplotlib
-                        # fig, ax = plt.subplots(figsize=(6, 4), facecolor='#D3D3D3')
-                        fig, ax = plt.subplots(figsize=(10, 3.5))
-                        # plt.gca().set_facecolor('#D3D3D3')
-                        bars = df.plot(kind='bar', x='Room ID', y='Guest to Capacity Ratio', ax=ax, legend=False, color="#151C62")
-
-                        # Rotate the x-axis labels
-                        plt.xticks(rotation=0, ha='center')
-
-                        # Set axis labels and title
-                        plt.xlabel('Room ID')
-                        plt.ylabel('Guest to Capacity Ratio')
-                        plt.title('Top 3 rooms that were reserved that had the least guest-to-capacity ratio')
-                        ax.set_ylim(top=1)
-                        # Format y-axis tick labels with commas
-                        ax.get_yaxis().set_major_formatter(ticker.FuncFormatter(lambda x, pos: '{:,.2f}'.format(float(x))))
-                        
-                        # Annotate each bar with its value
-                        for bar in bars.patches:
-                            height = bar.get_height()
-                            ax.annotate(f'{height:,.2f}',
-                                        xy=(bar.get_x() + bar.get_width() / 2, height - (height*.20)),
-                                        xytext=(0, -1),  # 3 points vertical offset
-                                        textcoords="offset points",
-                                        ha='center', va='bottom', fontweight='bold', color='white')
-                        
-                        # Show the plot
-                        # plt.ticklabel_format(axis="y", style="plain")
-                        st.pyplot(fig, use_container_width=True)
+            local_statistics_panel(local_administrator)
 #-------------------------------------------------------------------------------------------------#
 
     elif choice == "Login" or choice == "Logout":
-        st.image('Hotel_Analytical_System_1.png', use_column_width=True)
+        show_banner()
         st.markdown('<h2 class="fade-in">Welcome to our Hotel Analytical System!🏨</h2>', unsafe_allow_html=True)
         if st.session_state['user']:
             st.success('You are currently logged in.')
@@ -1421,14 +2969,10 @@ def main():
 
         col1, col2 = st.columns([3, 1])  # Split page into two columns, ratio 3:1
 
-    # List of hotel photo paths
-        hotel_photos = ['Chain1.png', 'Chain2.png', 'Chain3.png', 'Chain4.png', 'Chain5.png']
-
     # Display hotel photos in the right column
         with col2:
             st.write("<h3 class='fade-in'>Our Biggest Users:</h3>", unsafe_allow_html=True)
-            for photo in hotel_photos:
-                st.image(photo, width=200, caption='')
+            show_chain_logos()
 
         about_text = """
     <div class="fade-in">
@@ -1469,47 +3013,11 @@ def main():
             - **Step 3:** Follow the on-screen instructions to perform actions such as creating reservations, viewing statistics, and managing records.
             - **Step 4:** Enjoy the efficiency and convenience of our Hotel Reservation Management System!
             """)
-        if not st.session_state['user']:
-            st.sidebar.subheader("Login Section")
-            username = st.sidebar.text_input("User Name")
-            password = st.sidebar.text_input("Password", type='password')
-            if st.session_state['logout']:
-                st.sidebar.success("You have successfully logged out")
-                st.session_state['logout'] = False
-            if st.sidebar.button("Login"):
-                if username and password:
-                    data = requests.get(url + "/dataops/login/byusernamepassword",
-                        params = {
-                            "username" : username,
-                            "password" : password
-                            }
-                        ).json()         
-
-                    if data == "Not Found":
-                        st.sidebar.warning("The Username or Password is incorrect")
-                    else:
-                        st.session_state['user'] = data["username"]
-                        st.session_state['password'] = data["password"]
-                        st.session_state['eid'] = data["eid"]
-                        st.session_state['login'] = True
-                        st.session_state['position'] = data["position"]
-                        st.rerun()
-                else:
-                    st.sidebar.warning("Please input a Username and Password")
-        else:
-            st.sidebar.subheader("Logout Section")
-            if not st.session_state['login']:
-                st.sidebar.warning("You are already logged in as {}".format(st.session_state["user"]))
-            if st.sidebar.button("Logout"):
-                st.session_state['user'] = None
-                st.session_state['password'] = None
-                st.session_state['eid'] = None
-                st.session_state['logout'] = True
-                st.session_state['position'] = None
-                st.rerun()
+        with st.sidebar:
+            auth_box()
     
     elif choice == "Create Employee Account":
-        st.image('Hotel_Analytical_System_1.png', use_column_width=True)
+        show_banner()
         st.markdown('<h2 class="fade-in">Welcome to our Hotel Analytical System!🏨</h2>', unsafe_allow_html=True)
         if st.session_state['user']:
             st.success('You are currently logged in.')
@@ -1518,14 +3026,10 @@ def main():
 
         col1, col2 = st.columns([3, 1])  # Split page into two columns, ratio 3:1
 
-    # List of hotel photo paths
-        hotel_photos = ['Chain1.png', 'Chain2.png', 'Chain3.png', 'Chain4.png', 'Chain5.png']
-
     # Display hotel photos in the right column
         with col2:
             st.write("<h3 class='fade-in'>Our Biggest Users:</h3>", unsafe_allow_html=True)
-            for photo in hotel_photos:
-                st.image(photo, width=200, caption='')
+            show_chain_logos()
 
         about_text = """
     <div class="fade-in">
@@ -1566,33 +3070,15 @@ def main():
             - **Step 3:** Follow the on-screen instructions to perform actions such as creating reservations, viewing statistics, and managing records.
             - **Step 4:** Enjoy the efficiency and convenience of our Hotel Reservation Management System!
             """)
-        employee_ids = requests.get(url + "/dataops/employee").json()
-        employee_ids = [employee["eid"] for employee in employee_ids if employee["eid"] != -1]
-        st.sidebar.subheader("Create Account Section")
-        eid = st.sidebar.selectbox("Employee ID", employee_ids, index=None)
-        username = st.sidebar.text_input("User Name")
-        password = st.sidebar.text_input("Password", type='password')
-        if st.sidebar.button("Create Account"):
-            if username and password and eid:
-                account = requests.get(url + "/dataops/login/byemployeeid/" + str(eid)).json()
-                data = requests.get(url + "/dataops/login/byusername",
-                    params = {
-                        "username" : username
-                        }
-                    ).json()
-                if account != "Not Found":
-                    st.sidebar.warning("There is already an account for this Employee ID")
-                elif data != "Not Found":
-                    st.sidebar.warning("This username is already taken")
-                else:
-                    requests.post(url + "/dataops/login", json={"eid" : int(eid), "username" : username, "password" : password}).json()
-                    st.sidebar.success("Account was created successfully")
-                    
-            else:
-                st.sidebar.warning("Please fill all the fields above")
+        with st.sidebar:
+            create_account_box()
                     
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        if perf_enabled:
+            show_perf_overlay(st.sidebar.expander("Performance", expanded=True))
 
 #input_df = user_input_features()
 